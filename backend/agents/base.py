@@ -2,18 +2,29 @@
 Base Agent Interface for CataMaze
 """
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from backend.engine.actions import Action
 
 
 class Agent(ABC):
     """Base class for all agents"""
 
-    def __init__(self, entity_id: str, persona: Optional[str] = None):
+    def __init__(
+        self,
+        entity_id: str,
+        persona: Optional[str] = None,
+        rng: Optional[np.random.Generator] = None
+    ):
         self.entity_id = entity_id
         self.persona = persona
+        # Per-agent random stream (derive_rng(world.seed, ...) for replayable games)
+        self.rng = rng if rng is not None else np.random.default_rng()
 
     @abstractmethod
-    def decide_action(self, observation: dict) -> str:
+    def decide_action(self, observation: dict) -> Action:
         """
         Decide next action based on observation.
 
@@ -21,11 +32,31 @@ class Agent(ABC):
             observation: Current game observation for this agent
 
         Returns:
-            action: One of MOVE_UP, MOVE_DOWN, MOVE_LEFT, MOVE_RIGHT,
-                   SHOOT_UP, SHOOT_DOWN, SHOOT_LEFT, SHOOT_RIGHT, WAIT
+            action: Action code (MOVE_UP, MOVE_DOWN, MOVE_LEFT, MOVE_RIGHT,
+                   SHOOT_UP, SHOOT_DOWN, SHOOT_LEFT, SHOOT_RIGHT, WAIT)
         """
         pass
 
+    @classmethod
+    def decide_actions_batch(cls, agents: Sequence['Agent'], observations: Sequence[dict]) -> List[Action]:
+        """
+        Decide actions for several agents of this class in one call.
+        Subclasses can override this to share work across agents; by
+        default each agent decides on its own.
+
+        Args:
+            agents: Agents of this class
+            observations: Current observation of each agent
+
+        Returns:
+            Action of each agent, in order
+        """
+        return [agent.decide_action(obs) for agent, obs in zip(agents, observations)]
+
+    def set_rng(self, rng: np.random.Generator):
+        """Replace the agent's random stream (e.g. a fresh per-tick stream)."""
+        self.rng = rng
+
     def reset(self):
         """Reset agent state (optional)"""
         pass
@@ -2,17 +2,18 @@
 Human Agent - uses action queue
 """
 from backend.agents.base import Agent
+from backend.engine.actions import Action, WAIT
 
 
 class HumanAgent(Agent):
     """Human-controlled agent that uses action queue"""
 
-    def __init__(self, entity_id: str):
-        super().__init__(entity_id, persona="human")
+    def __init__(self, entity_id: str, rng=None):
+        super().__init__(entity_id, persona="human", rng=rng)
 
-    def decide_action(self, observation: dict) -> str:
+    def decide_action(self, observation: dict) -> Action:
         """
         Human agents don't use this method.
         Actions come from the player's action_queue.
         """
-        return "WAIT"
+        return WAIT
@@ -1,6 +1,27 @@
 """
 Agent Personas - behavior profiles for RL agents
 """
+import json
+import os
+import threading
+from typing import Dict
+
+# Persona config files (backend/personas/<name>.json), independent of the cwd
+PERSONA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "personas")
+
+# Used for personas without a config file
+DEFAULT_PERSONA_CONFIG = {
+    "behavior": {
+        "shoot_probability": 0.5,
+        "chase_probability": 0.5,
+        "explore_probability": 0.5,
+        "flee_probability": 0.3
+    }
+}
+
+# Persona configs loaded in this process, by persona name
+_CONFIG_CACHE: Dict[str, dict] = {}
+_LOCK = threading.Lock()
 
 PERSONAS = {
     "aggressive": {
@@ -34,3 +55,37 @@ def get_persona(name: str) -> dict:
 def list_personas() -> list:
     """List all available personas"""
     return list(PERSONAS.keys())
+
+
+def load_persona_config(persona: str) -> dict:
+    """
+    Persona config from backend/personas/<persona>.json, read once per
+    process (DEFAULT_PERSONA_CONFIG if there is no such file).
+
+    Args:
+        persona: Persona name
+
+    Returns:
+        Config dict (shared by all agents; do not mutate)
+    """
+    config = _CONFIG_CACHE.get(persona)
+    if config is not None:
+        return config
+
+    with _LOCK:
+        config = _CONFIG_CACHE.get(persona)
+        if config is None:
+            path = os.path.join(PERSONA_DIR, f"{persona}.json")
+            if os.path.exists(path):
+                with open(path, 'r') as f:
+                    config = json.load(f)
+            else:
+                config = DEFAULT_PERSONA_CONFIG
+            _CONFIG_CACHE[persona] = config
+    return config
+
+
+def clear_persona_configs():
+    """Forget loaded persona configs (they are re-read on next use)."""
+    with _LOCK:
+        _CONFIG_CACHE.clear()
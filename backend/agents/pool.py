@@ -0,0 +1,93 @@
+"""
+Per-game agent pools.
+A game's AI agents are created on its first tick and reused on later ones,
+so ticks don't rebuild agents and agents keep their state between ticks.
+"""
+import threading
+from collections import OrderedDict
+from typing import Dict
+
+from backend.agents.base import Agent
+from backend.agents.registry import create_agent
+from backend.engine.rng import derive_rng
+from backend.engine.state import WorldState
+
+# Pools kept in this process (least recently used games are dropped first)
+MAX_POOLS = 256
+
+
+class AgentPool:
+    """AI agents of one game, by entity id."""
+
+    def __init__(self, agent_type: str = "rl"):
+        """
+        Args:
+            agent_type: Registered agent type used for agent entities
+        """
+        self.agent_type = agent_type
+        self.agents: Dict[str, Agent] = {}
+
+    def agents_for(self, world: WorldState) -> Dict[str, Agent]:
+        """
+        Agents for the alive agent entities at the current tick.
+        Missing agents are created; agents of dead or removed entities are
+        dropped. Every agent gets a fresh random stream derived from
+        (seed, entity, tick), so a tick plays out the same whether its
+        agents were pooled or just created (e.g. after a restart).
+
+        Args:
+            world: Current world state
+
+        Returns:
+            Dict of entity_id -> agent (shared with the pool)
+        """
+        agents = {}
+        for entity_id, entity in world.entities.items():
+            if entity.entity_type != "agent" or not entity.alive:
+                continue
+            rng = derive_rng(world.seed, "agent", entity_id, world.tick)
+            agent = self.agents.get(entity_id)
+            if agent is None or agent.persona != entity.persona:
+                agent = create_agent(self.agent_type, entity_id, entity.persona, rng)
+            else:
+                agent.set_rng(rng)
+            agents[entity_id] = agent
+        self.agents = agents
+        return agents
+
+
+_POOLS: 'OrderedDict[str, AgentPool]' = OrderedDict()
+_LOCK = threading.Lock()
+
+
+def get_agent_pool(game_id: str) -> AgentPool:
+    """
+    The agent pool of a game, created on first use.
+
+    Args:
+        game_id: Game identifier
+
+    Returns:
+        AgentPool kept until the game is dropped or evicted
+    """
+    with _LOCK:
+        pool = _POOLS.get(game_id)
+        if pool is None:
+            pool = _POOLS[game_id] = AgentPool()
+            if len(_POOLS) > MAX_POOLS:
+                _POOLS.popitem(last=False)
+        else:
+            _POOLS.move_to_end(game_id)
+        return pool
+
+
+def drop_agent_pool(game_id: str):
+    """Forget a game's agents (e.g. when the game is over)."""
+    with _LOCK:
+        _POOLS.pop(game_id, None)
+
+
+def clear_agent_pools():
+    """Forget the agents of all games."""
+    with _LOCK:
+        _POOLS.clear()
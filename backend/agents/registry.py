@@ -2,6 +2,9 @@
 Agent Registry - register and load agents
 """
 from typing import Dict, Type, Optional
+
+import numpy as np
+
 from backend.agents.base import Agent
 from backend.agents.human import HumanAgent
 from backend.agents.rl.agent import RLAgent
@@ -19,7 +22,12 @@ def register_agent(name: str, agent_class: Type[Agent]):
     _AGENT_REGISTRY[name] = agent_class
 
 
-def create_agent(agent_type: str, entity_id: str, persona: Optional[str] = None) -> Agent:
+def create_agent(
+    agent_type: str,
+    entity_id: str,
+    persona: Optional[str] = None,
+    rng: Optional[np.random.Generator] = None
+) -> Agent:
     """
     Create an agent instance.
 
@@ -27,6 +35,7 @@ def create_agent(agent_type: str, entity_id: str, persona: Optional[str] = None)
         agent_type: Type of agent (e.g., "human", "rl", "random")
         entity_id: Unique ID for this agent
         persona: Optional persona (e.g., "aggressive", "cautious", "explorer")
+        rng: Optional random stream for the agent
 
     Returns:
         Agent instance
@@ -36,10 +45,11 @@ def create_agent(agent_type: str, entity_id: str, persona: Optional[str] = None)
 
     agent_class = _AGENT_REGISTRY[agent_type]
 
+    kwargs = {"rng": rng} if rng is not None else {}
     if persona:
-        return agent_class(entity_id, persona)
+        return agent_class(entity_id, persona, **kwargs)
     else:
-        return agent_class(entity_id)
+        return agent_class(entity_id, **kwargs)
 
 
 def list_agents() -> list:
@@ -3,7 +3,18 @@ Action Mask for RL Agent
 
 Determines which actions are valid in the current game state.
 """
-from typing import Dict, List
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+from backend.engine.actions import (
+    Action, ALL_ACTIONS, MOVE_ACTIONS, SHOOT_ACTIONS, DIRECTION_INDEX_FROM_ACTION, DIRECTION_VECTORS,
+    MOVE_UP, MOVE_DOWN, MOVE_RIGHT, MOVE_LEFT, WAIT
+)
+from backend.engine.observation import get_map_size
+
+# Move bit of each move action (bit d = direction d, see the map's move mask)
+_MOVE_BITS = np.array([DIRECTION_INDEX_FROM_ACTION[move] for move in MOVE_ACTIONS], dtype=np.uint8)
 
 
 class ActionMask:
@@ -12,19 +23,9 @@ class ActionMask:
     def __init__(self):
         """Initialize action mask generator"""
         # All possible actions
-        self.all_actions = [
-            "MOVE_UP",
-            "MOVE_DOWN",
-            "MOVE_LEFT",
-            "MOVE_RIGHT",
-            "SHOOT_UP",
-            "SHOOT_DOWN",
-            "SHOOT_LEFT",
-            "SHOOT_RIGHT",
-            "WAIT"
-        ]
+        self.all_actions = list(ALL_ACTIONS)
 
-    def get_valid_actions(self, observation: Dict) -> List[str]:
+    def get_valid_actions(self, observation: Dict) -> List[Action]:
         """
         Get list of valid actions for current state.
 
@@ -32,162 +33,88 @@ class ActionMask:
             observation: Current game observation
 
         Returns:
-            valid_actions: List of valid action strings
+            valid_actions: List of valid action codes
         """
-        valid_actions = []
-
-        # Extract state information
-        position = observation.get("position", {"x": 0, "y": 0})
-        vision = observation.get("vision", [])
-        ammo = observation.get("ammo", 0)
-        hp = observation.get("hp", 0)
-
         # Dead agents can't act
-        if hp <= 0:
-            return ["WAIT"]
+        if observation.get("hp", 0) <= 0:
+            return [WAIT]
 
         # Check movement actions
-        if self._can_move_north(position, vision):
-            valid_actions.append("MOVE_UP")
-
-        if self._can_move_south(position, vision):
-            valid_actions.append("MOVE_DOWN")
-
-        if self._can_move_east(position, vision):
-            valid_actions.append("MOVE_RIGHT")
-
-        if self._can_move_west(position, vision):
-            valid_actions.append("MOVE_LEFT")
+        bits = self.move_bits(observation)
+        valid_actions = [
+            move for move in (MOVE_UP, MOVE_DOWN, MOVE_RIGHT, MOVE_LEFT)
+            if bits >> DIRECTION_INDEX_FROM_ACTION[move] & 1
+        ]
 
         # Check shooting actions (need ammo)
-        if ammo > 0:
-            valid_actions.extend([
-                "SHOOT_UP",
-                "SHOOT_DOWN",
-                "SHOOT_LEFT",
-                "SHOOT_RIGHT"
-            ])
+        if observation.get("ammo", 0) > 0:
+            valid_actions.extend(SHOOT_ACTIONS)
 
         # Wait is always valid
-        valid_actions.append("WAIT")
+        valid_actions.append(WAIT)
 
         return valid_actions
 
-    def _can_move_north(self, position: Dict, vision: List[List[str]]) -> bool:
+    def move_bits(self, observation: Dict) -> int:
         """
-        Check if can move north.
+        4-bit move mask (bit d: a move in direction d succeeds).
+        Read from the observation's "move_mask" (the map's precomputed mask);
+        observations without it fall back to checking vision and map size.
 
         Args:
-            position: Current position
-            vision: 5x5 vision grid
-
-        Returns:
-            can_move: True if movement is valid
-        """
-        # Check map boundaries
-        y = position.get("y", 0)
-        if y <= 0:
-            return False
-
-        # Check vision grid (center is [2][2])
-        if vision and len(vision) >= 3 and len(vision[0]) >= 3:
-            # North is [1][2]
-            north_cell = vision[1][2]
-            if north_cell == '#':  # Wall
-                return False
-
-        return True
-
-    def _can_move_south(self, position: Dict, vision: List[List[str]]) -> bool:
-        """
-        Check if can move south.
-
-        Args:
-            position: Current position
-            vision: 5x5 vision grid
-
-        Returns:
-            can_move: True if movement is valid
-        """
-        # Check map boundaries
-        y = position.get("y", 0)
-        if y >= 49:  # Map is 50x50 (0-49)
-            return False
-
-        # Check vision grid
-        if vision and len(vision) >= 4 and len(vision[0]) >= 3:
-            # South is [3][2]
-            south_cell = vision[3][2]
-            if south_cell == '#':  # Wall
-                return False
-
-        return True
-
-    def _can_move_east(self, position: Dict, vision: List[List[str]]) -> bool:
-        """
-        Check if can move east.
-
-        Args:
-            position: Current position
-            vision: 5x5 vision grid
+            observation: Current game observation
 
         Returns:
-            can_move: True if movement is valid
+            bits: Move mask
         """
-        # Check map boundaries
-        x = position.get("x", 0)
-        if x >= 49:  # Map is 50x50 (0-49)
-            return False
-
-        # Check vision grid
-        if vision and len(vision) >= 3 and len(vision[2]) >= 4:
-            # East is [2][3]
-            east_cell = vision[2][3]
-            if east_cell == '#':  # Wall
-                return False
+        bits = observation.get("move_mask")
+        if bits is not None:
+            return bits
 
-        return True
+        # Target in bounds and not a wall in the 5x5 vision (center [2][2])
+        position = observation.get("position", {"x": 0, "y": 0})
+        x, y = position.get("x", 0), position.get("y", 0)
+        vision = observation.get("vision", [])
+        width, height = get_map_size(observation)
+        bits = 0
+        for move in MOVE_ACTIONS:
+            dx, dy = DIRECTION_VECTORS[move]
+            if not (0 <= x + dx < width and 0 <= y + dy < height):
+                continue
+            row = vision[2 + dy] if len(vision) > 2 + dy else []
+            if len(row) <= 2 + dx or row[2 + dx] != '#':
+                bits |= 1 << DIRECTION_INDEX_FROM_ACTION[move]
+        return bits
 
-    def _can_move_west(self, position: Dict, vision: List[List[str]]) -> bool:
+    def get_action_mask_binary(self, observation: Dict) -> List[int]:
         """
-        Check if can move west.
+        Get binary action mask (for neural networks).
 
         Args:
-            position: Current position
-            vision: 5x5 vision grid
+            observation: Current game observation
 
         Returns:
-            can_move: True if movement is valid
+            mask: Binary list [1 if valid, 0 if invalid] for all actions
         """
-        # Check map boundaries
-        x = position.get("x", 0)
-        if x <= 0:
-            return False
-
-        # Check vision grid
-        if vision and len(vision) >= 3 and len(vision[2]) >= 2:
-            # West is [2][1]
-            west_cell = vision[2][1]
-            if west_cell == '#':  # Wall
-                return False
+        return self.get_action_masks_batch([observation])[0].astype(int).tolist()
 
-        return True
-
-    def get_action_mask_binary(self, observation: Dict) -> List[int]:
+    def get_action_masks_batch(self, observations: Sequence[Dict]) -> np.ndarray:
         """
-        Get binary action mask (for neural networks).
+        Binary action masks for several observations at once.
 
         Args:
-            observation: Current game observation
+            observations: Current game observations
 
         Returns:
-            mask: Binary list [1 if valid, 0 if invalid] for all actions
+            masks: (N, 9) bool array in ALL_ACTIONS order
         """
-        valid_actions = self.get_valid_actions(observation)
-
-        mask = [
-            1 if action in valid_actions else 0
-            for action in self.all_actions
-        ]
-
-        return mask
+        bits = np.array([self.move_bits(obs) for obs in observations], dtype=np.uint8)
+        alive = np.array([obs.get("hp", 0) > 0 for obs in observations], dtype=bool)
+        armed = np.array([obs.get("ammo", 0) > 0 for obs in observations], dtype=bool)
+
+        masks = np.zeros((len(observations), len(self.all_actions)), dtype=bool)
+        masks[:, list(MOVE_ACTIONS)] = (bits[:, None] >> _MOVE_BITS) & 1
+        masks[:, list(SHOOT_ACTIONS)] = armed[:, None]
+        masks &= alive[:, None]
+        masks[:, WAIT] = True
+        return masks
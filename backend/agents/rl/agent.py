@@ -6,47 +6,55 @@ from backend.agents.rl.encoder import ObservationEncoder
 from backend.agents.rl.policy import Policy
 from backend.agents.rl.reward import RewardCalculator
 from backend.agents.rl.action_mask import ActionMask
-import json
-import os
+from backend.agents.rl.batch_policy import select_actions_batch
+from backend.engine.actions import Action
+from backend.agents.personas import load_persona_config
+from typing import Dict, List, Optional, Sequence
+import numpy as np
+
+
+def chase_direction(observation: Dict, persona_config: Dict) -> Optional[int]:
+    """
+    Direction to chase in: the first step toward the nearest tracked entity
+    (observation "entities"), if it is at most the persona's
+    max_distance_to_chase walking steps away.
+
+    Args:
+        observation: Game observation
+        persona_config: Persona configuration
+
+    Returns:
+        Move direction index, or None when not chasing
+    """
+    tracked = observation.get("entities")
+    if not tracked:
+        return None
+    max_distance = persona_config.get("thresholds", {}).get("max_distance_to_chase", 0)
+    return tracked[0].get("direction") if tracked[0]["distance"] <= max_distance else None
 
 
 class RLAgent(Agent):
     """Reinforcement Learning Agent"""
 
-    def __init__(self, entity_id: str, persona: str = "aggressive"):
-        super().__init__(entity_id, persona)
+    def __init__(self, entity_id: str, persona: str = "aggressive", rng=None):
+        super().__init__(entity_id, persona, rng)
 
-        # Load persona configuration
-        persona_path = f"backend/personas/{persona}.json"
-        if os.path.exists(persona_path):
-            with open(persona_path, 'r') as f:
-                self.persona_config = json.load(f)
-        else:
-            self.persona_config = self._default_config()
+        # Persona configuration (loaded once per process, shared)
+        self.persona_config = load_persona_config(persona)
 
         # Initialize components
         self.encoder = ObservationEncoder()
-        self.policy = Policy(persona=persona)
+        self.policy = Policy(persona=persona, rng=self.rng)
         self.reward_calc = RewardCalculator()
         self.action_mask = ActionMask()
+        self._features = np.zeros(self.encoder.feature_dim, dtype=np.float32)
 
         # Agent state
         self.last_observation = None
         self.last_action = None
         self.episode_reward = 0.0
 
-    def _default_config(self):
-        """Default persona configuration"""
-        return {
-            "behavior": {
-                "shoot_probability": 0.5,
-                "chase_probability": 0.5,
-                "explore_probability": 0.5,
-                "flee_probability": 0.3
-            }
-        }
-
-    def decide_action(self, observation: dict) -> str:
+    def decide_action(self, observation: dict) -> Action:
         """
         Decide action using RL policy.
 
@@ -54,16 +62,17 @@ class RLAgent(Agent):
             observation: Current game observation
 
         Returns:
-            action: Selected action string
+            action: Selected action code
         """
-        # Encode observation to feature vector
-        features = self.encoder.encode(observation)
+        # Encode observation to feature vector (into the agent's own buffer)
+        features = self.encoder.encode(observation, self._features)
 
         # Get valid actions mask
         valid_actions = self.action_mask.get_valid_actions(observation)
 
-        # Select action from policy
-        action = self.policy.select_action(features, valid_actions, self.persona_config)
+        # Select action from policy (chasing what the observation tracks)
+        chase = chase_direction(observation, self.persona_config)
+        action = self.policy.select_action(features, valid_actions, self.persona_config, chase)
 
         # Store for learning
         self.last_observation = observation
@@ -71,6 +80,36 @@ class RLAgent(Agent):
 
         return action
 
+    @classmethod
+    def decide_actions_batch(cls, agents: Sequence['RLAgent'], observations: Sequence[dict]) -> List[Action]:
+        """
+        Decide actions for several RL agents at once: features are encoded
+        into one (N, feature_dim) array and masks into (N, 9), then all
+        actions are scored and sampled together (same choices as calling
+        decide_action on each agent).
+
+        Args:
+            agents: RL agents
+            observations: Current observation of each agent
+
+        Returns:
+            Selected action of each agent
+        """
+        if not agents:
+            return []
+        features = agents[0].encoder.encode_batch(observations)
+        masks = agents[0].action_mask.get_action_masks_batch(observations)
+        actions = select_actions_batch(
+            [agent.policy for agent in agents], features, masks,
+            [agent.persona_config for agent in agents],
+            [chase_direction(obs, agent.persona_config) for agent, obs in zip(agents, observations)]
+        )
+
+        for agent, obs, action in zip(agents, observations, actions):
+            agent.last_observation = obs
+            agent.last_action = action
+        return actions
+
     def update(self, reward: float, next_observation: dict, done: bool):
         """
         Update policy based on reward (for training).
@@ -102,6 +141,11 @@ class RLAgent(Agent):
             self.last_observation = None
             self.last_action = None
 
+    def set_rng(self, rng: np.random.Generator):
+        """Replace the random stream of the agent and its policy."""
+        super().set_rng(rng)
+        self.policy.rng = rng
+
     def reset(self):
         """Reset agent state"""
         self.last_observation = None
@@ -0,0 +1,127 @@
+"""
+Batched action selection for many RL agents at once.
+
+Same decisions as Policy.select_action called per agent. Each agent draws
+from its own random stream in the usual order (the exploration test, then
+an index or a uniform), so only the draws loop over agents; the (N, 9)
+scores are gathered from the compiled persona tables, masked, turned into
+softmax CDFs and sampled for all agents in a few array operations.
+"""
+import numpy as np
+from typing import Dict, List, Optional, Sequence
+
+from backend.agents.rl.policy import Policy
+from backend.agents.rl.score_table import NO_CHASE, get_score_table
+from backend.engine.actions import Action, ALL_ACTIONS, WAIT
+from backend.engine.constants import MAX_AMMO, MAX_HP
+
+# Feature values the encoder produces for each hp / ammo level
+HP_VALUES = (np.arange(MAX_HP + 1) / float(MAX_HP)).astype(np.float32)
+AMMO_VALUES = (np.arange(MAX_AMMO + 1) / float(MAX_AMMO)).astype(np.float32)
+
+
+def _levels(features: np.ndarray):
+    """
+    ScoreTable.levels for every row.
+
+    Returns:
+        (hp_levels, ammo_levels, on_level) arrays of shape (N,)
+    """
+    n = len(features)
+    if features.shape[1] <= 101:
+        zeros = np.zeros(n, dtype=np.intp)
+        return zeros, zeros, np.zeros(n, dtype=bool)
+    hp = features[:, 100].astype(np.float64)
+    ammo = features[:, 101].astype(np.float64)
+    in_range = (hp >= 0.0) & (hp <= 1.0) & (ammo >= 0.0) & (ammo <= 1.0)
+    hp_levels = np.where(in_range, hp * MAX_HP + 0.5, 0).astype(np.intp)
+    ammo_levels = np.where(in_range, ammo * MAX_AMMO + 0.5, 0).astype(np.intp)
+    on_level = in_range & (hp == HP_VALUES[hp_levels]) & (ammo == AMMO_VALUES[ammo_levels])
+    return hp_levels, ammo_levels, on_level
+
+
+def select_actions_batch(
+    policies: Sequence[Policy],
+    features: np.ndarray,
+    masks: np.ndarray,
+    persona_configs: Sequence[Dict],
+    chases: Optional[Sequence[Optional[int]]] = None
+) -> List[Action]:
+    """
+    Policy.select_action for N agents.
+
+    Args:
+        policies: Policy of each agent (epsilon, temperature, rng)
+        features: (N, feature_dim) encoded observations
+        masks: (N, 9) bool valid-action masks in ALL_ACTIONS order
+        persona_configs: Persona configuration of each agent
+        chases: Chased move direction index of each agent (None entries,
+            or no list at all, for agents that are not chasing)
+
+    Returns:
+        Selected action of each agent
+    """
+    n = len(policies)
+    if n == 0:
+        return []
+    features = np.asarray(features).reshape(n, -1)
+    masks = np.asarray(masks, dtype=bool).reshape(n, len(ALL_ACTIONS))
+    counts = masks.sum(axis=1)
+    chases = np.array([NO_CHASE if c is None else c for c in (chases or [None] * n)], dtype=np.intp)
+
+    # Draws, in the order Policy.select_from_mask makes them on each stream
+    explore = np.zeros(n, dtype=bool)
+    draws = np.zeros(n)
+    for i, policy in enumerate(policies):
+        if counts[i] == 0:
+            continue
+        if policy.rng.random() < policy.epsilon:
+            explore[i] = True
+            draws[i] = policy.rng.integers(counts[i])
+        else:
+            draws[i] = policy.rng.random()
+    indices = np.full(n, -1, dtype=np.intp)
+
+    # Exploration: the k-th valid action of each exploring row
+    if explore.any():
+        ranks = np.cumsum(masks[explore], axis=1)
+        indices[explore] = np.argmax(ranks > draws[explore, None], axis=1)
+
+    rows = np.flatnonzero(~explore & (counts > 0))
+    if len(rows):
+        indices[rows] = _sample(
+            [policies[i] for i in rows], features[rows], masks[rows],
+            [persona_configs[i] for i in rows], chases[rows], draws[rows]
+        )
+
+    return [ALL_ACTIONS[i] if i >= 0 else WAIT for i in indices.tolist()]
+
+
+def _sample(policies, features, masks, persona_configs, chases, draws) -> np.ndarray:
+    """Softmax sampling for rows that have at least one valid action."""
+    n = len(policies)
+    hp_levels, ammo_levels, on_level = _levels(features)
+    scores = np.empty((n, len(ALL_ACTIONS)))
+    temperatures = np.array([policy.temperature for policy in policies], dtype=np.float64)
+
+    # (N, 9) scores: compiled table rows, grouped by table
+    groups: Dict[int, list] = {}
+    for i, policy in enumerate(policies):
+        if on_level[i]:
+            table = get_score_table(persona_configs[i], policy.temperature)
+            groups.setdefault(id(table), [table, []])[1].append(i)
+        else:
+            # Features off the table levels: score them directly
+            chase = None if chases[i] == NO_CHASE else int(chases[i])
+            scores[i] = policy._compute_action_scores(features[i], range(len(ALL_ACTIONS)), persona_configs[i], chase)
+    for table, group in groups.values():
+        scores[group] = table.scores[hp_levels[group], ammo_levels[group], chases[group]]
+
+    # Same softmax as Policy._softmax and the normalized cumsum of Generator.choice;
+    # masked actions get probability 0 and so are never selected
+    scaled = np.where(masks, scores / temperatures[:, None], -np.inf)
+    exp_scores = np.exp(scaled - scaled.max(axis=1, keepdims=True))
+    cdf = np.cumsum(exp_scores / exp_scores.sum(axis=1, keepdims=True), axis=1)
+    cdf /= cdf[:, -1:]
+    # searchsorted(cdf, u, side="right") counts the entries <= u
+    return (cdf <= draws[:, None]).sum(axis=1)
@@ -5,7 +5,19 @@ Converts game observations into numerical feature vectors
 for neural network processing.
 """
 import numpy as np
-from typing import Dict, List
+from typing import Dict, List, Optional, Sequence
+
+from backend.engine.observation import get_map_size
+
+# Vision channels (wall, entity, item, bullet) of each character code
+VISION_CHANNELS = np.zeros((256, 4), dtype=np.float32)
+VISION_CHANNELS[ord('#'), 0] = 1.0
+VISION_CHANNELS[[ord('@'), ord('E')], 1] = 1.0
+VISION_CHANNELS[[ord('H'), ord('A')], 2] = 1.0
+VISION_CHANNELS[ord('*'), 3] = 1.0
+
+# Sound feature order: N, NE, E, SE, S, SW, W, NW
+SOUND_DIRECTIONS = ("north", "northeast", "east", "southeast", "south", "southwest", "west", "northwest")
 
 
 class ObservationEncoder:
@@ -17,6 +29,9 @@ class ObservationEncoder:
         self.vision_size = 5  # 5x5 grid
         self.max_entities = 10  # Max entities to track
         self.feature_dim = self._calculate_feature_dim()
+        self.vision_dim = self.vision_size * self.vision_size * 4
+        # Reused by encode_batch (grown as needed)
+        self._batch = np.zeros((0, self.feature_dim), dtype=np.float32)
 
     def _calculate_feature_dim(self) -> int:
         """Calculate total feature dimension"""
@@ -34,63 +49,81 @@ class ObservationEncoder:
 
         return vision_features + self_features + entity_features + sound_features
 
-    def encode(self, observation: Dict) -> np.ndarray:
+    def encode(self, observation: Dict, out: Optional[np.ndarray] = None) -> np.ndarray:
         """
         Encode observation into feature vector.
 
         Args:
             observation: Game observation dict
+            out: float32 buffer of feature_dim values to write into
+                (a new array if omitted)
 
         Returns:
-            features: Numpy array of encoded features
+            features: Numpy array of encoded features (out if given)
         """
-        features = []
-
-        # Encode vision grid
-        vision_features = self._encode_vision(observation.get("vision", []))
-        features.extend(vision_features)
+        if out is None:
+            out = np.empty(self.feature_dim, dtype=np.float32)
+        out[:self.vision_dim] = self._encode_vision(observation.get("vision", [])).reshape(-1)
+        self._encode_rest(observation, out)
+        return out
 
-        # Encode self state
-        self_features = self._encode_self_state(observation)
-        features.extend(self_features)
-
-        # Encode nearby entities
-        entity_features = self._encode_entities(observation.get("entities", []))
-        features.extend(entity_features)
-
-        # Encode sounds
-        sound_features = self._encode_sounds(observation.get("sounds", []))
-        features.extend(sound_features)
+    def encode_batch(self, observations: Sequence[Dict], out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Encode several observations into one (N, feature_dim) array.
+        All visions go through the channel table in one step.
 
-        return np.array(features, dtype=np.float32)
+        Args:
+            observations: Game observation dicts
+            out: (N, feature_dim) float32 buffer to write into; if omitted,
+                the encoder's own buffer is reused, so the result is only
+                valid until the next encode_batch call
 
-    def _encode_vision(self, vision_grid: List[List[str]]) -> List[float]:
+        Returns:
+            features: (N, feature_dim) encoded features
         """
-        Encode 5x5 vision grid into features.
+        n = len(observations)
+        if out is None:
+            if len(self._batch) < n:
+                self._batch = np.zeros((n, self.feature_dim), dtype=np.float32)
+            out = self._batch[:n]
+
+        codes = b"".join(self._vision_codes(obs.get("vision", [])) for obs in observations)
+        out[:, :self.vision_dim] = VISION_CHANNELS[np.frombuffer(codes, dtype=np.uint8)].reshape(n, self.vision_dim)
+        for row, obs in zip(out, observations):
+            self._encode_rest(obs, row)
+        return out
+
+    def _encode_rest(self, observation: Dict, out: np.ndarray):
+        """Write self state, entity and sound features after the vision."""
+        entities, sounds = observation.get("entities", []), observation.get("sounds", [])
+        start = self.vision_dim
+        out[start:start + 4] = self._encode_self_state(observation)
+        out[start + 4:start + 4 + 3 * self.max_entities] = self._encode_entities(entities) if entities else 0.0
+        out[start + 4 + 3 * self.max_entities:] = self._encode_sounds(sounds) if sounds else 0.0
+
+    def _vision_codes(self, vision_grid: List[List[str]]) -> bytes:
+        """
+        One byte per cell of a 5x5 grid of characters. Anything else (e.g. an
+        empty vision) becomes zero bytes, which match no channel.
+        """
+        cells = self.vision_size * self.vision_size
+        if vision_grid is not None and len(vision_grid) == self.vision_size:
+            codes = "".join(["".join(row) for row in vision_grid]).encode("latin-1", "replace")
+            if len(codes) == cells:
+                return codes
+        return bytes(cells)
+
+    def _encode_vision(self, vision_grid: List[List[str]]) -> np.ndarray:
+        """
+        Encode 5x5 vision grid into features with one table lookup.
 
         Args:
             vision_grid: 5x5 grid of cell contents
 
         Returns:
-            features: Flattened vision features
+            features: (cells, 4) wall/entity/item/bullet channels per cell
         """
-        features = []
-
-        # If vision is empty, return zeros
-        if not vision_grid or len(vision_grid) != self.vision_size:
-            return [0.0] * (self.vision_size * self.vision_size * 4)
-
-        for row in vision_grid:
-            for cell in row:
-                # 4 binary channels per cell
-                is_wall = 1.0 if cell == '#' else 0.0
-                is_entity = 1.0 if cell in ['@', 'E'] else 0.0
-                is_item = 1.0 if cell in ['H', 'A'] else 0.0
-                is_bullet = 1.0 if cell == '*' else 0.0
-
-                features.extend([is_wall, is_entity, is_item, is_bullet])
-
-        return features
+        return VISION_CHANNELS[np.frombuffer(self._vision_codes(vision_grid), dtype=np.uint8)]
 
     def _encode_self_state(self, observation: Dict) -> List[float]:
         """
@@ -106,10 +139,11 @@ class ObservationEncoder:
         hp = observation.get("hp", 5) / 5.0
         ammo = observation.get("ammo", 3) / 3.0
 
-        # Normalize position (assuming 50x50 map)
+        # Normalize position by the map size
+        width, height = get_map_size(observation)
         position = observation.get("position", {"x": 0, "y": 0})
-        x = position.get("x", 0) / 50.0
-        y = position.get("y", 0) / 50.0
+        x = position.get("x", 0) / width
+        y = position.get("y", 0) / height
 
         return [hp, ammo, x, y]
 
@@ -152,25 +186,12 @@ class ObservationEncoder:
         Returns:
             features: 8-direction encoding
         """
-        # 8 directions: N, NE, E, SE, S, SW, W, NW
         direction_features = [0.0] * 8
 
-        direction_map = {
-            "north": 0,
-            "northeast": 1,
-            "east": 2,
-            "southeast": 3,
-            "south": 4,
-            "southwest": 5,
-            "west": 6,
-            "northwest": 7
-        }
-
         for sound in sounds:
             direction = sound.get("direction", "").lower()
-            if direction in direction_map:
-                idx = direction_map[direction]
-                direction_features[idx] = 1.0
+            if direction in SOUND_DIRECTIONS:
+                direction_features[SOUND_DIRECTIONS.index(direction)] = 1.0
 
         return direction_features
 
@@ -4,34 +4,28 @@ Policy for RL Agent
 Implements action selection strategy based on features and persona.
 """
 import numpy as np
-from typing import Dict, List
-import random
+from typing import Dict, List, Optional
+
+from backend.agents.rl.score_table import NO_CHASE, VALID_INDICES, action_scores, get_score_table
+from backend.engine.actions import Action, ALL_ACTIONS, WAIT
 
 
 class Policy:
     """Action selection policy for RL agent"""
 
-    def __init__(self, persona: str = "aggressive"):
+    def __init__(self, persona: str = "aggressive", rng: Optional[np.random.Generator] = None):
         """
         Initialize policy.
 
         Args:
             persona: Agent persona name
+            rng: Random stream for exploration and sampling
         """
         self.persona = persona
+        self.rng = rng if rng is not None else np.random.default_rng()
 
         # Action space
-        self.actions = [
-            "MOVE_UP",
-            "MOVE_DOWN",
-            "MOVE_LEFT",
-            "MOVE_RIGHT",
-            "SHOOT_UP",
-            "SHOOT_DOWN",
-            "SHOOT_LEFT",
-            "SHOOT_RIGHT",
-            "WAIT"
-        ]
+        self.actions = list(ALL_ACTIONS)
 
         # Exploration parameters
         self.epsilon = 0.1  # Exploration rate
@@ -40,54 +34,86 @@ class Policy:
     def select_action(
         self,
         features: np.ndarray,
-        valid_actions: List[str],
-        persona_config: Dict
-    ) -> str:
+        valid_actions: List[Action],
+        persona_config: Dict,
+        chase: Optional[int] = None
+    ) -> Action:
         """
         Select action based on features and persona.
 
         Args:
             features: Encoded observation features
-            valid_actions: List of valid action strings
+            valid_actions: List of valid action codes
             persona_config: Persona configuration dict
+            chase: Move direction index toward a chased entity, or None
 
         Returns:
-            action: Selected action string
+            action: Selected action code
         """
         # Filter valid actions
-        valid_action_indices = [
-            i for i, action in enumerate(self.actions)
-            if action in valid_actions
-        ]
+        mask_bits = 0
+        for i, action in enumerate(self.actions):
+            if action in valid_actions:
+                mask_bits |= 1 << i
+        return self.select_from_mask(features, mask_bits, persona_config, chase)
+
+    def select_from_mask(
+        self,
+        features: np.ndarray,
+        mask_bits: int,
+        persona_config: Dict,
+        chase: Optional[int] = None
+    ) -> Action:
+        """
+        Select action given the valid actions as a bit mask.
+
+        Args:
+            features: Encoded observation features
+            mask_bits: Valid actions, bit i for ALL_ACTIONS[i]
+            persona_config: Persona configuration dict
+            chase: Move direction index toward a chased entity, or None
 
+        Returns:
+            action: Selected action code
+        """
+        valid_action_indices = VALID_INDICES[mask_bits]
         if not valid_action_indices:
-            return "wait"
+            return WAIT
 
         # Epsilon-greedy exploration
-        if random.random() < self.epsilon:
+        if self.rng.random() < self.epsilon:
             # Random exploration
-            idx = random.choice(valid_action_indices)
+            idx = valid_action_indices[self.rng.integers(len(valid_action_indices))]
             return self.actions[idx]
 
-        # Policy-based selection
+        # Policy-based selection: look up the compiled persona tables
+        table = get_score_table(persona_config, self.temperature)
+        levels = table.levels(features)
+        if levels is not None:
+            u = self.rng.random()
+            return self.actions[table.sample(*levels, mask_bits, u, NO_CHASE if chase is None else chase)]
+
+        # Features off the table levels: score them directly
         action_scores = self._compute_action_scores(
             features,
             valid_action_indices,
-            persona_config
+            persona_config,
+            chase
         )
 
         # Apply softmax with temperature
         probs = self._softmax(action_scores, self.temperature)
 
         # Sample from distribution
-        idx = np.random.choice(valid_action_indices, p=probs)
+        idx = self.rng.choice(valid_action_indices, p=probs)
         return self.actions[idx]
 
     def _compute_action_scores(
         self,
         features: np.ndarray,
         valid_indices: List[int],
-        persona_config: Dict
+        persona_config: Dict,
+        chase: Optional[int] = None
     ) -> np.ndarray:
         """
         Compute action scores based on heuristics and persona.
@@ -96,67 +122,19 @@ class Policy:
             features: Observation features
             valid_indices: Valid action indices
             persona_config: Persona configuration
+            chase: Move direction index toward a chased entity, or None
 
         Returns:
             scores: Score for each valid action
         """
-        scores = np.zeros(len(valid_indices))
-
-        # Extract persona weights
-        behavior = persona_config.get("behavior", {})
-        decision_weights = persona_config.get("decision_weights", {})
-        thresholds = persona_config.get("thresholds", {})
-
         # Parse features (basic heuristic)
         # Self state starts at index 100 (5*5*4)
         hp = features[100] if len(features) > 100 else 0.5
         ammo = features[101] if len(features) > 101 else 0.5
-
-        # Heuristic scoring for each action
-        for i, action_idx in enumerate(valid_indices):
-            action = self.actions[action_idx]
-            score = 0.0
-
-            # Movement actions
-            if action.startswith("MOVE_"):
-                score += decision_weights.get("explore", 0.5)
-
-                # Prefer exploration when hp is high
-                if hp > 0.6:
-                    score += 0.3
-                else:
-                    # Prefer fleeing when hp is low
-                    score += decision_weights.get("flee", 0.3)
-
-            # Shooting actions
-            elif action.startswith("SHOOT_"):
-                score += decision_weights.get("attack", 0.5)
-
-                # Can only shoot if we have ammo
-                if ammo > 0:
-                    score += behavior.get("shoot_probability", 0.5)
-                else:
-                    score = 0.0  # Invalid if no ammo
-
-                # Reduce shooting when low hp (cautious behavior)
-                min_hp = thresholds.get("min_hp_to_attack", 2) / 5.0
-                if hp < min_hp:
-                    score *= 0.5
-
-            # Wait action
-            elif action == "WAIT":
-                score += 0.1
-
-                # Prefer waiting when low ammo (to recover)
-                if ammo < 0.3:
-                    score += 0.4
-
-            scores[i] = score
+        scores = action_scores(hp, ammo, persona_config, chase)
 
         # Normalize to prevent negative scores
-        scores = np.maximum(scores, 0.01)
-
-        return scores
+        return np.maximum([scores[i] for i in valid_indices], 0.01)
 
     def _softmax(self, scores: np.ndarray, temperature: float = 1.0) -> np.ndarray:
         """
@@ -0,0 +1,199 @@
+"""
+Compiled persona score tables.
+
+The policy heuristics only look at the hp and ammo levels of an agent and at
+the direction it is chasing in (if any), so a persona config is compiled once
+into a dense table of action scores per (hp_level, ammo_level, chase). For a
+softmax temperature, the sampling CDF over the valid actions of each
+(hp_level, ammo_level, chase, mask_bits) is built the first time it is needed
+and kept. Selecting an action is then a lookup plus one
+uniform draw, with the same distribution (and the same sample for the same
+draw) as Generator.choice over the softmax.
+"""
+import bisect
+
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+
+from backend.engine.actions import ALL_ACTIONS, is_move_action, is_shoot_action
+from backend.engine.constants import MAX_AMMO, MAX_HP
+
+HP_LEVELS = MAX_HP + 1
+AMMO_LEVELS = MAX_AMMO + 1
+MASK_COUNT = 1 << len(ALL_ACTIONS)
+
+# Chase states: a move direction index (UP, DOWN, LEFT, RIGHT), or not chasing
+NO_CHASE = 4
+CHASE_STATES = NO_CHASE + 1
+
+# Bit i of a mask stands for ALL_ACTIONS[i]
+MASK_WEIGHTS = 1 << np.arange(len(ALL_ACTIONS))
+
+# Valid action indices of every mask, in ALL_ACTIONS order
+VALID_INDICES: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(i for i in range(len(ALL_ACTIONS)) if mask >> i & 1) for mask in range(MASK_COUNT)
+)
+
+# Tables compiled in this process, by (id(persona_config), temperature)
+MAX_TABLES = 64
+_TABLES: Dict[Tuple[int, float], 'ScoreTable'] = {}
+
+
+def action_scores(hp: float, ammo: float, persona_config: Dict, chase: Optional[int] = None) -> List[float]:
+    """
+    Heuristic score of every action for one hp / ammo state.
+
+    Args:
+        hp: Normalized hp feature
+        ammo: Normalized ammo feature
+        persona_config: Persona configuration
+        chase: Move direction index toward a chased entity, or None
+
+    Returns:
+        Score of each action in ALL_ACTIONS order (before the 0.01 floor)
+    """
+    behavior = persona_config.get("behavior", {})
+    decision_weights = persona_config.get("decision_weights", {})
+    thresholds = persona_config.get("thresholds", {})
+
+    # Movement: prefer exploring when hp is high, fleeing when it is low
+    move = 0.0 + decision_weights.get("explore", 0.5)
+    move += 0.3 if hp > 0.6 else decision_weights.get("flee", 0.3)
+
+    # Shooting needs ammo and is halved when low on hp
+    shoot = 0.0 + decision_weights.get("attack", 0.5)
+    if ammo > 0:
+        shoot += behavior.get("shoot_probability", 0.5)
+    else:
+        shoot = 0.0
+    if hp < thresholds.get("min_hp_to_attack", 2) / 5.0:
+        shoot *= 0.5
+
+    # Waiting recovers ammo
+    wait = 0.1 + 0.4 if ammo < 0.3 else 0.1
+
+    scores = [move if is_move_action(a) else shoot if is_shoot_action(a) else wait for a in ALL_ACTIONS]
+
+    # Chasing favours the first step of the shortest path
+    if chase is not None:
+        scores[chase] += decision_weights.get("chase", 0.3) + behavior.get("chase_probability", 0.5)
+    return scores
+
+
+class ScoreTable:
+    """Scores and sampling CDFs of one persona config at one temperature"""
+
+    def __init__(self, persona_config: Dict, temperature: float):
+        """
+        Compile the tables.
+
+        Args:
+            persona_config: Persona configuration (treated as read-only)
+            temperature: Softmax temperature
+        """
+        self.persona_config = persona_config
+        self.temperature = temperature
+
+        # Feature values the encoder produces for each level
+        self.hp_values = (np.arange(HP_LEVELS) / float(MAX_HP)).astype(np.float32)
+        self.ammo_values = (np.arange(AMMO_LEVELS) / float(MAX_AMMO)).astype(np.float32)
+        self._hp_floats = self.hp_values.tolist()
+        self._ammo_floats = self.ammo_values.tolist()
+
+        # (hp_level, ammo_level, chase, action) scores
+        chases = list(range(NO_CHASE)) + [None]
+        self.scores = np.maximum([
+            [[action_scores(hp, ammo, persona_config, chase) for chase in chases] for ammo in self.ammo_values]
+            for hp in self.hp_values
+        ], 0.01)
+
+        # CDF rows built so far, by (hp_level, ammo_level, chase, mask_bits)
+        self._rows: Dict[Tuple[int, int, int, int], List[float]] = {}
+
+    def levels(self, features: np.ndarray) -> Optional[Tuple[int, int]]:
+        """
+        Table row of encoded features.
+
+        Args:
+            features: Encoded observation features
+
+        Returns:
+            (hp_level, ammo_level), or None when the hp / ammo features are
+            not exactly the values of a level
+        """
+        if len(features) <= 101:
+            return None
+        hp, ammo = float(features[100]), float(features[101])
+        if not (0.0 <= hp <= 1.0 and 0.0 <= ammo <= 1.0):
+            return None
+        hp_level = int(hp * MAX_HP + 0.5)
+        ammo_level = int(ammo * MAX_AMMO + 0.5)
+        if hp != self._hp_floats[hp_level] or ammo != self._ammo_floats[ammo_level]:
+            return None
+        return hp_level, ammo_level
+
+    def cdf(self, hp_level: int, ammo_level: int, mask_bits: int, chase: int = NO_CHASE) -> List[float]:
+        """
+        Sampling CDF over the valid actions of one table row.
+
+        Args:
+            hp_level: Hp level (0-MAX_HP)
+            ammo_level: Ammo level (0-MAX_AMMO)
+            mask_bits: Valid actions, bit i for ALL_ACTIONS[i] (non-zero)
+            chase: Chased direction index, or NO_CHASE
+
+        Returns:
+            Cumulative probability of each valid action, ending at 1.0
+        """
+        key = (hp_level, ammo_level, chase, mask_bits)
+        row = self._rows.get(key)
+        if row is None:
+            # Same softmax as Policy._softmax, then the normalized cumsum of Generator.choice
+            scaled = self.scores[hp_level, ammo_level, chase, list(VALID_INDICES[mask_bits])] / self.temperature
+            exp_scores = np.exp(scaled - np.max(scaled))
+            cdf = np.cumsum(exp_scores / np.sum(exp_scores))
+            row = self._rows[key] = (cdf / cdf[-1]).tolist()
+        return row
+
+    def sample(self, hp_level: int, ammo_level: int, mask_bits: int, u: float, chase: int = NO_CHASE) -> int:
+        """
+        Action index for a uniform draw u in [0, 1).
+
+        Args:
+            hp_level: Hp level (0-MAX_HP)
+            ammo_level: Ammo level (0-MAX_AMMO)
+            mask_bits: Valid actions, bit i for ALL_ACTIONS[i] (non-zero)
+            u: Uniform draw
+            chase: Chased direction index, or NO_CHASE
+
+        Returns:
+            Index into ALL_ACTIONS
+        """
+        # Same index as searchsorted(cdf, u, side="right") in Generator.choice
+        row = self.cdf(hp_level, ammo_level, mask_bits, chase)
+        return VALID_INDICES[mask_bits][bisect.bisect_right(row, u)]
+
+
+def get_score_table(persona_config: Dict, temperature: float) -> ScoreTable:
+    """
+    Compiled tables of a persona config, built on first use.
+
+    Args:
+        persona_config: Persona configuration (e.g. from load_persona_config)
+        temperature: Softmax temperature
+
+    Returns:
+        Score table shared by every policy with this config and temperature
+    """
+    key = (id(persona_config), temperature)
+    table = _TABLES.get(key)
+    if table is None or table.persona_config is not persona_config:
+        if len(_TABLES) >= MAX_TABLES:
+            _TABLES.clear()
+        table = _TABLES[key] = ScoreTable(persona_config, temperature)
+    return table
+
+
+def clear_score_tables():
+    """Forget compiled tables (e.g. after persona configs were reloaded)."""
+    _TABLES.clear()
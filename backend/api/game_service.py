@@ -7,10 +7,12 @@ from typing import Dict, Any
 from backend.engine.state_factory import create_new_state
 from backend.engine.engine import GameEngine
 from backend.engine.observation import generate_observation
-from backend.engine.actions import is_valid_action
+from backend.engine.actions import parse_action
+from backend.engine.events import render_events
+from backend.engine.profiler import get_aggregate_profile, profiling_enabled_by_env
 from backend.storage.games_store import save_game, load_game, GameStoreError
 from backend.storage.log_store import append_logs_batch, LogStoreError
-from backend.agents.registry import create_agent
+from backend.agents.pool import get_agent_pool, drop_agent_pool
 
 
 class GameServiceError(Exception):
@@ -36,7 +38,8 @@ def create_new_game(db: Session) -> Dict[str, Any]:
 def queue_action(db: Session, game_id: str, action: str) -> Dict[str, Any]:
     """Queue an action for the player."""
     try:
-        if not is_valid_action(action):
+        code = parse_action(action)
+        if code is None:
             raise GameServiceError(f"Invalid action: {action}")
 
         world = load_game(db, game_id)
@@ -53,7 +56,7 @@ def queue_action(db: Session, game_id: str, action: str) -> Dict[str, Any]:
         if not player.alive:
             raise GameServiceError("Player is dead")
 
-        player.action_queue.append(action)
+        player.action_queue.append(code)
         save_game(db, world)
 
         return {
@@ -77,17 +80,15 @@ def execute_game_tick(db: Session, game_id: str) -> Dict[str, Any]:
         if world.game_over:
             raise GameServiceError("Game is already over")
 
-        # Create AI agent instances for non-player entities
-        agents = {}
-        for entity_id, entity in world.entities.items():
-            if entity.entity_type == "agent" and entity.alive:
-                # Create RL agent with persona
-                agents[entity_id] = create_agent("rl", entity_id, entity.persona)
+        # AI agents live as long as the game; their streams depend only on seed and tick
+        agents = get_agent_pool(game_id).agents_for(world)
 
         engine = GameEngine(world, agents)
-        result = engine.tick()
+        result = engine.tick(observe=("player",))
 
         save_game(db, world)
+        if world.game_over:
+            drop_agent_pool(game_id)
 
         if result["events"]:
             try:
@@ -97,7 +98,7 @@ def execute_game_tick(db: Session, game_id: str) -> Dict[str, Any]:
 
         player_obs = result["observations"].get("player")
         if not player_obs:
-            player_obs = generate_observation(world, "player")
+            player_obs = engine.observe("player")
 
         player = world.entities.get("player")
         queue_size = len(player.action_queue) if player else 0
@@ -105,7 +106,7 @@ def execute_game_tick(db: Session, game_id: str) -> Dict[str, Any]:
         return {
             "tick": result["tick"],
             "observation": player_obs,
-            "events": result["events"],
+            "events": render_events(result["events"]),
             "queue_size": queue_size
         }
     except GameServiceError:
@@ -149,3 +150,8 @@ def resume_existing_game(db: Session, game_id: str) -> Dict[str, Any]:
         raise
     except Exception as e:
         raise GameServiceError(f"Failed to resume game: {str(e)}")
+
+
+def get_tick_profile() -> Dict[str, Any]:
+    """Aggregate per-phase tick timings for this server process."""
+    return {"enabled": profiling_enabled_by_env(), **get_aggregate_profile()}
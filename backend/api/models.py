@@ -64,6 +64,13 @@ class WatchResponse(BaseModel):
     bullets: List[Dict[str, Any]]
 
 
+class ProfileResponse(BaseModel):
+    enabled: bool
+    ticks: int
+    bucket_edges_us: List[int]
+    phases: Dict[str, Dict[str, Any]]
+
+
 class ErrorResponse(BaseModel):
     success: bool
     error: str
@@ -13,6 +13,7 @@ from backend.api.game_service import (
     execute_game_tick,
     get_game_observation,
     resume_existing_game,
+    get_tick_profile,
     GameServiceError
 )
 from backend.api.concurrent_limiter import check_concurrent_limit
@@ -129,7 +130,7 @@ async def watch_game(game_id: str, db: Session = Depends(get_db)):
         return {
             "game_id": actual_game_id,
             "tick": world.tick,
-            "full_map": world.map_grid,
+            "full_map": world.game_map.to_grid(),
             "entities": entities,
             "bullets": bullets
         }
@@ -137,3 +138,9 @@ async def watch_game(game_id: str, db: Session = Depends(get_db)):
         raise
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.get("/profile", response_model=ProfileResponse)
+async def tick_profile():
+    """Per-phase tick timings (set CATAMAZE_PROFILE=1 to record)."""
+    return get_tick_profile()
@@ -1,86 +1,97 @@
 """
 Action definitions and direction vectors.
+Actions are small integer codes; names are only used at the API boundary.
 """
-from typing import Tuple, Dict
+from enum import IntEnum
+from typing import Tuple, Optional
+
+
+class Action(IntEnum):
+    """Action codes (also the index into ALL_ACTIONS and the direction table)."""
+    MOVE_UP = 0
+    MOVE_DOWN = 1
+    MOVE_LEFT = 2
+    MOVE_RIGHT = 3
+    SHOOT_UP = 4
+    SHOOT_DOWN = 5
+    SHOOT_LEFT = 6
+    SHOOT_RIGHT = 7
+    WAIT = 8
+
+    def __str__(self) -> str:
+        return self.name
+
 
 # Action type definitions
-MOVE_UP = "MOVE_UP"
-MOVE_DOWN = "MOVE_DOWN"
-MOVE_LEFT = "MOVE_LEFT"
-MOVE_RIGHT = "MOVE_RIGHT"
+MOVE_UP = Action.MOVE_UP
+MOVE_DOWN = Action.MOVE_DOWN
+MOVE_LEFT = Action.MOVE_LEFT
+MOVE_RIGHT = Action.MOVE_RIGHT
 
-SHOOT_UP = "SHOOT_UP"
-SHOOT_DOWN = "SHOOT_DOWN"
-SHOOT_LEFT = "SHOOT_LEFT"
-SHOOT_RIGHT = "SHOOT_RIGHT"
+SHOOT_UP = Action.SHOOT_UP
+SHOOT_DOWN = Action.SHOOT_DOWN
+SHOOT_LEFT = Action.SHOOT_LEFT
+SHOOT_RIGHT = Action.SHOOT_RIGHT
 
-WAIT = "WAIT"
+WAIT = Action.WAIT
 
 # All valid actions
-ALL_ACTIONS = [
-    MOVE_UP, MOVE_DOWN, MOVE_LEFT, MOVE_RIGHT,
-    SHOOT_UP, SHOOT_DOWN, SHOOT_LEFT, SHOOT_RIGHT,
-    WAIT
-]
+ALL_ACTIONS: Tuple[Action, ...] = tuple(Action)
 
 # Movement actions only
-MOVE_ACTIONS = [MOVE_UP, MOVE_DOWN, MOVE_LEFT, MOVE_RIGHT]
+MOVE_ACTIONS: Tuple[Action, ...] = (MOVE_UP, MOVE_DOWN, MOVE_LEFT, MOVE_RIGHT)
 
 # Shoot actions only
-SHOOT_ACTIONS = [SHOOT_UP, SHOOT_DOWN, SHOOT_LEFT, SHOOT_RIGHT]
+SHOOT_ACTIONS: Tuple[Action, ...] = (SHOOT_UP, SHOOT_DOWN, SHOOT_LEFT, SHOOT_RIGHT)
 
-# Direction vectors: action -> (dx, dy)
+# Direction names in direction-index order (same as maps.rays.DIRECTIONS)
+DIRECTION_NAMES: Tuple[str, ...] = ("UP", "DOWN", "LEFT", "RIGHT")
+
+# Direction vectors indexed by action code: (dx, dy), None for WAIT
 # Note: y increases downward (row index), x increases rightward (column index)
-DIRECTION_VECTORS: Dict[str, Tuple[int, int]] = {
-    MOVE_UP: (0, -1),
-    MOVE_DOWN: (0, 1),
-    MOVE_LEFT: (-1, 0),
-    MOVE_RIGHT: (1, 0),
-    SHOOT_UP: (0, -1),
-    SHOOT_DOWN: (0, 1),
-    SHOOT_LEFT: (-1, 0),
-    SHOOT_RIGHT: (1, 0),
-}
-
-# Extract direction from action
-DIRECTION_FROM_ACTION: Dict[str, str] = {
-    MOVE_UP: "UP",
-    MOVE_DOWN: "DOWN",
-    MOVE_LEFT: "LEFT",
-    MOVE_RIGHT: "RIGHT",
-    SHOOT_UP: "UP",
-    SHOOT_DOWN: "DOWN",
-    SHOOT_LEFT: "LEFT",
-    SHOOT_RIGHT: "RIGHT",
-}
-
-
-def is_move_action(action: str) -> bool:
+_VECTORS = ((0, -1), (0, 1), (-1, 0), (1, 0))
+DIRECTION_VECTORS: Tuple[Optional[Tuple[int, int]], ...] = _VECTORS + _VECTORS + (None,)
+
+# Direction index (0-3) indexed by action code, -1 for WAIT
+DIRECTION_INDEX_FROM_ACTION: Tuple[int, ...] = (0, 1, 2, 3, 0, 1, 2, 3, -1)
+
+
+def parse_action(name: str) -> Optional[Action]:
+    """
+    Convert an action name from the API to its code.
+
+    Returns:
+        Action, or None if the name is not a valid action
+    """
+    return Action.__members__.get(name) if isinstance(name, str) else None
+
+
+def is_move_action(action: int) -> bool:
     """Check if action is a movement action."""
-    return action in MOVE_ACTIONS
+    return MOVE_UP <= action <= MOVE_RIGHT
 
 
-def is_shoot_action(action: str) -> bool:
+def is_shoot_action(action: int) -> bool:
     """Check if action is a shoot action."""
-    return action in SHOOT_ACTIONS
+    return SHOOT_UP <= action <= SHOOT_RIGHT
 
 
-def is_wait_action(action: str) -> bool:
+def is_wait_action(action: int) -> bool:
     """Check if action is wait."""
     return action == WAIT
 
 
-def is_valid_action(action: str) -> bool:
-    """Check if action is valid."""
-    return action in ALL_ACTIONS
+def is_valid_action(action: int) -> bool:
+    """Check if action is a valid action code."""
+    return isinstance(action, int) and MOVE_UP <= action <= WAIT
 
 
-def get_direction_vector(action: str) -> Tuple[int, int]:
+def get_direction_vector(action: int) -> Tuple[int, int]:
     """
     Get direction vector for an action.
 
     Args:
-        action: Action string
+        action: Action code
 
     Returns:
         (dx, dy) tuple
@@ -88,17 +99,17 @@ def get_direction_vector(action: str) -> Tuple[int, int]:
     Raises:
         ValueError: If action has no direction (e.g., WAIT)
     """
-    if action not in DIRECTION_VECTORS:
+    if not MOVE_UP <= action < WAIT:
         raise ValueError(f"Action {action} has no direction vector")
     return DIRECTION_VECTORS[action]
 
 
-def get_direction_name(action: str) -> str:
+def get_direction_name(action: int) -> str:
     """
     Get direction name from action.
 
     Args:
-        action: Action string
+        action: Action code
 
     Returns:
         Direction name: "UP", "DOWN", "LEFT", "RIGHT"
@@ -106,6 +117,6 @@ def get_direction_name(action: str) -> str:
     Raises:
         ValueError: If action has no direction
     """
-    if action not in DIRECTION_FROM_ACTION:
+    if not MOVE_UP <= action < WAIT:
         raise ValueError(f"Action {action} has no direction")
-    return DIRECTION_FROM_ACTION[action]
+    return DIRECTION_NAMES[DIRECTION_INDEX_FROM_ACTION[action]]
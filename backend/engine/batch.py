@@ -0,0 +1,200 @@
+"""
+Vectorized multi-game engine.
+Steps many worlds per call using NumPy struct-of-arrays.
+"""
+from typing import List, Dict, Optional
+import numpy as np
+
+from backend.engine.state import WorldState
+from backend.engine.actions import (
+    ALL_ACTIONS, DIRECTION_VECTORS, DIRECTION_INDEX_FROM_ACTION, MOVE_RIGHT, SHOOT_UP, SHOOT_RIGHT, WAIT
+)
+from backend.engine.constants import MAX_AMMO, MIN_HP, AMMO_RECOVERY_TICKS, BULLET_DAMAGE
+
+# Per-action-code lookup tables (WAIT has no direction)
+_DX = np.array([(DIRECTION_VECTORS[a] or (0, 0))[0] for a in ALL_ACTIONS], dtype=np.int32)
+_DY = np.array([(DIRECTION_VECTORS[a] or (0, 0))[1] for a in ALL_ACTIONS], dtype=np.int32)
+_DIR = np.array([max(DIRECTION_INDEX_FROM_ACTION[a], 0) for a in ALL_ACTIONS], dtype=np.int32)
+
+BULLET_MAX_RANGE = 50  # Same as trace_bullet_path default
+
+
+class BatchGameEngine:
+    """
+    Holds N worlds as arrays and advances all of them per tick.
+    Matches GameEngine.tick phases 1-5; agent decisions are made by the caller.
+    Entity slots are padded to the largest entity count with dead entities.
+    """
+
+    def __init__(self, worlds: List[WorldState]):
+        """
+        Args:
+            worlds: World states sharing one map size (kept for write_back)
+        """
+        if not worlds:
+            raise ValueError("BatchGameEngine needs at least one world")
+
+        self.worlds = worlds
+        self.entity_ids = [list(w.entities.keys()) for w in worlds]
+        n = len(worlds)
+        e = max(len(ids) for ids in self.entity_ids)
+
+        maps = [w.game_map for w in worlds]
+        if len({(m.height, m.width) for m in maps}) != 1:
+            raise ValueError("All worlds must share the same map size")
+        self.height, self.width = maps[0].height, maps[0].width
+        # Worlds on one shared map use its (H, W) tables; otherwise they are stacked per world
+        self.shared_map = all(m is maps[0] for m in maps)
+        self.walls = (maps[0].walls if self.shared_map else np.stack([m.walls for m in maps])).astype(bool)
+        self.rays = maps[0].rays if self.shared_map else np.stack([m.rays for m in maps])
+
+        self.x, self.y = np.zeros((n, e), dtype=np.int32), np.zeros((n, e), dtype=np.int32)
+        self.hp, self.ammo = np.zeros((n, e), dtype=np.int32), np.zeros((n, e), dtype=np.int32)
+        self.last_bullet_tick = np.zeros((n, e), dtype=np.int64)
+        self.alive, self.won = np.zeros((n, e), dtype=bool), np.zeros((n, e), dtype=bool)
+        self._visits: List[np.ndarray] = []  # Cells entered per step: (world * E + slot) * H * W + y * W + x
+
+        self.tick = np.array([w.tick for w in worlds], dtype=np.int64)
+        self.game_over = np.array([w.game_over for w in worlds], dtype=bool)
+        self.exit_x, self.exit_y = np.array([(w.exit_x, w.exit_y) for w in worlds], dtype=np.int32).T
+        players = [ids.index("player") if "player" in ids else -1 for ids in self.entity_ids]
+        self.player_idx = np.array(players, dtype=np.int32)
+
+        for i, w in enumerate(worlds):
+            for j, ent in enumerate(w.entities.values()):
+                self.x[i, j], self.y[i, j] = ent.x, ent.y
+                self.hp[i, j], self.ammo[i, j] = ent.hp, ent.ammo
+                self.last_bullet_tick[i, j] = ent.last_bullet_tick
+                self.alive[i, j], self.won[i, j] = ent.alive, ent.won
+
+    def pop_queued_actions(self) -> np.ndarray:
+        """Phase 1: pop one queued action per alive entity (WAIT if empty)."""
+        actions = np.full(self.alive.shape, int(WAIT), dtype=np.int32)
+        for i, w in enumerate(self.worlds):
+            for j, ent in enumerate(w.entities.values()):
+                if self.alive[i, j] and ent.action_queue:
+                    actions[i, j] = ent.action_queue.popleft()
+        return actions
+
+    def step(self, actions: Optional[np.ndarray] = None) -> Dict[str, np.ndarray]:
+        """
+        Advance every world by one tick.
+
+        Args:
+            actions: (N, E) action codes; popped from queues if None
+
+        Returns:
+            Dict of per-world arrays: tick, moved, fired, hit_target, game_over
+        """
+        if actions is None:
+            actions = self.pop_queued_actions()
+        actions = np.where(self.alive, actions, int(WAIT))  # Only alive entities act
+        n, e = actions.shape
+        rows = np.arange(n)
+        moved, fired = np.zeros((n, e), dtype=bool), np.zeros((n, e), dtype=bool)
+        hit_target = np.full((n, e), -1, dtype=np.int32)
+
+        # Phase 2: execute actions in entity order (later entities see earlier effects)
+        for j in range(e):
+            act = actions[:, j]
+            dx, dy = _DX[act], _DY[act]
+            is_move = act <= MOVE_RIGHT
+            nx, ny = self.x[:, j] + dx, self.y[:, j] + dy
+            ok = is_move & self._walkable(rows, nx, ny)
+            self.x[ok, j], self.y[ok, j] = nx[ok], ny[ok]
+            self._visits.append((rows[ok] * e + j) * (self.height * self.width) + ny[ok] * self.width + nx[ok])
+            moved[:, j] = ok
+
+            shoots = (act >= SHOOT_UP) & (act <= SHOOT_RIGHT) & (self.ammo[:, j] > 0)
+            if shoots.any():
+                self.ammo[shoots, j] -= 1
+                self.last_bullet_tick[shoots, j] = self.tick[shoots]
+                fired[:, j] = shoots
+                hit_target[:, j] = self._resolve_shots(j, shoots, act, dx, dy)
+
+        # Phase 3: recover ammo
+        due = self.alive & (self.ammo < MAX_AMMO)
+        due &= self.tick[:, None] - self.last_bullet_tick >= AMMO_RECOVERY_TICKS
+        self.ammo[due] += 1
+        self.last_bullet_tick[due] += AMMO_RECOVERY_TICKS
+
+        # Phase 4: check win conditions (player only)
+        has_player = self.player_idx >= 0
+        p = np.maximum(self.player_idx, 0)
+        p_alive = self.alive[rows, p]
+        at_exit = (self.x[rows, p] == self.exit_x) & (self.y[rows, p] == self.exit_y)
+        won = has_player & p_alive & at_exit
+        self.won[rows[won], p[won]] = True
+        self.game_over |= won | (has_player & ~p_alive)
+
+        # Phase 5: increment tick
+        self.tick += 1
+
+        return {
+            "tick": self.tick.copy(), "moved": moved, "fired": fired,
+            "hit_target": hit_target, "game_over": self.game_over.copy()
+        }
+
+    def _walkable(self, rows: np.ndarray, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """Vectorized bounds + wall check for one cell per world."""
+        inb, cx, cy = self._clip(xs, ys)
+        return inb & ~self.walls[self._cell(rows, cx, cy)]
+
+    def _cell(self, rows: np.ndarray, xs: np.ndarray, ys: np.ndarray) -> tuple:
+        """Index of one map cell per world (no world axis on a shared map)."""
+        return (ys, xs) if self.shared_map else (rows, ys, xs)
+
+    def _clip(self, xs: np.ndarray, ys: np.ndarray):
+        """In-bounds mask plus coordinates clamped for safe indexing."""
+        inb = (xs >= 0) & (xs < self.width) & (ys >= 0) & (ys < self.height)
+        return inb, np.clip(xs, 0, self.width - 1), np.clip(ys, 0, self.height - 1)
+
+    def _resolve_shots(self, j: int, shoots: np.ndarray, act: np.ndarray, dx: np.ndarray, dy: np.ndarray) -> np.ndarray:
+        """Resolve shots fired by entity slot j; returns hit entity index or -1."""
+        rows, e = np.arange(self.alive.shape[0]), self.alive.shape[1]
+        sx, sy = self.x[:, j], self.y[:, j]
+
+        # Bullet starts one cell away; reach is counted in steps from the shooter
+        inb, cx, cy = self._clip(sx + dx, sy + dy)
+        ray = np.minimum(self.rays[self._cell(rows, cx, cy) + (_DIR[act],)], BULLET_MAX_RANGE)
+        reach = np.where(inb, 1 + ray.astype(np.int32), 0)
+
+        # Distance along the ray for every other alive entity
+        rel_x, rel_y = self.x - sx[:, None], self.y - sy[:, None]
+        along = rel_x * dx[:, None] + rel_y * dy[:, None]
+        aligned = (rel_x * dy[:, None] - rel_y * dx[:, None]) == 0
+        candidate = self.alive & aligned & (along >= 2) & (along <= reach[:, None])
+        candidate[:, j] = False
+        candidate &= shoots[:, None]
+
+        # Nearest cell wins; ties go to the earliest entity in dict order
+        key = np.where(candidate, along * e + np.arange(e), np.iinfo(np.int32).max)
+        target = np.argmin(key, axis=1)
+        hit = candidate[rows, target]
+
+        self.hp[rows[hit], target[hit]] = np.maximum(self.hp[rows[hit], target[hit]] - BULLET_DAMAGE, MIN_HP)
+        died = hit & (self.hp[rows, target] <= MIN_HP)
+        self.alive[rows[died], target[died]] = False
+        return np.where(hit, target, -1)
+
+    def write_back(self):
+        """Copy array state back into the WorldState objects (visited cells in bulk, per entity)."""
+        visits = np.unique(np.concatenate(self._visits)) if self._visits else np.zeros(0, dtype=np.int64)
+        self._visits = []
+        owners, cells = np.divmod(visits, self.height * self.width)
+        bounds = np.searchsorted(owners, np.arange(self.alive.size + 1))
+        ys, xs = np.divmod(cells, self.width)
+        for i, w in enumerate(self.worlds):
+            w.tick = int(self.tick[i])
+            for j, ent in enumerate(w.entities.values()):
+                ent.x, ent.y = int(self.x[i, j]), int(self.y[i, j])
+                ent.hp, ent.ammo = int(self.hp[i, j]), int(self.ammo[i, j])
+                ent.last_bullet_tick = int(self.last_bullet_tick[i, j])
+                ent.alive, ent.won = bool(self.alive[i, j]), bool(self.won[i, j])
+                lo, hi = bounds[i * self.alive.shape[1] + j], bounds[i * self.alive.shape[1] + j + 1]
+                if hi > lo:
+                    ent.visited_positions.update(xs[lo:hi], ys[lo:hi])
+            if self.game_over[i] and not w.game_over:
+                w.game_over = True
+                if self.player_idx[i] >= 0 and self.won[i, self.player_idx[i]]:
+                    w.winner_id = "player"
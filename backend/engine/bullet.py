@@ -3,11 +3,13 @@ Bullet and ammo management module.
 Handles ammo count, recovery, shooting, and bullet hit detection.
 """
 from typing import Tuple, List, Optional
+from backend.maps.compiled import CompiledMap
 from .constants import (
     INITIAL_AMMO, MAX_AMMO, MIN_AMMO,
     AMMO_RECOVERY_TICKS
 )
-from .position import add_vector, is_in_bounds
+from backend.maps.rays import DIRECTION_INDEX
+from .position import add_vector
 
 
 def create_ammo_state(initial_ammo: int = INITIAL_AMMO) -> int:
@@ -95,46 +97,56 @@ def recover_ammo(current_ammo: int, current_tick: int, last_shot_tick: int) -> T
 # Bullet trajectory calculation
 
 
-def trace_bullet_path(
+def bullet_reach(
     start_pos: Tuple[int, int],
     direction_vector: Tuple[int, int],
-    grid: List[List[str]],
+    game_map: CompiledMap,
     max_range: int = 50
-) -> List[Tuple[int, int]]:
+) -> int:
     """
-    Trace the path of a bullet until it hits a wall or edge.
+    Count how many cells a bullet travels beyond start_pos (one table lookup).
 
     Args:
         start_pos: (x, y) starting position
         direction_vector: (dx, dy) direction
-        grid: Map grid
+        game_map: Compiled map
         max_range: Maximum bullet travel distance
 
     Returns:
-        List of (x, y) positions the bullet travels through
+        Number of cells the bullet passes through
     """
-    path = []
-    current_pos = start_pos
-
-    for _ in range(max_range):
-        next_pos = add_vector(current_pos, direction_vector)
-
-        # Check if out of bounds
-        if not is_in_bounds(next_pos, len(grid[0]), len(grid)):
-            break
+    direction = DIRECTION_INDEX[direction_vector]
+    x, y = start_pos
+    if game_map.in_bounds(x, y):
+        reach = game_map.ray_length(x, y, direction)
+    else:
+        # Only a start just outside the map can re-enter it
+        x, y = add_vector(start_pos, direction_vector)
+        reach = 1 + game_map.ray_length(x, y, direction) if game_map.is_walkable(x, y) else 0
+    return min(reach, max_range)
 
-        x, y = next_pos
-        cell = grid[y][x]
 
-        # Hit a wall
-        if cell == '#':
-            break
+def trace_bullet_path(
+    start_pos: Tuple[int, int],
+    direction_vector: Tuple[int, int],
+    game_map: CompiledMap,
+    max_range: int = 50
+) -> List[Tuple[int, int]]:
+    """
+    Trace the path of a bullet until it hits a wall or edge.
 
-        # Add position to path
-        path.append(next_pos)
-        current_pos = next_pos
+    Args:
+        start_pos: (x, y) starting position
+        direction_vector: (dx, dy) direction
+        game_map: Compiled map
+        max_range: Maximum bullet travel distance
 
-    return path
+    Returns:
+        List of (x, y) positions the bullet travels through
+    """
+    (x, y), (dx, dy) = start_pos, direction_vector
+    reach = bullet_reach(start_pos, direction_vector, game_map, max_range)
+    return [(x + dx * i, y + dy * i) for i in range(1, reach + 1)]
 
 
 def check_bullet_hit(
@@ -160,26 +172,28 @@ def check_bullet_hit(
 def simulate_shot(
     shooter_pos: Tuple[int, int],
     direction_vector: Tuple[int, int],
-    grid: List[List[str]],
+    game_map: CompiledMap,
     target_positions: List[Tuple[int, int]]
 ) -> Optional[Tuple[int, int]]:
     """
     Simulate a shot and return hit position if any.
+    One ray-table lookup plus one pass over targets (no path walk).
 
     Args:
         shooter_pos: (x, y) shooter position
         direction_vector: (dx, dy) shoot direction
-        grid: Map grid
+        game_map: Compiled map
         target_positions: List of possible target positions
 
     Returns:
         Position of hit target, or None if no hit
     """
     # Bullet starts one cell away from shooter
-    bullet_start = add_vector(shooter_pos, direction_vector)
-
-    # Trace bullet path
-    path = trace_bullet_path(bullet_start, direction_vector, grid)
-
-    # Check for hits
-    return check_bullet_hit(path, target_positions)
+    (sx, sy), (dx, dy) = add_vector(shooter_pos, direction_vector), direction_vector
+    reach = bullet_reach((sx, sy), direction_vector, game_map)
+    hit, best = None, reach + 1
+    for tx, ty in target_positions:
+        steps = (tx - sx) * dx + (ty - sy) * dy
+        if 0 < steps < best and (tx - sx) * dy == (ty - sy) * dx:
+            hit, best = (tx, ty), steps
+    return hit
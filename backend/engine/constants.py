@@ -7,6 +7,7 @@ MAP_WIDTH = 50
 MAP_HEIGHT = 50
 VISION_SIZE = 5
 SOUND_RANGE = 3  # 7x7 grid = 3 cells in any direction
+TRACK_RANGE = 16  # Visible entities within this many path steps are tracked
 
 # HP settings
 INITIAL_HP = 5
@@ -2,40 +2,62 @@
 Core game engine.
 Handles tick execution, action processing, and state updates.
 """
-from typing import List, Dict, Tuple, Optional
-from backend.engine.state import WorldState, EntityState, BulletState
-from backend.engine.actions import (
-    is_move_action, is_shoot_action, is_wait_action,
-    get_direction_vector, get_direction_name, WAIT
-)
-from backend.engine.position import get_next_position, add_vector
-from backend.engine.hp import take_damage, is_dead
-from backend.engine.bullet import consume_ammo, recover_ammo, simulate_shot
-from backend.engine.observation import generate_observation, generate_sound_for_entity
-
-
-class GameEngine:
+from typing import Iterable, List, Dict, Optional, Tuple
+from backend.engine.state import WorldState
+from backend.engine.actions import is_move_action, is_shoot_action, WAIT
+from backend.engine.events import EventCode, TickEvent
+from backend.engine.fast_forward import FastForward
+from backend.engine.obs_cache import ObservationCache
+from backend.engine.occupancy import OccupancyIndex
+from backend.engine.profiler import make_profiler, record_aggregate
+from backend.engine.rules import EngineRules
+from backend.engine.sound import HearingGrid
+
+
+class GameEngine(EngineRules, ObservationCache, FastForward):
     """
     Core game engine managing world state and tick execution.
     """
 
-    def __init__(self, world: WorldState, agents: Optional[Dict[str, any]] = None):
+    def __init__(
+        self,
+        world: WorldState,
+        agents: Optional[Dict[str, any]] = None,
+        log_events: bool = True,
+        profile: Optional[bool] = None
+    ):
         """
         Initialize engine with a world state and agents.
 
         Args:
             world: Initial world state
             agents: Dict mapping entity_id to Agent instance (for AI agents)
+            log_events: Record tick events (disable for headless runs)
+            profile: Time each tick phase (default: CATAMAZE_PROFILE env var)
         """
         self.world = world
         self.agents = agents or {}
-        self.events: List[str] = []
-
-    def log_event(self, event: str):
-        """Add event to event log."""
-        self.events.append(event)
-
-    def tick(self) -> Dict[str, any]:
+        self.log_events = log_events
+        self.events: List[TickEvent] = []
+        self.occupancy = OccupancyIndex(world.entities)
+        self.hearing = HearingGrid(world.game_map.width, world.game_map.height)
+        self.profiler = make_profiler(profile)
+        self._init_observation_cache()
+
+    def log_event(
+        self,
+        code: EventCode,
+        entity_id: Optional[str],
+        params: Tuple[int, ...] = (),
+        target_id: Optional[str] = None
+    ):
+        """Record a structured event (text is rendered only when read)."""
+        if self._event_counts is not None:
+            self._event_counts[code] += 1
+        if self.log_events:
+            self.events.append(TickEvent(code, entity_id, params, target_id))
+
+    def tick(self, observe: Optional[Iterable[str]] = None) -> Dict[str, any]:
         """
         Execute one game tick.
         - Let AI agents decide actions
@@ -46,24 +68,47 @@ class GameEngine:
         - Check win/loss conditions
         - Generate observations
 
+        Args:
+            observe: Entity ids to build observations for (default: all
+                alive entities); dead or unknown ids are skipped
+
         Returns:
-            Dict with events and observations
+            Dict with events (TickEvent records) and observations, plus
+            per-phase seconds under "profile" when profiling
         """
+        prof = self.profiler
+        if prof:
+            prof.begin()
         self.events = []  # Clear events from last tick
 
+        # Rebuild the occupancy index (entities may have been edited between ticks)
+        self.occupancy = OccupancyIndex(self.world.entities)
+        self._drop_stale_observations()
+
         # Record shot positions for sound generation
         shot_positions = []
 
         # Phase 0: Let AI agents decide actions and queue them
-        for entity_id, agent in self.agents.items():
-            entity = self.world.entities.get(entity_id)
-            if entity and entity.alive and not self.world.game_over:
-                # Generate observation for this agent
-                obs = generate_observation(self.world, entity_id)
-                # Let agent decide action
-                action = agent.decide_action(obs)
-                # Queue the action
-                entity.action_queue.append(action)
+        deciding = {}
+        if not self.world.game_over:
+            for entity_id in self.agents:
+                entity = self.world.entities.get(entity_id)
+                if entity and entity.alive:
+                    deciding[entity_id] = None
+        # Observations for all deciding agents (reused from last tick's Phase 6 if unchanged)
+        decide_obs = self.observe_many(deciding)
+        # One batched decision per agent class
+        by_class = {}
+        for entity_id in deciding:
+            by_class.setdefault(type(self.agents[entity_id]), []).append(entity_id)
+        for agent_class, entity_ids in by_class.items():
+            actions = agent_class.decide_actions_batch(
+                [self.agents[eid] for eid in entity_ids], [decide_obs[eid] for eid in entity_ids]
+            )
+            for entity_id, action in zip(entity_ids, actions):
+                self.world.entities[entity_id].action_queue.append(action)
+        if prof:
+            prof.lap("decide")
 
         # Phase 1: Pop actions from queues
         entity_actions = {}
@@ -71,12 +116,14 @@ class GameEngine:
             if not entity.alive:
                 continue
 
-            if len(entity.action_queue) > 0:
-                action = entity.action_queue.pop(0)
+            if entity.action_queue:
+                action = entity.action_queue.popleft()
             else:
                 action = WAIT
 
             entity_actions[entity_id] = action
+        if prof:
+            prof.lap("pop")
 
         # Phase 2: Execute actions
         for entity_id, action in entity_actions.items():
@@ -89,123 +136,48 @@ class GameEngine:
                 shot_pos = (entity.x, entity.y)
                 shot_positions.append(shot_pos)
                 self._execute_shoot(entity, action)
+        if prof:
+            prof.lap("execute")
 
         # Phase 3: Recover ammo
         for entity in self.world.entities.values():
             if entity.alive:
                 self._recover_entity_ammo(entity)
+        if prof:
+            prof.lap("recover")
 
         # Phase 4: Check win conditions
         self._check_win_conditions()
+        if prof:
+            prof.lap("win_check")
 
         # Phase 5: Increment tick
         self.world.tick += 1
-
-        # Phase 6: Generate observations for all entities
-        observations = {}
-        for entity_id, entity in self.world.entities.items():
-            if entity.alive:
-                sound = generate_sound_for_entity(
-                    (entity.x, entity.y),
-                    shot_positions
-                )
-                obs = generate_observation(self.world, entity_id, sound)
-                observations[entity_id] = obs
-
-        return {
+        if prof:
+            prof.lap("advance")
+
+        # Phase 6: Generate observations for the requested entities
+        # Shots stamp the hearing grid; each listener does one lookup
+        self.hearing.clear()
+        for shot_pos in shot_positions:
+            self.hearing.stamp(shot_pos)
+        self._keep_current_observations()
+
+        entities = self.world.entities
+        observe_ids = entities if observe is None else observe
+        observations = self.observe_many({
+            entity_id: self.hearing.sound_at((entities[entity_id].x, entities[entity_id].y))
+            for entity_id in observe_ids
+            if entity_id in entities and entities[entity_id].alive
+        })
+
+        result = {
             "tick": self.world.tick,
             "events": self.events,
             "observations": observations
         }
-
-    def _execute_move(self, entity: EntityState, action: str):
-        """Execute a move action for an entity."""
-        direction_vector = get_direction_vector(action)
-        new_pos = get_next_position(
-            self.world.map_grid,
-            (entity.x, entity.y),
-            direction_vector
-        )
-
-        if (new_pos[0], new_pos[1]) != (entity.x, entity.y):
-            # Movement succeeded
-            entity.x, entity.y = new_pos
-            entity.visited_positions.add((entity.x, entity.y))
-            self.log_event(f"{entity.entity_id} moved to ({entity.x}, {entity.y})")
-        else:
-            # Hit a wall
-            self.log_event(f"{entity.entity_id} tried to move but hit a wall")
-
-    def _execute_shoot(self, entity: EntityState, action: str):
-        """Execute a shoot action for an entity."""
-        if entity.ammo <= 0:
-            self.log_event(f"{entity.entity_id} tried to shoot but out of ammo")
-            return
-
-        # Consume ammo
-        entity.ammo = consume_ammo(entity.ammo)
-        entity.last_bullet_tick = self.world.tick
-
-        direction_vector = get_direction_vector(action)
-        direction_name = get_direction_name(action)
-
-        # Get all alive entity positions as targets
-        target_positions = [
-            (e.x, e.y) for eid, e in self.world.entities.items()
-            if e.alive and eid != entity.entity_id
-        ]
-
-        # Simulate shot
-        hit_pos = simulate_shot(
-            (entity.x, entity.y),
-            direction_vector,
-            self.world.map_grid,
-            target_positions
-        )
-
-        if hit_pos:
-            # Find which entity was hit
-            for target_id, target in self.world.entities.items():
-                if target.alive and (target.x, target.y) == hit_pos:
-                    target.hp = take_damage(target.hp)
-                    self.log_event(
-                        f"{entity.entity_id} shot {target_id} at {hit_pos}. "
-                        f"{target_id} HP: {target.hp}"
-                    )
-
-                    if is_dead(target.hp):
-                        target.alive = False
-                        self.log_event(f"{target_id} died")
-                    break
-        else:
-            self.log_event(f"{entity.entity_id} shot {direction_name} but missed")
-
-    def _recover_entity_ammo(self, entity: EntityState):
-        """Recover ammo for an entity if conditions met."""
-        new_ammo, new_last_shot_tick = recover_ammo(
-            entity.ammo,
-            self.world.tick,
-            entity.last_bullet_tick
-        )
-
-        if new_ammo > entity.ammo:
-            entity.ammo = new_ammo
-            entity.last_bullet_tick = new_last_shot_tick
-            self.log_event(f"{entity.entity_id} recovered 1 ammo (total: {entity.ammo})")
-
-    def _check_win_conditions(self):
-        """Check if any entity has won or if game is over."""
-        player = self.world.entities.get("player")
-
-        if player:
-            # Check if player reached exit
-            if player.alive and player.x == self.world.exit_x and player.y == self.world.exit_y:
-                player.won = True
-                self.world.game_over = True
-                self.world.winner_id = "player"
-                self.log_event("Player reached the exit and won!")
-
-            # Check if player died
-            elif not player.alive:
-                self.world.game_over = True
-                self.log_event("Player died. Game over.")
+        if prof:
+            prof.lap("observe")
+            result["profile"] = prof.end()
+            record_aggregate(result["profile"])
+        return result
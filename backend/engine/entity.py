@@ -0,0 +1,155 @@
+"""
+Entity state.
+Compact slotted representation of a player or agent.
+"""
+from collections import deque
+from typing import Deque, Iterable, Dict, Optional, Any
+
+from .actions import Action
+
+from .constants import INITIAL_HP, INITIAL_AMMO, MAP_WIDTH, MAP_HEIGHT
+from .visited import VisitedCells
+
+
+class EntityState:
+    """
+    Represents a player or agent in the game.
+    Uses __slots__ and a visited-cell bitset to keep per-game memory small.
+    """
+
+    __slots__ = (
+        "entity_id", "entity_type", "persona",
+        "x", "y",
+        "hp", "ammo", "last_bullet_tick",
+        "alive", "won",
+        "action_queue", "visited_positions"
+    )
+
+    def __init__(
+        self,
+        entity_id: str,
+        entity_type: str,  # "player" or "agent"
+        persona: Optional[str],  # None for player, or "aggressive"/"cautious"/"explorer"
+        x: int,
+        y: int,
+        hp: int,
+        ammo: int,
+        last_bullet_tick: int,  # Tick when last bullet was fired
+        alive: bool,
+        won: bool,  # True if reached exit
+        action_queue: Optional[Iterable[int]] = None,
+        visited_positions: Optional[VisitedCells] = None  # For explorer penalty tracking
+    ):
+        self.entity_id = entity_id
+        self.entity_type = entity_type
+        self.persona = persona
+        self.x = x
+        self.y = y
+        self.hp = hp
+        self.ammo = ammo
+        self.last_bullet_tick = last_bullet_tick
+        self.alive = alive
+        self.won = won
+        self.action_queue: Deque[Action] = deque(action_queue or ())
+        self.visited_positions = visited_positions if visited_positions is not None else VisitedCells()
+
+    def __repr__(self) -> str:
+        return (
+            f"EntityState({self.entity_id!r}, pos=({self.x}, {self.y}), "
+            f"hp={self.hp}, ammo={self.ammo}, alive={self.alive})"
+        )
+
+    def copy(self) -> 'EntityState':
+        """Independent copy (own queue and visited bitset)."""
+        clone = EntityState.__new__(EntityState)
+        for name in _PLAIN_SLOTS:
+            setattr(clone, name, getattr(self, name))
+        clone.action_queue = self.action_queue.copy()
+        clone.visited_positions = self.visited_positions.copy()
+        return clone
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to dict for database storage."""
+        return {
+            "entity_id": self.entity_id,
+            "entity_type": self.entity_type,
+            "persona": self.persona,
+            "x": self.x,
+            "y": self.y,
+            "hp": self.hp,
+            "ammo": self.ammo,
+            "last_bullet_tick": self.last_bullet_tick,
+            "alive": self.alive,
+            "won": self.won,
+            "action_queue": [int(action) for action in self.action_queue],
+            "visited_positions": self.visited_positions.to_dict()
+        }
+
+    @staticmethod
+    def from_dict(data: Dict[str, Any]) -> 'EntityState':
+        """
+        Deserialize from dict.
+        Accepts legacy saves with action names in the queue and
+        visited positions as a list of pairs.
+        """
+        return EntityState(
+            entity_id=data["entity_id"],
+            entity_type=data["entity_type"],
+            persona=data.get("persona"),
+            x=data["x"],
+            y=data["y"],
+            hp=data["hp"],
+            ammo=data["ammo"],
+            last_bullet_tick=data["last_bullet_tick"],
+            alive=data["alive"],
+            won=data["won"],
+            action_queue=[_load_action(a) for a in data.get("action_queue", [])],
+            visited_positions=VisitedCells.from_data(data.get("visited_positions"))
+        )
+
+
+# Immutable-valued slots that copy() can share
+_PLAIN_SLOTS = tuple(s for s in EntityState.__slots__ if s not in ("action_queue", "visited_positions"))
+
+
+def _load_action(value: Any) -> Action:
+    """Stored queue entry (code, or action name in older saves) -> Action."""
+    return Action[value] if isinstance(value, str) else Action(value)
+
+
+def create_entity(
+    entity_id: str,
+    entity_type: str,
+    x: int,
+    y: int,
+    persona: Optional[str] = None,
+    map_width: int = MAP_WIDTH,
+    map_height: int = MAP_HEIGHT
+) -> EntityState:
+    """
+    Create a new entity with initial stats.
+
+    Args:
+        entity_id: Unique ID
+        entity_type: "player" or "agent"
+        x, y: Starting position
+        persona: Optional persona for agents
+        map_width, map_height: Map size for the visited-cell bitset
+
+    Returns:
+        EntityState with default stats
+    """
+    return EntityState(
+        entity_id=entity_id,
+        entity_type=entity_type,
+        persona=persona,
+        x=x,
+        y=y,
+        hp=INITIAL_HP,
+        ammo=INITIAL_AMMO,
+        last_bullet_tick=0,
+        alive=True,
+        won=False,
+        action_queue=None,
+        visited_positions=VisitedCells(map_width, map_height)
+    )
@@ -0,0 +1,78 @@
+"""
+Structured tick events.
+Events are recorded as small typed tuples and rendered to text on demand.
+"""
+from enum import IntEnum
+from typing import NamedTuple, Optional, Tuple, List, Dict, Any
+
+from backend.engine.actions import DIRECTION_NAMES
+
+
+class EventCode(IntEnum):
+    """Kinds of tick events."""
+    MOVED = 1           # params: (x, y)
+    HIT_WALL = 2        # params: ()
+    OUT_OF_AMMO = 3     # params: ()
+    SHOT_HIT = 4        # params: (x, y, target_hp), target_id set
+    SHOT_MISSED = 5     # params: (direction index,)
+    DIED = 6            # params: ()
+    AMMO_RECOVERED = 7  # params: (ammo,)
+    PLAYER_WON = 8      # params: ()
+    PLAYER_DIED = 9     # params: ()
+
+
+_TEMPLATES = {
+    EventCode.MOVED: "{eid} moved to ({p[0]}, {p[1]})",
+    EventCode.HIT_WALL: "{eid} tried to move but hit a wall",
+    EventCode.OUT_OF_AMMO: "{eid} tried to shoot but out of ammo",
+    EventCode.SHOT_HIT: "{eid} shot {tid} at ({p[0]}, {p[1]}). {tid} HP: {p[2]}",
+    EventCode.SHOT_MISSED: "{eid} shot {direction} but missed",
+    EventCode.DIED: "{eid} died",
+    EventCode.AMMO_RECOVERED: "{eid} recovered 1 ammo (total: {p[0]})",
+    EventCode.PLAYER_WON: "Player reached the exit and won!",
+    EventCode.PLAYER_DIED: "Player died. Game over.",
+}
+
+
+class TickEvent(NamedTuple):
+    """
+    One game event: code, acting entity, small int params and optional target.
+    """
+    code: EventCode
+    entity_id: Optional[str]
+    params: Tuple[int, ...] = ()
+    target_id: Optional[str] = None
+
+    def render(self) -> str:
+        """Format the event as the human-readable log line."""
+        direction = DIRECTION_NAMES[self.params[0]] if self.code == EventCode.SHOT_MISSED else None
+        return _TEMPLATES[self.code].format(
+            eid=self.entity_id, tid=self.target_id, p=self.params, direction=direction
+        )
+
+    def __str__(self) -> str:
+        return self.render()
+
+    def to_log_fields(self) -> Dict[str, Any]:
+        """Fields stored in the log table (text is rendered when read)."""
+        return {
+            "entity_id": self.entity_id,
+            "extra_data": {
+                "code": self.code.name.lower(), "params": list(self.params), "target_id": self.target_id
+            }
+        }
+
+    @staticmethod
+    def from_log_fields(entity_id: Optional[str], extra_data: Optional[Dict]) -> Optional['TickEvent']:
+        """Rebuild an event from stored log fields; None if not a tick event."""
+        if not isinstance(extra_data, dict) or not isinstance(extra_data.get("code"), str):
+            return None
+        code = EventCode.__members__.get(extra_data["code"].upper())
+        if code is None:
+            return None
+        return TickEvent(code, entity_id, tuple(extra_data.get("params", ())), extra_data.get("target_id"))
+
+
+def render_events(events: List[TickEvent]) -> List[str]:
+    """Render a list of events to text lines."""
+    return [event.render() for event in events]
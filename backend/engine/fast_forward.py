@@ -0,0 +1,82 @@
+"""
+Multi-tick fast-forward for GameEngine.
+Plays many ticks per call and returns only the final state and counters.
+"""
+from collections import Counter
+from typing import Any, Callable, Dict, Optional
+
+from backend.engine.sound import HearingGrid
+from backend.engine.state import WorldState
+
+OBSERVE_MODES = ("final", "none")
+
+
+class FastForward:
+    """
+    run() shared by the engine.
+    Subclasses provide self.world, self.log_events, self.hearing, tick()
+    and observe().
+    """
+
+    world: WorldState
+    log_events: bool
+    hearing: HearingGrid
+    _event_counts: Optional[Counter] = None
+
+    def run(
+        self,
+        max_ticks: int,
+        until: Optional[Callable[[WorldState], bool]] = None,
+        observe: str = "final"
+    ) -> Dict[str, Any]:
+        """
+        Advance up to max_ticks ticks, stopping early at game over or when
+        until(world) is true after a tick. Intermediate observations and
+        event records are not built; events are only counted.
+
+        Args:
+            max_ticks: Maximum number of ticks to run
+            until: Optional stop predicate checked after each tick
+            observe: "final" for observations of alive entities after the
+                last tick, "none" to skip them
+
+        Returns:
+            Dict with tick, ticks_run, game_over, winner_id, event counts
+            (by lower-case event name) and observations
+
+        Raises:
+            ValueError: If observe is not a known mode
+        """
+        if observe not in OBSERVE_MODES:
+            raise ValueError(f"observe must be one of {OBSERVE_MODES}, got {observe!r}")
+
+        world = self.world
+        counts: Counter = Counter()
+        saved_log_events = self.log_events
+        self.log_events, self._event_counts = False, counts
+        ticks_run = 0
+        try:
+            while ticks_run < max_ticks and not world.game_over:
+                self.tick(observe=())
+                ticks_run += 1
+                if until is not None and until(world):
+                    break
+        finally:
+            self.log_events, self._event_counts = saved_log_events, None
+
+        observations = {}
+        if observe == "final":
+            observations = self.observe_many({
+                eid: self.hearing.sound_at((entity.x, entity.y))
+                for eid, entity in world.entities.items()
+                if entity.alive
+            })
+
+        return {
+            "tick": world.tick,
+            "ticks_run": ticks_run,
+            "game_over": world.game_over,
+            "winner_id": world.winner_id,
+            "events": {code.name.lower(): n for code, n in sorted(counts.items())},
+            "observations": observations
+        }
@@ -1,11 +1,22 @@
 """
 Extract local 5x5 vision from global map.
+The map's chunks are pre-padded with walls by VISION_SIZE // 2, so a vision
+window is a single array slice; visions for many entities are gathered at once.
 """
-from typing import List, Tuple, Dict
+from typing import List, Tuple, Dict, Sequence
+
+import numpy as np
+
+from backend.engine.occupancy import OccupancyIndex
+from backend.maps.compiled import CompiledMap, WALL
+
+SELF_MARK = ord('@')
+OTHER_MARK = ord('P')
+_WALL_MARK = ord(WALL)
 
 
 def extract_local_vision(
-    grid: List[List[str]],
+    game_map: CompiledMap,
     center_pos: Tuple[int, int],
     vision_size: int = 5
 ) -> List[List[str]]:
@@ -14,7 +25,7 @@ def extract_local_vision(
     Out-of-bounds cells are filled with '#' (wall).
 
     Args:
-        grid: Full 50x50 map
+        game_map: Compiled map
         center_pos: (x, y) center position
         vision_size: Size of vision grid (default 5, must be odd)
 
@@ -27,29 +38,43 @@ def extract_local_vision(
     if vision_size % 2 == 0:
         raise ValueError(f"vision_size must be odd, got {vision_size}")
 
-    cx, cy = center_pos
-    radius = vision_size // 2
+    return game_map.window(center_pos[0], center_pos[1], vision_size // 2)
 
-    height = len(grid)
-    width = len(grid[0]) if height > 0 else 0
 
-    vision = []
-    for dy in range(-radius, radius + 1):
-        row = []
-        for dx in range(-radius, radius + 1):
-            x = cx + dx
-            y = cy + dy
+def render_visions(
+    game_map: CompiledMap,
+    entity_ids: Sequence[str],
+    positions: Sequence[Tuple[int, int]],
+    occupancy: OccupancyIndex,
+    vision_size: int = 5
+) -> np.ndarray:
+    """
+    Rendered visions for several entities at once.
+    Windows come from one batched gather over the padded map; '@' marks each
+    viewer and 'P' every other indexed (alive) entity in its window, except
+    on walls. Same result as get_vision_for_entity() per entity.
 
-            # Check bounds
-            if 0 <= x < width and 0 <= y < height:
-                row.append(grid[y][x])
-            else:
-                # Out of bounds = wall
-                row.append('#')
+    Args:
+        game_map: Compiled map
+        entity_ids: Viewing entities
+        positions: (x, y) of each viewer
+        occupancy: Index of alive entities
+        vision_size: Size of vision grid (odd)
 
-        vision.append(row)
+    Returns:
+        (E, vision_size, vision_size) uint8 array of cell characters
+    """
+    radius = vision_size // 2
+    visions = game_map.cell_chunks.windows(positions, radius)
+    visions[:, radius, radius] = SELF_MARK
 
-    return vision
+    # Marks come from the occupancy index; a viewer never marks itself
+    for view, entity_id, (cx, cy) in zip(visions, entity_ids, positions):
+        for other_id, (ox, oy) in occupancy.in_window(cx, cy, radius):
+            vy, vx = radius + oy - cy, radius + ox - cx
+            if other_id != entity_id and view[vy, vx] != _WALL_MARK:
+                view[vy, vx] = OTHER_MARK
+    return visions
 
 
 def render_vision_with_entities(
@@ -102,7 +127,7 @@ def render_vision_with_entities(
 
 
 def get_vision_for_entity(
-    grid: List[List[str]],
+    game_map: CompiledMap,
     entity_pos: Tuple[int, int],
     all_entities: Dict[str, Tuple[int, int]],
     entity_id: str,
@@ -112,7 +137,7 @@ def get_vision_for_entity(
     Get complete vision for an entity, including other entities.
 
     Args:
-        grid: Full map
+        game_map: Compiled map
         entity_pos: (x, y) position of the entity
         all_entities: Dict of {entity_id: (x, y)} for all entities
         entity_id: ID of the entity viewing
@@ -122,7 +147,7 @@ def get_vision_for_entity(
         Rendered vision with '@' for self, 'P' for others
     """
     # Extract base vision
-    vision = extract_local_vision(grid, entity_pos, vision_size)
+    vision = extract_local_vision(game_map, entity_pos, vision_size)
 
     # Get other entities (exclude self)
     other_entities = {
@@ -0,0 +1,84 @@
+"""
+Per-tick observation cache used by GameEngine.
+Each observation is built at most once per (tick, entity, sound).
+"""
+from typing import Any, Dict, Optional, Tuple
+
+from backend.engine.state import WorldState
+from backend.engine.observation import generate_observations
+from backend.engine.occupancy import OccupancyIndex
+
+
+class ObservationCache:
+    """
+    Observation caching shared by the engine.
+    Subclasses provide self.world and self.occupancy.
+    """
+
+    world: WorldState
+    occupancy: OccupancyIndex
+
+    def _init_observation_cache(self):
+        """Start with an empty cache."""
+        # Valid while the world signature is unchanged
+        self._obs_cache: Dict[Tuple[int, str, Optional[str]], Dict[str, Any]] = {}
+        self._obs_signature: Optional[tuple] = None
+
+    def _world_signature(self) -> tuple:
+        """Everything an observation depends on besides tick and sound."""
+        return (self.world.game_over,) + tuple(
+            (e.x, e.y, e.hp, e.ammo, e.alive, e.won) for e in self.world.entities.values()
+        )
+
+    def _drop_stale_observations(self):
+        """Called at tick start: forget everything if the world was edited."""
+        if self._world_signature() != self._obs_signature:
+            self._obs_cache.clear()
+
+    def _keep_current_observations(self):
+        """Called after the tick advanced: keep only this tick's entries."""
+        tick = self.world.tick
+        self._obs_cache = {k: v for k, v in self._obs_cache.items() if k[0] == tick}
+        self._obs_signature = self._world_signature()
+
+    def invalidate_observations(self):
+        """
+        Drop cached observations.
+        tick() does this itself when entities changed between ticks; call it
+        after editing the world if observe() is used outside tick().
+        """
+        self._obs_cache.clear()
+        self._obs_signature = None
+
+    def observe(self, entity_id: str, sound: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Observation for an entity at the current tick, built at most once.
+
+        Args:
+            entity_id: Entity to observe
+            sound: Sound heard this tick (None if nothing)
+
+        Returns:
+            Observation dict (shared; callers must not mutate it)
+        """
+        return self.observe_many({entity_id: sound})[entity_id]
+
+    def observe_many(self, sounds: Dict[str, Optional[str]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Observations for several entities at the current tick; the ones
+        not cached yet are built in one batch.
+
+        Args:
+            sounds: entity_id -> sound heard this tick (None if nothing)
+
+        Returns:
+            Dict of entity_id -> observation dict (shared; callers must not
+            mutate them)
+        """
+        tick = self.world.tick
+        missing = [eid for eid, sound in sounds.items() if (tick, eid, sound) not in self._obs_cache]
+        if missing:
+            built = generate_observations(self.world, missing, sounds, self.occupancy)
+            for eid in missing:
+                self._obs_cache[(tick, eid, sounds[eid])] = built[eid]
+        return {eid: self._obs_cache[(tick, eid, sound)] for eid, sound in sounds.items()}
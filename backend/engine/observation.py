@@ -2,17 +2,24 @@
 Observation generation for entities.
 Creates the observation dict that entities see.
 """
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+
+import numpy as np
+
 from backend.engine.state import WorldState, EntityState
-from backend.engine.local_map import get_vision_for_entity
+from backend.engine.local_map import OTHER_MARK, render_visions
+from backend.engine.occupancy import OccupancyIndex
+from backend.maps.compiled import cells_to_rows
+from backend.maps.distance import UNREACHABLE, get_distance_fields
 from backend.engine.position import is_in_range
-from backend.engine.constants import SOUND_RANGE
+from backend.engine.constants import SOUND_RANGE, TRACK_RANGE, VISION_SIZE, MAP_WIDTH, MAP_HEIGHT
 
 
 def generate_observation(
     world: WorldState,
     entity_id: str,
-    last_sound: Optional[str] = None
+    last_sound: Optional[str] = None,
+    occupancy: Optional[OccupancyIndex] = None
 ) -> Dict[str, Any]:
     """
     Generate observation for an entity.
@@ -21,45 +28,104 @@ def generate_observation(
         world: Current world state
         entity_id: ID of the entity to generate observation for
         last_sound: Optional last sound heard
+        occupancy: Engine's occupancy index (built on the fly if omitted)
 
     Returns:
         Observation dict with vision, stats, and status
     """
-    entity = world.entities[entity_id]
+    return generate_observations(world, [entity_id], {entity_id: last_sound}, occupancy)[entity_id]
 
-    # Get all entity positions for vision rendering
-    all_positions = {
-        eid: (e.x, e.y)
-        for eid, e in world.entities.items()
-        if e.alive  # Only show alive entities
-    }
 
-    # Generate vision
-    vision = get_vision_for_entity(
-        world.map_grid,
-        (entity.x, entity.y),
-        all_positions,
-        entity_id
-    )
+def generate_observations(
+    world: WorldState,
+    entity_ids: Sequence[str],
+    sounds: Optional[Dict[str, Optional[str]]] = None,
+    occupancy: Optional[OccupancyIndex] = None
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Generate observations for several entities, rendering all visions in
+    one batch (see local_map.render_visions).
+
+    Args:
+        world: Current world state
+        entity_ids: Entities to observe
+        sounds: Last sound heard per entity (missing ids hear nothing)
+        occupancy: Engine's occupancy index (built on the fly if omitted)
 
-    # Build observation
-    obs = {
-        "entity_id": entity_id,
-        "hp": entity.hp,
-        "ammo": entity.ammo,
-        "time": world.tick,
-        "position": {
-            "x": entity.x,
-            "y": entity.y
-        },
-        "vision": vision,
-        "last_sound": last_sound,
-        "alive": entity.alive,
-        "won": entity.won,
-        "game_over": world.game_over
+    Returns:
+        Dict of entity_id -> observation dict (same as generate_observation)
+    """
+    if occupancy is None:
+        occupancy = OccupancyIndex(world.entities)
+    sounds = sounds or {}
+    entities = [world.entities[eid] for eid in entity_ids]
+
+    # Only alive entities inside each vision window are rendered
+    visions = render_visions(
+        world.game_map, entity_ids, [(e.x, e.y) for e in entities], occupancy, VISION_SIZE
+    )
+    map_size = {"width": world.game_map.width, "height": world.game_map.height}
+    tracked = _track_visible(world, entities, visions)
+
+    return {
+        entity_id: {
+            "entity_id": entity_id,
+            "hp": entity.hp,
+            "ammo": entity.ammo,
+            "time": world.tick,
+            "position": {
+                "x": entity.x,
+                "y": entity.y
+            },
+            "vision": cells_to_rows(vision),
+            "move_mask": world.game_map.move_mask(entity.x, entity.y),
+            "entities": others,
+            "map_size": dict(map_size),
+            "last_sound": sounds.get(entity_id),
+            "alive": entity.alive,
+            "won": entity.won,
+            "game_over": world.game_over
+        }
+        for entity_id, entity, vision, others in zip(entity_ids, entities, visions, tracked)
     }
 
-    return obs
+
+def _track_visible(
+    world: WorldState,
+    entities: Sequence[EntityState],
+    visions: np.ndarray
+) -> List[List[Dict[str, Any]]]:
+    """
+    Other entities marked in each vision that are at most TRACK_RANGE
+    walking steps away (map distance fields, not straight-line distance),
+    nearest first, with the direction index (UP, DOWN, LEFT, RIGHT) of the
+    first step of a shortest path to them (None on the same cell).
+    """
+    tracked: List[List[Dict[str, Any]]] = [[] for _ in entities]
+    marks = np.argwhere(visions == OTHER_MARK)
+    if not len(marks):
+        return tracked
+
+    fields = get_distance_fields(world.game_map)
+    radius = visions.shape[1] // 2
+    for i, vy, vx in marks.tolist():
+        pos = (entities[i].x, entities[i].y)
+        other = (pos[0] + vx - radius, pos[1] + vy - radius)
+        steps = fields.distance(pos, other, TRACK_RANGE)
+        if steps != UNREACHABLE:
+            tracked[i].append({
+                "relative_x": vx - radius, "relative_y": vy - radius, "distance": steps,
+                "direction": fields.step_toward(pos, other, TRACK_RANGE) if steps else None
+            })
+    for others in tracked:
+        others.sort(key=lambda other: other["distance"])
+    return tracked
+
+
+def get_map_size(observation: Dict[str, Any]) -> Tuple[int, int]:
+    """(width, height) from an observation (the default map size if absent)."""
+    size = observation.get("map_size") or {}
+    return size.get("width", MAP_WIDTH), size.get("height", MAP_HEIGHT)
 
 
 def check_sound_in_range(
@@ -85,6 +151,8 @@ def generate_sound_for_entity(
 ) -> Optional[str]:
     """
     Generate sound observation for an entity based on nearby shots.
+    Checks each shot; the engine resolves all listeners at once with
+    sound.HearingGrid instead.
 
     Args:
         entity_pos: (x, y) position of the entity
@@ -0,0 +1,105 @@
+"""
+Spatial occupancy index.
+Maps positions to the alive entities standing on them.
+"""
+from typing import Dict, List, Tuple, Iterator, Optional
+
+from backend.engine.state import EntityState
+
+Position = Tuple[int, int]
+
+
+class OccupancyIndex:
+    """
+    Position -> entity ids index, kept in world entity order so that
+    "first entity on a cell" matches iteration over world.entities.
+    Only alive entities are indexed.
+    """
+
+    def __init__(self, entities: Dict[str, EntityState]):
+        """
+        Build the index from the current entities.
+
+        Args:
+            entities: world.entities (insertion order is preserved)
+        """
+        self._order = {eid: i for i, eid in enumerate(entities)}
+        self._cells: Dict[Position, List[str]] = {}
+        for eid, entity in entities.items():
+            if entity.alive:
+                self.add(eid, (entity.x, entity.y))
+
+    def add(self, entity_id: str, pos: Position):
+        """Index an entity at a position."""
+        ids = self._cells.setdefault(pos, [])
+        rank = self._order[entity_id]
+        i = 0
+        while i < len(ids) and self._order[ids[i]] < rank:
+            i += 1
+        ids.insert(i, entity_id)
+
+    def remove(self, entity_id: str, pos: Position):
+        """Remove an entity from a position (no-op if not indexed there)."""
+        ids = self._cells.get(pos)
+        if ids and entity_id in ids:
+            ids.remove(entity_id)
+            if not ids:
+                del self._cells[pos]
+
+    def move(self, entity_id: str, old_pos: Position, new_pos: Position):
+        """Move an indexed entity between positions."""
+        self.remove(entity_id, old_pos)
+        self.add(entity_id, new_pos)
+
+    def at(self, pos: Position) -> List[str]:
+        """Entity ids at a position, in world order."""
+        return self._cells.get(pos, [])
+
+    def in_window(self, cx: int, cy: int, radius: int) -> Iterator[Tuple[str, Position]]:
+        """
+        Yield (entity_id, pos) for entities within a Chebyshev radius.
+        Walks whichever is smaller: the window cells or the occupied cells.
+        """
+        side = 2 * radius + 1
+        if side * side < len(self._cells):
+            for y in range(cy - radius, cy + radius + 1):
+                for x in range(cx - radius, cx + radius + 1):
+                    for eid in self._cells.get((x, y), ()):
+                        yield eid, (x, y)
+        else:
+            for (x, y), ids in self._cells.items():
+                if abs(x - cx) <= radius and abs(y - cy) <= radius:
+                    for eid in ids:
+                        yield eid, (x, y)
+
+    def first_on_ray(
+        self,
+        start_pos: Position,
+        direction_vector: Tuple[int, int],
+        reach: int
+    ) -> Optional[Position]:
+        """
+        Find the nearest occupied cell among the `reach` cells after start_pos.
+
+        Args:
+            start_pos: (x, y) cell the ray starts from (not checked)
+            direction_vector: (dx, dy) direction
+            reach: Number of cells the ray covers (from bullet_reach)
+
+        Returns:
+            Position of the first occupied cell, or None
+        """
+        (sx, sy), (dx, dy) = start_pos, direction_vector
+        if reach <= len(self._cells):
+            for i in range(1, reach + 1):
+                pos = (sx + dx * i, sy + dy * i)
+                if pos in self._cells:
+                    return pos
+            return None
+
+        hit, best = None, reach + 1
+        for (tx, ty) in self._cells:
+            steps = (tx - sx) * dx + (ty - sy) * dy
+            if 0 < steps < best and (tx - sx) * dy == (ty - sy) * dx:
+                hit, best = (tx, ty), steps
+        return hit
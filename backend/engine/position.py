@@ -1,7 +1,10 @@
 """
 Position calculations and movement validation.
 """
-from typing import Tuple, List
+from typing import Tuple
+
+from backend.engine.constants import MAP_WIDTH, MAP_HEIGHT
+from backend.maps.compiled import CompiledMap
 
 
 def add_vector(pos: Tuple[int, int], vector: Tuple[int, int]) -> Tuple[int, int]:
@@ -18,14 +21,14 @@ def add_vector(pos: Tuple[int, int], vector: Tuple[int, int]) -> Tuple[int, int]
     return (pos[0] + vector[0], pos[1] + vector[1])
 
 
-def is_in_bounds(pos: Tuple[int, int], width: int = 50, height: int = 50) -> bool:
+def is_in_bounds(pos: Tuple[int, int], width: int = MAP_WIDTH, height: int = MAP_HEIGHT) -> bool:
     """
     Check if position is within map bounds.
 
     Args:
         pos: (x, y) position
-        width: Map width (default 50)
-        height: Map height (default 50)
+        width: Map width (default MAP_WIDTH)
+        height: Map height (default MAP_HEIGHT)
 
     Returns:
         True if in bounds, False otherwise
@@ -34,41 +37,36 @@ def is_in_bounds(pos: Tuple[int, int], width: int = 50, height: int = 50) -> boo
     return 0 <= x < width and 0 <= y < height
 
 
-def is_walkable(grid: List[List[str]], pos: Tuple[int, int]) -> bool:
+def is_walkable(game_map: CompiledMap, pos: Tuple[int, int]) -> bool:
     """
     Check if a position is walkable (not a wall).
 
     Args:
-        grid: 2D map array
+        game_map: Compiled map
         pos: (x, y) position to check
 
     Returns:
         True if walkable (not '#'), False if wall or out of bounds
     """
-    if not is_in_bounds(pos, len(grid[0]), len(grid)):
-        return False
-
-    x, y = pos
-    cell = grid[y][x]
-    return cell != '#'
+    return game_map.is_walkable(pos[0], pos[1])
 
 
-def can_move_to(grid: List[List[str]], pos: Tuple[int, int]) -> bool:
+def can_move_to(game_map: CompiledMap, pos: Tuple[int, int]) -> bool:
     """
     Check if entity can move to a position.
 
     Args:
-        grid: 2D map array
+        game_map: Compiled map
         pos: (x, y) target position
 
     Returns:
         True if can move (in bounds and walkable), False otherwise
     """
-    return is_in_bounds(pos, len(grid[0]), len(grid)) and is_walkable(grid, pos)
+    return game_map.is_walkable(pos[0], pos[1])
 
 
 def get_next_position(
-    grid: List[List[str]],
+    game_map: CompiledMap,
     current_pos: Tuple[int, int],
     direction_vector: Tuple[int, int]
 ) -> Tuple[int, int]:
@@ -77,7 +75,7 @@ def get_next_position(
     If the target is blocked, returns current position (no movement).
 
     Args:
-        grid: 2D map array
+        game_map: Compiled map
         current_pos: (x, y) current position
         direction_vector: (dx, dy) direction to move
 
@@ -86,7 +84,7 @@ def get_next_position(
     """
     target_pos = add_vector(current_pos, direction_vector)
 
-    if can_move_to(grid, target_pos):
+    if game_map.is_walkable(target_pos[0], target_pos[1]):
         return target_pos
     else:
         # Blocked, stay in current position
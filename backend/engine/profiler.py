@@ -0,0 +1,130 @@
+"""
+Per-phase tick profiler.
+Records wall time and call counts per GameEngine.tick phase, with a
+log-scale histogram, per engine and in a process-wide aggregate.
+"""
+import os
+import threading
+import time
+from typing import Dict, Any, Optional
+
+# Phase names, in tick order
+PHASES = ("decide", "pop", "execute", "recover", "win_check", "advance", "observe")
+
+# Histogram bucket upper edges in microseconds (last bucket is open-ended)
+BUCKET_EDGES_US = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 25000)
+
+PROFILE_ENV_VAR = "CATAMAZE_PROFILE"
+
+
+def profiling_enabled_by_env() -> bool:
+    """True if CATAMAZE_PROFILE is set to a truthy value."""
+    return os.environ.get(PROFILE_ENV_VAR, "").lower() in ("1", "true", "yes", "on")
+
+
+def _bucket(seconds: float) -> int:
+    """Histogram bucket index for a duration."""
+    us = seconds * 1e6
+    for i, edge in enumerate(BUCKET_EDGES_US):
+        if us < edge:
+            return i
+    return len(BUCKET_EDGES_US)
+
+
+class TickProfiler:
+    """
+    Accumulates per-phase timings. Use begin(), then lap(phase) after each
+    phase, then end() to get this tick's timings.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._last = 0.0
+        self._laps: Dict[str, float] = {}
+        self.reset()
+
+    def reset(self):
+        """Clear all recorded timings."""
+        with self._lock:
+            self.ticks = 0
+            self.seconds = {phase: 0.0 for phase in PHASES}
+            self.calls = {phase: 0 for phase in PHASES}
+            self.histogram = {phase: [0] * (len(BUCKET_EDGES_US) + 1) for phase in PHASES}
+
+    def begin(self):
+        """Start timing a tick."""
+        self._laps = {}
+        self._last = time.perf_counter()
+
+    def lap(self, phase: str):
+        """Attribute the time since the previous lap (or begin) to a phase."""
+        now = time.perf_counter()
+        self._laps[phase] = now - self._last
+        self._last = now
+
+    def end(self) -> Dict[str, float]:
+        """Finish the tick, record it, and return its phase seconds."""
+        laps = self._laps
+        self.record_tick(laps)
+        return laps
+
+    def record_tick(self, laps: Dict[str, float]):
+        """Add one tick's phase seconds to the totals and histogram."""
+        with self._lock:
+            self.ticks += 1
+            for phase, seconds in laps.items():
+                self.seconds[phase] += seconds
+                self.calls[phase] += 1
+                self.histogram[phase][_bucket(seconds)] += 1
+
+    def merge(self, other: Dict[str, Any]):
+        """Add a summary() from another profiler (e.g. another process)."""
+        with self._lock:
+            self.ticks += other["ticks"]
+            for phase, stats in other["phases"].items():
+                self.seconds[phase] += stats["seconds"]
+                self.calls[phase] += stats["calls"]
+                self.histogram[phase] = [a + b for a, b in zip(self.histogram[phase], stats["histogram"])]
+
+    def summary(self) -> Dict[str, Any]:
+        """Totals, mean and histogram per phase (JSON-serializable)."""
+        with self._lock:
+            return {
+                "ticks": self.ticks,
+                "bucket_edges_us": list(BUCKET_EDGES_US),
+                "phases": {
+                    phase: {
+                        "seconds": self.seconds[phase],
+                        "calls": self.calls[phase],
+                        "mean_us": 1e6 * self.seconds[phase] / self.calls[phase] if self.calls[phase] else 0.0,
+                        "histogram": list(self.histogram[phase])
+                    }
+                    for phase in PHASES
+                }
+            }
+
+
+# Process-wide aggregate fed by every profiling engine
+_AGGREGATE = TickProfiler()
+
+
+def record_aggregate(laps: Dict[str, float]):
+    """Add one tick to the process-wide aggregate."""
+    _AGGREGATE.record_tick(laps)
+
+
+def get_aggregate_profile() -> Dict[str, Any]:
+    """Summary of all profiled ticks in this process."""
+    return _AGGREGATE.summary()
+
+
+def reset_aggregate_profile():
+    """Clear the process-wide aggregate."""
+    _AGGREGATE.reset()
+
+
+def make_profiler(enabled: Optional[bool]) -> Optional[TickProfiler]:
+    """Profiler for a new engine: None when off (default: from the env var)."""
+    if enabled is None:
+        enabled = profiling_enabled_by_env()
+    return TickProfiler() if enabled else None
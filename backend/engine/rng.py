@@ -0,0 +1,39 @@
+"""
+Seeded random streams.
+Every game has a seed; each consumer (spawning, each agent) derives its own
+numpy Generator from it so runs can be replayed exactly.
+"""
+import secrets
+import zlib
+from typing import Union
+
+import numpy as np
+
+Key = Union[int, str]
+
+
+def new_seed() -> int:
+    """Fresh 63-bit seed for a new game."""
+    return secrets.randbits(63)
+
+
+def _key_entropy(key: Key) -> int:
+    """Stable non-negative integer for a stream key (str keys via CRC32)."""
+    if isinstance(key, str):
+        return zlib.crc32(key.encode("utf-8"))
+    return int(key) & 0xFFFFFFFFFFFFFFFF
+
+
+def derive_rng(seed: int, *keys: Key) -> np.random.Generator:
+    """
+    Independent random stream for (seed, *keys).
+
+    Args:
+        seed: Game seed (WorldState.seed)
+        keys: Stream name parts, e.g. ("agent", entity_id)
+
+    Returns:
+        numpy Generator; identical inputs always give identical streams
+    """
+    entropy = [_key_entropy(seed)] + [_key_entropy(key) for key in keys]
+    return np.random.default_rng(np.random.SeedSequence(entropy))
@@ -0,0 +1,103 @@
+"""
+Per-action game rules used by GameEngine.
+Movement, shooting, ammo recovery and win conditions.
+"""
+from backend.engine.state import WorldState, EntityState
+from backend.engine.actions import get_direction_vector, DIRECTION_INDEX_FROM_ACTION
+from backend.engine.events import EventCode
+from backend.engine.position import add_vector
+from backend.engine.hp import take_damage, is_dead
+from backend.engine.bullet import consume_ammo, recover_ammo, bullet_reach
+from backend.engine.occupancy import OccupancyIndex
+
+
+class EngineRules:
+    """
+    Action execution shared by the engine.
+    Subclasses provide self.world, self.occupancy and log_event().
+    """
+
+    world: WorldState
+    occupancy: OccupancyIndex
+
+    def _execute_move(self, entity: EntityState, action: int):
+        """Execute a move action for an entity."""
+        old_pos = (entity.x, entity.y)
+
+        # One lookup in the map's precomputed move mask
+        if self.world.game_map.can_move(entity.x, entity.y, DIRECTION_INDEX_FROM_ACTION[action]):
+            # Movement succeeded
+            new_pos = add_vector(old_pos, get_direction_vector(action))
+            entity.x, entity.y = new_pos
+            entity.visited_positions.add(new_pos)
+            if entity.alive:
+                self.occupancy.move(entity.entity_id, old_pos, new_pos)
+            self.log_event(EventCode.MOVED, entity.entity_id, new_pos)
+        else:
+            # Hit a wall
+            self.log_event(EventCode.HIT_WALL, entity.entity_id)
+
+    def _execute_shoot(self, entity: EntityState, action: int):
+        """Execute a shoot action for an entity."""
+        if entity.ammo <= 0:
+            self.log_event(EventCode.OUT_OF_AMMO, entity.entity_id)
+            return
+
+        # Consume ammo
+        entity.ammo = consume_ammo(entity.ammo)
+        entity.last_bullet_tick = self.world.tick
+
+        direction_vector = get_direction_vector(action)
+
+        # Bullet starts one cell away; the occupancy index finds the first target
+        bullet_start = add_vector((entity.x, entity.y), direction_vector)
+        reach = bullet_reach(bullet_start, direction_vector, self.world.game_map)
+        hit_pos = self.occupancy.first_on_ray(bullet_start, direction_vector, reach)
+
+        if hit_pos:
+            # First entity on the cell in world order takes the hit
+            target_id = self.occupancy.at(hit_pos)[0]
+            target = self.world.entities[target_id]
+            target.hp = take_damage(target.hp)
+            self.log_event(
+                EventCode.SHOT_HIT, entity.entity_id,
+                (hit_pos[0], hit_pos[1], target.hp), target_id
+            )
+
+            if is_dead(target.hp):
+                target.alive = False
+                self.occupancy.remove(target_id, hit_pos)
+                self.log_event(EventCode.DIED, target_id)
+        else:
+            direction = DIRECTION_INDEX_FROM_ACTION[action]
+            self.log_event(EventCode.SHOT_MISSED, entity.entity_id, (direction,))
+
+    def _recover_entity_ammo(self, entity: EntityState):
+        """Recover ammo for an entity if conditions met."""
+        new_ammo, new_last_shot_tick = recover_ammo(
+            entity.ammo,
+            self.world.tick,
+            entity.last_bullet_tick
+        )
+
+        if new_ammo > entity.ammo:
+            entity.ammo = new_ammo
+            entity.last_bullet_tick = new_last_shot_tick
+            self.log_event(EventCode.AMMO_RECOVERED, entity.entity_id, (entity.ammo,))
+
+    def _check_win_conditions(self):
+        """Check if any entity has won or if game is over."""
+        player = self.world.entities.get("player")
+
+        if player:
+            # Check if player reached exit
+            if player.alive and player.x == self.world.exit_x and player.y == self.world.exit_y:
+                player.won = True
+                self.world.game_over = True
+                self.world.winner_id = "player"
+                self.log_event(EventCode.PLAYER_WON, "player")
+
+            # Check if player died
+            elif not player.alive:
+                self.world.game_over = True
+                self.log_event(EventCode.PLAYER_DIED, "player")
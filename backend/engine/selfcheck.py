@@ -10,7 +10,8 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from backend.engine.engine import GameEngine
 from backend.engine.state import WorldState, create_entity
 from backend.engine.actions import MOVE_RIGHT, MOVE_DOWN, SHOOT_RIGHT
-from backend.maps.loader import load_map, get_start_and_exit
+from backend.engine.events import EventCode
+from backend.maps.registry import get_map
 
 
 def print_sep(title):
@@ -24,16 +25,16 @@ def run_selfcheck():
 
     # Phase 1: Map loading
     print_sep("Phase 1: Map Loading")
-    grid = load_map("map1.txt")
-    (start_x, start_y), (exit_x, exit_y) = get_start_and_exit(grid)
-    print(f"✓ Map: {len(grid)}x{len(grid[0])}, Start: ({start_x},{start_y}), Exit: ({exit_x},{exit_y})")
+    game_map = get_map("map1.txt")
+    (start_x, start_y), (exit_x, exit_y) = game_map.start, game_map.exit
+    print(f"✓ Map: {game_map.height}x{game_map.width}, Start: ({start_x},{start_y}), Exit: ({exit_x},{exit_y})")
 
     # Phase 2: Create world
     print_sep("Phase 2: World Creation")
     player = create_entity("player", "player", 10, 10)
     agent = create_entity("target", "agent", 15, 10, "aggressive")
     world = WorldState(
-        game_id="check-001", tick=0, map_grid=grid,
+        game_id="check-001", tick=0, game_map=game_map,
         start_x=start_x, start_y=start_y, exit_x=exit_x, exit_y=exit_y,
         entities={"player": player, "target": agent},
         bullets=[], game_over=False, winner_id=None
@@ -43,7 +44,7 @@ def run_selfcheck():
 
     # Phase 3: Movement
     print_sep("Phase 3: Movement")
-    player.action_queue = [MOVE_RIGHT, MOVE_DOWN]
+    player.action_queue.extend([MOVE_RIGHT, MOVE_DOWN])
     for _ in range(2):
         result = engine.tick()
         for e in result['events']:
@@ -54,7 +55,7 @@ def run_selfcheck():
     print_sep("Phase 4: Shooting & Death")
     agent.x, agent.y = player.x + 3, player.y
     agent.hp = 1
-    player.action_queue = [SHOOT_RIGHT]
+    player.action_queue.extend([SHOOT_RIGHT])
     result = engine.tick()
     for e in result['events']:
         print(f"  {e}")
@@ -68,7 +69,7 @@ def run_selfcheck():
     for _ in range(3):
         result = engine.tick()
         for e in result['events']:
-            if 'recovered' in e.lower():
+            if e.code == EventCode.AMMO_RECOVERED:
                 print(f"  {e}")
     print(f"✓ Ammo: {before} → {player.ammo}")
 
@@ -84,7 +85,7 @@ def run_selfcheck():
     print_sep("Phase 7: Observation")
     p2 = create_entity("player", "player", 20, 20)
     w2 = WorldState(
-        game_id="check-002", tick=0, map_grid=grid,
+        game_id="check-002", tick=0, game_map=game_map,
         start_x=start_x, start_y=start_y, exit_x=exit_x, exit_y=exit_y,
         entities={"player": p2}, bullets=[], game_over=False, winner_id=None
     )
@@ -0,0 +1,67 @@
+"""
+Per-tick sound resolution.
+Shots stamp their hearing area into a grid; listeners do one lookup.
+"""
+from typing import Dict, Optional, Tuple
+
+from .constants import SOUND_RANGE
+from backend.maps.chunks import CHUNK_SHIFT, CHUNK_MASK, CHUNK_SIZE, chunk_count
+
+SHOT_SOUND = "*click*"
+
+
+class HearingGrid:
+    """
+    Byte-per-cell grid of cells within SOUND_RANGE of a shot this tick.
+    Chunks are allocated only where shots land and dropped on clear(), so
+    memory and reset cost follow the number of shots rather than the map size.
+    """
+
+    def __init__(self, width: int, height: int, sound_range: int = SOUND_RANGE):
+        """
+        Args:
+            width, height: Map size
+            sound_range: Chebyshev hearing radius (3 = 7x7 area)
+        """
+        self.width = width
+        self.height = height
+        self.sound_range = sound_range
+        self._chunks_x = chunk_count(width)
+        self._chunks: Dict[int, bytearray] = {}
+
+    def clear(self):
+        """Forget all stamped shots."""
+        self._chunks.clear()
+
+    def stamp(self, shot_pos: Tuple[int, int]):
+        """Mark the hearing area around a shot (clipped to the map)."""
+        r = self.sound_range
+        x0, x1 = max(shot_pos[0] - r, 0), min(shot_pos[0] + r + 1, self.width)
+        y0, y1 = max(shot_pos[1] - r, 0), min(shot_pos[1] + r + 1, self.height)
+        # Split the column range at chunk boundaries
+        spans = []
+        while x0 < x1:
+            end = min(x1, (x0 | CHUNK_MASK) + 1)
+            spans.append((x0 >> CHUNK_SHIFT, x0 & CHUNK_MASK, b"\x01" * (end - x0)))
+            x0 = end
+        for y in range(y0, y1):
+            row = (y >> CHUNK_SHIFT) * self._chunks_x
+            start_in_chunk = (y & CHUNK_MASK) << CHUNK_SHIFT
+            for cx, lx, ones in spans:
+                chunk = self._chunks.get(row + cx)
+                if chunk is None:
+                    chunk = self._chunks[row + cx] = bytearray(CHUNK_SIZE * CHUNK_SIZE)
+                start = start_in_chunk + lx
+                chunk[start:start + len(ones)] = ones
+
+    def heard(self, pos: Tuple[int, int]) -> bool:
+        """True if a shot was stamped within range of pos."""
+        x, y = pos
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return False
+        chunk = self._chunks.get((y >> CHUNK_SHIFT) * self._chunks_x + (x >> CHUNK_SHIFT))
+        return chunk is not None and chunk[((y & CHUNK_MASK) << CHUNK_SHIFT) | (x & CHUNK_MASK)] == 1
+
+    def sound_at(self, pos: Tuple[int, int]) -> Optional[str]:
+        """Sound heard at a position this tick, or None."""
+        return SHOT_SOUND if self.heard(pos) else None
@@ -1,77 +1,13 @@
 """
 World state data structures.
-Defines EntityState, BulletState, and WorldState.
+Defines BulletState and WorldState; EntityState lives in entity.py.
 """
-from dataclasses import dataclass, field, asdict
-from typing import List, Dict, Optional, Any, Set, Tuple
-import uuid
+from dataclasses import dataclass, asdict, replace
+from typing import List, Dict, Optional, Any
 
-from .constants import INITIAL_HP, INITIAL_AMMO
-
-
-@dataclass
-class EntityState:
-    """
-    Represents a player or agent in the game.
-    """
-    entity_id: str
-    entity_type: str  # "player" or "agent"
-    persona: Optional[str]  # None for player, or "aggressive"/"cautious"/"explorer"
-
-    # Position
-    x: int
-    y: int
-
-    # Combat stats
-    hp: int
-    ammo: int
-    last_bullet_tick: int  # Tick when last bullet was fired
-
-    # Status
-    alive: bool
-    won: bool  # True if reached exit
-
-    # Action queue
-    action_queue: List[str] = field(default_factory=list)
-
-    # Visited positions for explorer penalty tracking
-    visited_positions: Set[Tuple[int, int]] = field(default_factory=set)
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Serialize to dict for database storage."""
-        return {
-            "entity_id": self.entity_id,
-            "entity_type": self.entity_type,
-            "persona": self.persona,
-            "x": self.x,
-            "y": self.y,
-            "hp": self.hp,
-            "ammo": self.ammo,
-            "last_bullet_tick": self.last_bullet_tick,
-            "alive": self.alive,
-            "won": self.won,
-            "action_queue": self.action_queue,
-            "visited_positions": list(self.visited_positions)  # Convert set to list
-        }
-
-    @staticmethod
-    def from_dict(data: Dict[str, Any]) -> 'EntityState':
-        """Deserialize from dict."""
-        visited = set(tuple(pos) for pos in data.get("visited_positions", []))
-        return EntityState(
-            entity_id=data["entity_id"],
-            entity_type=data["entity_type"],
-            persona=data.get("persona"),
-            x=data["x"],
-            y=data["y"],
-            hp=data["hp"],
-            ammo=data["ammo"],
-            last_bullet_tick=data["last_bullet_tick"],
-            alive=data["alive"],
-            won=data["won"],
-            action_queue=data.get("action_queue", []),
-            visited_positions=visited
-        )
+from backend.maps.compiled import CompiledMap
+from backend.maps.registry import get_map
+from .entity import EntityState, create_entity  # noqa: F401 (re-exported)
 
 
 @dataclass
@@ -103,8 +39,8 @@ class WorldState:
     game_id: str
     tick: int
 
-    # Map data
-    map_grid: List[List[str]]  # 50x50 grid
+    # Map data (shared read-only between games on the same map)
+    game_map: CompiledMap
     start_x: int
     start_y: int
     exit_x: int
@@ -120,12 +56,51 @@ class WorldState:
     game_over: bool
     winner_id: Optional[str]
 
+    # Seed for all random streams of this game (see engine/rng.py)
+    seed: int = 0
+
+    def fork(self) -> 'WorldState':
+        """
+        Cheap independent copy for what-if simulation.
+        Shares the immutable map; copies entities and bullets only.
+        """
+        return WorldState(
+            game_id=self.game_id,
+            tick=self.tick,
+            game_map=self.game_map,
+            start_x=self.start_x,
+            start_y=self.start_y,
+            exit_x=self.exit_x,
+            exit_y=self.exit_y,
+            entities={eid: e.copy() for eid, e in self.entities.items()},
+            bullets=[replace(b) for b in self.bullets],
+            game_over=self.game_over,
+            winner_id=self.winner_id,
+            seed=self.seed
+        )
+
+    def restore(self, snapshot: 'WorldState'):
+        """
+        Reset this world in place to a snapshot taken with fork().
+        The snapshot stays unchanged and can be restored again; engines
+        holding this world see the restored state on their next tick.
+        """
+        self.game_id = snapshot.game_id
+        self.tick = snapshot.tick
+        self.game_map = snapshot.game_map
+        self.start_x, self.start_y = snapshot.start_x, snapshot.start_y
+        self.exit_x, self.exit_y = snapshot.exit_x, snapshot.exit_y
+        self.entities = {eid: e.copy() for eid, e in snapshot.entities.items()}
+        self.bullets = [replace(b) for b in snapshot.bullets]
+        self.game_over = snapshot.game_over
+        self.winner_id = snapshot.winner_id
+        self.seed = snapshot.seed
+
     def to_dict(self) -> Dict[str, Any]:
         """Serialize to dict for database storage."""
-        return {
+        data = {
             "game_id": self.game_id,
             "tick": self.tick,
-            "map_grid": self.map_grid,
             "start_x": self.start_x,
             "start_y": self.start_y,
             "exit_x": self.exit_x,
@@ -133,9 +108,17 @@ class WorldState:
             "entities": {eid: e.to_dict() for eid, e in self.entities.items()},
             "bullets": [b.to_dict() for b in self.bullets],
             "game_over": self.game_over,
-            "winner_id": self.winner_id
+            "winner_id": self.winner_id,
+            "seed": self.seed
         }
 
+        # Named maps are reloaded from the map cache; only ad-hoc grids are stored
+        if self.game_map.name is not None:
+            data["map_name"] = self.game_map.name
+        else:
+            data["map_grid"] = self.game_map.to_grid()
+        return data
+
     @staticmethod
     def from_dict(data: Dict[str, Any]) -> 'WorldState':
         """Deserialize from dict."""
@@ -145,10 +128,15 @@ class WorldState:
         }
         bullets = [BulletState.from_dict(b) for b in data["bullets"]]
 
+        if "map_name" in data:
+            game_map = get_map(data["map_name"])
+        else:
+            game_map = CompiledMap.from_grid(data["map_grid"])
+
         return WorldState(
             game_id=data["game_id"],
             tick=data["tick"],
-            map_grid=data["map_grid"],
+            game_map=game_map,
             start_x=data["start_x"],
             start_y=data["start_y"],
             exit_x=data["exit_x"],
@@ -156,40 +144,6 @@ class WorldState:
             entities=entities,
             bullets=bullets,
             game_over=data["game_over"],
-            winner_id=data.get("winner_id")
+            winner_id=data.get("winner_id"),
+            seed=data.get("seed", 0)
         )
-
-
-def create_entity(
-    entity_id: str,
-    entity_type: str,
-    x: int,
-    y: int,
-    persona: Optional[str] = None
-) -> EntityState:
-    """
-    Create a new entity with initial stats.
-
-    Args:
-        entity_id: Unique ID
-        entity_type: "player" or "agent"
-        x, y: Starting position
-        persona: Optional persona for agents
-
-    Returns:
-        EntityState with default stats
-    """
-    return EntityState(
-        entity_id=entity_id,
-        entity_type=entity_type,
-        persona=persona,
-        x=x,
-        y=y,
-        hp=INITIAL_HP,
-        ammo=INITIAL_AMMO,
-        last_bullet_tick=0,
-        alive=True,
-        won=False,
-        action_queue=[],
-        visited_positions=set()
-    )
@@ -1,70 +1,75 @@
 """
 Factory functions for creating initial game states.
 """
-import random
 import uuid
 from typing import List, Tuple, Optional
 
+import numpy as np
+
 from backend.engine.state import WorldState, create_entity
-from backend.maps.loader import load_map, get_start_and_exit
-from backend.engine.position import is_walkable
+from backend.maps.compiled import CompiledMap
+from backend.maps.registry import get_map
+from backend.engine.rng import derive_rng, new_seed
 
 
 def find_random_walkable_position(
-    grid: List[List[str]],
-    exclude_positions: List[Tuple[int, int]]
+    game_map: CompiledMap,
+    exclude_positions: List[Tuple[int, int]],
+    rng: Optional[np.random.Generator] = None
 ) -> Tuple[int, int]:
     """
     Find a random walkable position that's not in exclude list.
+    Samples the map's walkable-cell index directly (no rejection loop).
 
     Args:
-        grid: Map grid
+        game_map: Compiled map
         exclude_positions: Positions to avoid
+        rng: Random stream to draw from (a fresh unseeded one if not provided)
 
     Returns:
         (x, y) random walkable position
 
     Raises:
-        RuntimeError: If no walkable position found after many attempts
+        RuntimeError: If every walkable position is excluded
     """
-    width = len(grid[0])
-    height = len(grid)
-
-    for _ in range(1000):  # Try max 1000 times
-        x = random.randint(0, width - 1)
-        y = random.randint(0, height - 1)
-        pos = (x, y)
-
-        if pos not in exclude_positions and is_walkable(grid, pos):
-            return pos
+    if rng is None:
+        rng = np.random.default_rng()
+    return game_map.sample_walkable(rng, exclude_positions)
 
-    raise RuntimeError("Could not find random walkable position after 1000 attempts")
 
-
-def create_new_state(map_name: str = "map1.txt", game_id: Optional[str] = None) -> WorldState:
+def create_new_state(
+    map_name: str = "map1.txt",
+    game_id: Optional[str] = None,
+    seed: Optional[int] = None
+) -> WorldState:
     """
     Create a new game state with random entity placement.
 
     Args:
         map_name: Name of map file to load
         game_id: Optional game ID (generates UUID if not provided)
+        seed: Game seed (a fresh one if not provided); same seed, same placement
 
     Returns:
         WorldState with player and 3 agents randomly placed
     """
-    # Load map
-    grid = load_map(map_name)
-    (start_x, start_y), (exit_x, exit_y) = get_start_and_exit(grid)
+    # Map from the process-wide registry (no file I/O after first use)
+    game_map = get_map(map_name)
+    (start_x, start_y), (exit_x, exit_y) = game_map.start, game_map.exit
 
     # Generate game ID
     if game_id is None:
         game_id = str(uuid.uuid4())
 
+    if seed is None:
+        seed = new_seed()
+    rng = derive_rng(seed, "spawn")
+
     # Track used positions
     used_positions = [(start_x, start_y), (exit_x, exit_y)]
 
     # Create player at random position
-    player_pos = find_random_walkable_position(grid, used_positions)
+    player_pos = find_random_walkable_position(game_map, used_positions, rng)
     used_positions.append(player_pos)
 
     player = create_entity(
@@ -72,7 +77,9 @@ def create_new_state(map_name: str = "map1.txt", game_id: Optional[str] = None)
         entity_type="player",
         x=player_pos[0],
         y=player_pos[1],
-        persona=None
+        persona=None,
+        map_width=game_map.width,
+        map_height=game_map.height
     )
 
     # Create 3 agents with different personas
@@ -80,7 +87,7 @@ def create_new_state(map_name: str = "map1.txt", game_id: Optional[str] = None)
     agents = {}
 
     for i, persona in enumerate(personas):
-        agent_pos = find_random_walkable_position(grid, used_positions)
+        agent_pos = find_random_walkable_position(game_map, used_positions, rng)
         used_positions.append(agent_pos)
 
         agent_id = f"agent_{persona}_{i+1}"
@@ -89,7 +96,9 @@ def create_new_state(map_name: str = "map1.txt", game_id: Optional[str] = None)
             entity_type="agent",
             x=agent_pos[0],
             y=agent_pos[1],
-            persona=persona
+            persona=persona,
+            map_width=game_map.width,
+            map_height=game_map.height
         )
         agents[agent_id] = agent
 
@@ -100,7 +109,7 @@ def create_new_state(map_name: str = "map1.txt", game_id: Optional[str] = None)
     return WorldState(
         game_id=game_id,
         tick=0,
-        map_grid=grid,
+        game_map=game_map,
         start_x=start_x,
         start_y=start_y,
         exit_x=exit_x,
@@ -108,5 +117,6 @@ def create_new_state(map_name: str = "map1.txt", game_id: Optional[str] = None)
         entities=entities,
         bullets=[],
         game_over=False,
-        winner_id=None
+        winner_id=None,
+        seed=seed
     )
@@ -0,0 +1,138 @@
+"""
+Visited-cell tracking as a sparse chunked bitset.
+One bit per map cell, allocated one chunk at a time as cells are visited,
+so memory follows the explored area rather than the map size.
+"""
+import base64
+from typing import Dict, Iterator, Tuple, Any
+
+import numpy as np
+
+from .constants import MAP_WIDTH, MAP_HEIGHT
+from backend.maps.chunks import CHUNK_SHIFT, CHUNK_MASK, CHUNK_SIZE, chunk_count
+
+CHUNK_BYTES = CHUNK_SIZE * CHUNK_SIZE // 8
+
+
+class VisitedCells:
+    """
+    Set-like bitset of visited (x, y) cells for one entity.
+    Supports add(), `in`, len() and iteration like the old set of tuples.
+    """
+
+    __slots__ = ("width", "height", "chunks", "count", "_chunks_x")
+
+    def __init__(self, width: int = MAP_WIDTH, height: int = MAP_HEIGHT, chunks: Dict[int, bytearray] = None):
+        """
+        Args:
+            width, height: Map size
+            chunks: Existing chunk index -> bits mapping to adopt (not copied)
+        """
+        self.width = width
+        self.height = height
+        self._chunks_x = chunk_count(width)
+        self.chunks = chunks if chunks is not None else {}
+        self.count = sum(
+            bin(b).count("1") for bits in self.chunks.values() for b in bits
+        ) if chunks else 0
+
+    def _locate(self, pos: Tuple[int, int]) -> Tuple[int, int]:
+        """(chunk index, bit index in chunk) of a cell, or (-1, -1) if outside the map."""
+        x, y = pos
+        if 0 <= x < self.width and 0 <= y < self.height:
+            chunk = (y >> CHUNK_SHIFT) * self._chunks_x + (x >> CHUNK_SHIFT)
+            return chunk, ((y & CHUNK_MASK) << CHUNK_SHIFT) | (x & CHUNK_MASK)
+        return -1, -1
+
+    def add(self, pos: Tuple[int, int]):
+        """Mark a cell as visited (cells outside the map are ignored)."""
+        chunk, i = self._locate(pos)
+        if chunk < 0:
+            return
+        bits = self.chunks.get(chunk)
+        if bits is None:
+            bits = self.chunks[chunk] = bytearray(CHUNK_BYTES)
+        if not bits[i >> 3] & (1 << (i & 7)):
+            bits[i >> 3] |= 1 << (i & 7)
+            self.count += 1
+
+    def update(self, xs: np.ndarray, ys: np.ndarray):
+        """Mark many cells at once, one chunk at a time (cells outside the map are ignored)."""
+        xs, ys = np.asarray(xs, dtype=np.int64), np.asarray(ys, dtype=np.int64)
+        inside = (xs >= 0) & (xs < self.width) & (ys >= 0) & (ys < self.height)
+        xs, ys = xs[inside], ys[inside]
+        chunks = (ys >> CHUNK_SHIFT) * self._chunks_x + (xs >> CHUNK_SHIFT)
+        cells = ((ys & CHUNK_MASK) << CHUNK_SHIFT) | (xs & CHUNK_MASK)
+        for chunk in np.unique(chunks).tolist():
+            bits = self.chunks.get(chunk)
+            if bits is None:
+                bits = self.chunks[chunk] = bytearray(CHUNK_BYTES)
+            flags = np.unpackbits(np.frombuffer(bits, dtype=np.uint8), bitorder="little").astype(bool)
+            marked = np.unique(cells[chunks == chunk])
+            self.count += int(np.count_nonzero(~flags[marked]))
+            flags[marked] = True
+            bits[:] = np.packbits(flags, bitorder="little").tobytes()
+
+    def __contains__(self, pos: Tuple[int, int]) -> bool:
+        chunk, i = self._locate(pos)
+        bits = self.chunks.get(chunk)
+        return bits is not None and bool(bits[i >> 3] & (1 << (i & 7)))
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        """Visited cells, chunk by chunk."""
+        for chunk, bits in sorted(self.chunks.items()):
+            cy, cx = divmod(chunk, self._chunks_x)
+            for byte_i, byte in enumerate(bits):
+                while byte:
+                    low = byte & -byte
+                    i = (byte_i << 3) + low.bit_length() - 1
+                    yield ((cx << CHUNK_SHIFT) | (i & CHUNK_MASK), (cy << CHUNK_SHIFT) | (i >> CHUNK_SHIFT))
+                    byte ^= low
+
+    def copy(self) -> 'VisitedCells':
+        """Independent copy of the bitset."""
+        clone = VisitedCells.__new__(VisitedCells)
+        clone.width, clone.height, clone.count = self.width, self.height, self.count
+        clone._chunks_x = self._chunks_x
+        clone.chunks = {chunk: bytearray(bits) for chunk, bits in self.chunks.items()}
+        return clone
+
+    def to_dict(self) -> dict:
+        """Serialize as map size plus base64-encoded bits of each touched chunk."""
+        return {
+            "width": self.width,
+            "height": self.height,
+            "chunks": {
+                str(chunk): base64.b64encode(bytes(bits)).decode("ascii")
+                for chunk, bits in self.chunks.items()
+            }
+        }
+
+    @staticmethod
+    def from_data(data: Any) -> 'VisitedCells':
+        """
+        Deserialize from to_dict() output, the older whole-map bitset dict
+        or a legacy list of [x, y] pairs.
+        """
+        if isinstance(data, dict) and "chunks" in data:
+            chunks = {
+                int(chunk): bytearray(base64.b64decode(bits))
+                for chunk, bits in data["chunks"].items()
+            }
+            return VisitedCells(data["width"], data["height"], chunks)
+
+        if isinstance(data, dict):
+            visited = VisitedCells(data["width"], data["height"])
+            for byte_i, byte in enumerate(base64.b64decode(data["bits"])):
+                for bit in range(8):
+                    if byte & (1 << bit):
+                        visited.add(divmod((byte_i << 3) + bit, visited.width)[::-1])
+            return visited
+
+        visited = VisitedCells()
+        for pos in data or []:
+            visited.add(tuple(pos))
+        return visited
@@ -0,0 +1,76 @@
+"""
+Vectorized breadth-first search over wall masks.
+Dense whole-grid passes for stacks of small maps, sparse frontier passes
+for large ones.
+"""
+import numpy as np
+
+UNREACHABLE = np.iinfo(np.uint32).max
+
+# Above this many cells per layer, expanding only the frontier beats
+# shifting the whole grid every step
+_DENSE_MAX_CELLS = 64 * 64
+
+
+def bfs_distances(walls: np.ndarray, seeds: np.ndarray) -> np.ndarray:
+    """
+    Breadth-first distances for a stack of seed masks, all at once.
+
+    Args:
+        walls: (H, W) array, nonzero for walls, or (S, H, W) for one map
+            per layer
+        seeds: (S, H, W) bool array; each layer is one multi-source BFS
+
+    Returns:
+        (S, H, W) uint32 steps to the nearest seed, UNREACHABLE for walls
+        and cells with no path
+    """
+    open_cells = np.broadcast_to(walls == 0, seeds.shape)
+    if seeds.shape[1] * seeds.shape[2] > _DENSE_MAX_CELLS:
+        return np.stack([
+            _bfs_frontier(open_cells[i], seeds[i]) for i in range(len(seeds))
+        ])
+
+    frontier = seeds & open_cells
+    seen = frontier.copy()
+    dist = np.full(seeds.shape, UNREACHABLE, dtype=np.uint32)
+    step = 0
+    while frontier.any():
+        dist[frontier] = step
+        grown = np.zeros_like(frontier)
+        grown[:, 1:, :] |= frontier[:, :-1, :]
+        grown[:, :-1, :] |= frontier[:, 1:, :]
+        grown[:, :, 1:] |= frontier[:, :, :-1]
+        grown[:, :, :-1] |= frontier[:, :, 1:]
+        frontier = grown & open_cells & ~seen
+        seen |= frontier
+        step += 1
+    return dist
+
+
+def _bfs_frontier(open_cells: np.ndarray, seeds: np.ndarray) -> np.ndarray:
+    """
+    Single-layer BFS that only touches frontier cells each step.
+    Works on flat indices into a wall-bordered copy, so neighbours never
+    leave the array.
+    """
+    height, width = open_cells.shape
+    pitch = width + 2
+    unseen = np.zeros((height + 2, pitch), dtype=bool)
+    unseen[1:-1, 1:-1] = open_cells
+    unseen = unseen.reshape(-1)
+    start = np.zeros((height + 2, pitch), dtype=bool)
+    start[1:-1, 1:-1] = seeds
+    offsets = np.array([-pitch, pitch, -1, 1])
+
+    dist = np.full(unseen.shape, UNREACHABLE, dtype=np.uint32)
+    frontier = np.flatnonzero(start.reshape(-1) & unseen)
+    unseen[frontier] = False
+    step = 0
+    while frontier.size:
+        dist[frontier] = step
+        grown = (frontier[:, None] + offsets).reshape(-1)
+        frontier = np.unique(grown[unseen[grown]])
+        unseen[frontier] = False
+        step += 1
+    return dist.reshape(height + 2, pitch)[1:-1, 1:-1]
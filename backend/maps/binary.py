@@ -0,0 +1,171 @@
+"""
+Binary map files (.cmz).
+A fixed header followed by the compiled tables in their in-memory layout
+(chunked cells, chunked rays, walkable indices), so a map is loaded with
+one read-only mmap and no parsing. Worker processes mapping the same file
+share a single page-cache copy.
+"""
+import os
+import struct
+import zlib
+from typing import Optional
+
+import numpy as np
+
+from backend.maps.chunks import ChunkedGrid, CHUNK_SHIFT, CHUNK_SIZE
+from backend.maps.compiled import CompiledMap, WALL
+from backend.maps.loader import load_map
+
+BINARY_SUFFIX = ".cmz"
+FORMAT_VERSION = 1
+MAGIC = b"CMZ\x00"
+MAPS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# magic, version, chunk shift, width, height, start x/y, exit x/y, halo,
+# reserved, walkable count, source crc32, cells/rays/walkable offsets
+_HEADER = struct.Struct("<4sHHIIIIIIHHIIQQQ")
+_ALIGN = 64
+
+
+def _aligned(offset: int) -> int:
+    """Round a file offset up so every section starts on a 64-byte boundary."""
+    return (offset + _ALIGN - 1) // _ALIGN * _ALIGN
+
+
+def save_binary_map(game_map: CompiledMap, path: str, source_crc: int = 0):
+    """
+    Write a map as a .cmz file (atomically, via a temporary file).
+
+    Args:
+        game_map: Map to write
+        path: Destination path
+        source_crc: crc32 of the text file it was built from (0 if none)
+    """
+    cells = game_map.cell_chunks.tiles
+    rays = game_map.ray_chunks.tiles
+    walkable = game_map.walkable
+    cells_at = _aligned(_HEADER.size)
+    rays_at = _aligned(cells_at + cells.nbytes)
+    walkable_at = _aligned(rays_at + rays.nbytes)
+    header = _HEADER.pack(
+        MAGIC, FORMAT_VERSION, CHUNK_SHIFT, game_map.width, game_map.height,
+        *game_map.start, *game_map.exit, game_map.cell_chunks.halo, 0,
+        len(walkable), source_crc, cells_at, rays_at, walkable_at
+    )
+
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "wb") as f:
+            f.write(header)
+            for offset, table in ((cells_at, cells), (rays_at, rays), (walkable_at, walkable)):
+                f.seek(offset)
+                f.write(np.ascontiguousarray(table, dtype=table.dtype.newbyteorder('<')).tobytes())
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def read_header(path: str) -> dict:
+    """
+    Read and check a .cmz header.
+
+    Raises:
+        ValueError: If the file is not a .cmz map this code can read
+    """
+    with open(path, "rb") as f:
+        raw = f.read(_HEADER.size)
+    if len(raw) < _HEADER.size:
+        raise ValueError(f"{path}: truncated map header")
+    fields = _HEADER.unpack(raw)
+    header = dict(zip((
+        "magic", "version", "chunk_shift", "width", "height", "start_x", "start_y",
+        "exit_x", "exit_y", "halo", "reserved", "walkable", "source_crc",
+        "cells_at", "rays_at", "walkable_at"
+    ), fields))
+    if header["magic"] != MAGIC:
+        raise ValueError(f"{path}: not a binary map file")
+    if header["version"] != FORMAT_VERSION:
+        raise ValueError(f"{path}: map format version {header['version']}, expected {FORMAT_VERSION}")
+    if header["chunk_shift"] != CHUNK_SHIFT:
+        raise ValueError(f"{path}: written with {1 << header['chunk_shift']}-cell chunks, expected {CHUNK_SIZE}")
+    return header
+
+
+def load_binary_map(path: str, name: Optional[str] = None) -> CompiledMap:
+    """
+    Memory-map a .cmz file as a CompiledMap (tables are not copied).
+
+    Args:
+        path: File to load
+        name: Map name (defaults to the file name)
+
+    Raises:
+        ValueError: If the file is not a valid .cmz map
+    """
+    header = read_header(path)
+    width, height, halo = header["width"], header["height"], header["halo"]
+    raw = np.memmap(path, dtype=np.uint8, mode="r")
+
+    pitch = CHUNK_SIZE + 2 * halo
+    tiles_shape = (-(-height // CHUNK_SIZE), -(-width // CHUNK_SIZE), pitch, pitch)
+    tile_cells = int(np.prod(tiles_shape))
+    try:
+        cells = raw[header["cells_at"]:header["cells_at"] + tile_cells].reshape(tiles_shape)
+        rays = raw[header["rays_at"]:header["rays_at"] + tile_cells * 8].view('<u2').reshape(tiles_shape + (4,))
+        walkable = raw[header["walkable_at"]:header["walkable_at"] + header["walkable"] * 4].view('<i4')
+        cell_chunks = ChunkedGrid.from_tiles(cells, width, height, ord(WALL), halo)
+        ray_chunks = ChunkedGrid.from_tiles(rays, width, height, 0, halo)
+    except ValueError as e:
+        raise ValueError(f"{path}: truncated or corrupt map data ({e})")
+
+    return CompiledMap.from_chunks(
+        cell_chunks, ray_chunks, walkable,
+        (header["start_x"], header["start_y"]), (header["exit_x"], header["exit_y"]),
+        name if name is not None else os.path.basename(path)
+    )
+
+
+def file_crc32(path: str) -> int:
+    """crc32 of a text map file (recorded in .cmz files built from it)."""
+    with open(path, "rb") as f:
+        return zlib.crc32(f.read())
+
+
+def binary_path_for(text_path: str) -> str:
+    """Path of the .cmz file next to a text map."""
+    return os.path.splitext(text_path)[0] + BINARY_SUFFIX
+
+
+def load_map_cached(map_name: str) -> CompiledMap:
+    """
+    Compile a map from the maps directory. Binary maps are memory-mapped;
+    text maps go through the .cmz file next to them, which is used when
+    its recorded crc32 matches the text and (re)written otherwise (write
+    errors are ignored).
+
+    Raises:
+        FileNotFoundError: If the map file doesn't exist
+        ValueError: If the map is malformed
+    """
+    path = os.path.join(MAPS_DIR, map_name)
+    if map_name.endswith(BINARY_SUFFIX):
+        return load_binary_map(path, map_name)
+
+    game_map = None
+    crc = file_crc32(path) if os.path.exists(path) else None
+    cached = binary_path_for(path)
+    if crc is not None and os.path.exists(cached):
+        try:
+            if read_header(cached)["source_crc"] == crc:
+                game_map = load_binary_map(cached, map_name)
+        except (OSError, ValueError):
+            game_map = None
+
+    if game_map is None:
+        game_map = CompiledMap.from_grid(load_map(path), name=map_name)
+        try:
+            save_binary_map(game_map, cached, crc)
+        except OSError:
+            pass
+    return game_map
@@ -0,0 +1,167 @@
+"""
+Fixed-size chunked grid storage.
+Cells are stored tile by tile, each tile padded with a halo copied from its
+neighbours, so a small window around any cell lies inside a single tile.
+"""
+from typing import Sequence, Tuple
+import numpy as np
+
+CHUNK_SHIFT = 5
+CHUNK_SIZE = 1 << CHUNK_SHIFT  # 32x32 cells per chunk
+CHUNK_MASK = CHUNK_SIZE - 1
+CHUNK_HALO = 2  # VISION_SIZE // 2: a vision window never leaves its tile
+
+
+def chunk_count(cells: int) -> int:
+    """Number of chunks needed to cover `cells` cells along one axis."""
+    return (cells + CHUNK_MASK) >> CHUNK_SHIFT
+
+
+class ChunkedGrid:
+    """
+    Read-only (height, width[, depth]) grid stored as padded tiles.
+
+    Attributes:
+        width, height: Grid size in cells
+        chunks_x, chunks_y: Tiles per row / column
+        halo: Cells copied from neighbouring tiles on every side
+        pitch: Tile side including the halo (CHUNK_SIZE + 2 * halo)
+        tiles: (chunks_y, chunks_x, pitch, pitch[, depth]) contiguous array
+        fill: Value of cells outside the grid
+        row_offsets, col_offsets: Per-row / per-column parts of a cell's
+            offset in the flattened tiles (offset = row part + column part)
+    """
+
+    def __init__(self, values: np.ndarray, fill: int, halo: int = CHUNK_HALO):
+        """
+        Args:
+            values: (height, width[, depth]) array to store
+            fill: Value for cells outside the grid (halo at the map edge)
+            halo: Halo width; windows up to this radius are single-tile views
+        """
+        height, width = values.shape[:2]
+        chunks_y, chunks_x = chunk_count(height), chunk_count(width)
+        pitch = CHUNK_SIZE + 2 * halo
+        depth = values.shape[2:]
+        padded = np.full(
+            (chunks_y * CHUNK_SIZE + 2 * halo, chunks_x * CHUNK_SIZE + 2 * halo) + depth,
+            fill, dtype=values.dtype
+        )
+        padded[halo:halo + height, halo:halo + width] = values
+        s0, s1 = padded.strides[:2]
+        tiles = np.lib.stride_tricks.as_strided(
+            padded,
+            shape=(chunks_y, chunks_x, pitch, pitch) + depth,
+            strides=(s0 * CHUNK_SIZE, s1 * CHUNK_SIZE, s0, s1) + padded.strides[2:]
+        )
+        self._bind(np.ascontiguousarray(tiles), width, height, fill, halo)
+
+    @staticmethod
+    def from_tiles(tiles: np.ndarray, width: int, height: int, fill: int, halo: int = CHUNK_HALO) -> 'ChunkedGrid':
+        """
+        Wrap existing tiles (e.g. a memory-mapped file section) without copying.
+
+        Raises:
+            ValueError: If the tile array does not match the grid size
+        """
+        expected = (chunk_count(height), chunk_count(width), CHUNK_SIZE + 2 * halo, CHUNK_SIZE + 2 * halo)
+        if tiles.shape[:4] != expected:
+            raise ValueError(f"Tiles of shape {tiles.shape[:4]} do not fit a {width}x{height} grid")
+        grid = ChunkedGrid.__new__(ChunkedGrid)
+        grid._bind(tiles, width, height, fill, halo)
+        return grid
+
+    def _bind(self, tiles: np.ndarray, width: int, height: int, fill: int, halo: int):
+        """Adopt the tiles read-only and precompute the offset tables."""
+        self.width, self.height = width, height
+        self.fill = fill
+        self.halo = halo
+        self.pitch = CHUNK_SIZE + 2 * halo
+        self.chunks_y, self.chunks_x = tiles.shape[:2]
+        self.tiles = tiles
+        if self.tiles.flags.writeable:
+            self.tiles.setflags(write=False)
+        self._flat = tiles.reshape((-1,) + tiles.shape[4:])
+        self._stencils = {}
+
+        # The tile index is separable, so the offset splits into two lookups
+        tile_cells = self.pitch * self.pitch
+        self.row_offsets = [
+            (y >> CHUNK_SHIFT) * self.chunks_x * tile_cells + ((y & CHUNK_MASK) + halo) * self.pitch
+            for y in range(self.height)
+        ]
+        self.col_offsets = [
+            (x >> CHUNK_SHIFT) * tile_cells + (x & CHUNK_MASK) + halo
+            for x in range(self.width)
+        ]
+
+    def offset(self, x: int, y: int) -> int:
+        """Cell offset of in-bounds (x, y) in the flattened tiles (no bounds check)."""
+        return self.row_offsets[y] + self.col_offsets[x]
+
+    def values_at(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """Vectorized lookup of in-bounds cells (xs and ys broadcast together)."""
+        return self.tiles[
+            ys >> CHUNK_SHIFT, xs >> CHUNK_SHIFT,
+            (ys & CHUNK_MASK) + self.halo, (xs & CHUNK_MASK) + self.halo
+        ]
+
+    def window(self, cx: int, cy: int, radius: int) -> np.ndarray:
+        """
+        (2*radius+1) square centered on (cx, cy); outside cells read as fill.
+        A read-only view into one tile when radius <= halo and the center
+        is inside the grid, otherwise gathered from the overlapped tiles.
+        """
+        if radius <= self.halo and 0 <= cx < self.width and 0 <= cy < self.height:
+            lx, ly = (cx & CHUNK_MASK) + self.halo, (cy & CHUNK_MASK) + self.halo
+            return self.tiles[
+                cy >> CHUNK_SHIFT, cx >> CHUNK_SHIFT,
+                ly - radius:ly + radius + 1, lx - radius:lx + radius + 1
+            ]
+        return self._gather(cx - radius, cy - radius, 2 * radius + 1)
+
+    def windows(self, centers: Sequence[Tuple[int, int]], radius: int) -> np.ndarray:
+        """
+        Batched window(): (E, 2*radius+1, 2*radius+1[, depth]) copy for E
+        (x, y) centers. With radius <= halo and every center inside the grid
+        this is one take() of the window stencil added to each center's offset.
+        """
+        side = 2 * radius + 1
+        inside = all(0 <= x < self.width and 0 <= y < self.height for x, y in centers)
+        if radius > self.halo or not inside:
+            out = np.empty((len(centers), side, side) + self.tiles.shape[4:], dtype=self.tiles.dtype)
+            for i, (x, y) in enumerate(centers):
+                out[i] = self.window(x, y, radius)
+            return out
+
+        stencil = self._stencils.get(radius)
+        if stencil is None:
+            span = np.arange(-radius, radius + 1)
+            stencil = self._stencils[radius] = span[:, None] * self.pitch + span[None, :]
+        rows, cols = self.row_offsets, self.col_offsets
+        base = np.array([rows[y] + cols[x] for x, y in centers], dtype=np.int64)
+        return self._flat[base[:, None, None] + stencil]
+
+    def _gather(self, left: int, top: int, size: int) -> np.ndarray:
+        """Copy a size x size square starting at (left, top), filling outside cells."""
+        out = np.full((size, size) + self.tiles.shape[4:], self.fill, dtype=self.tiles.dtype)
+        (x0, x1), (y0, y1) = self._clip(left, size, self.width), self._clip(top, size, self.height)
+        if x0 < x1 and y0 < y1:
+            out[y0 - top:y1 - top, x0 - left:x1 - left] = self.values_at(
+                np.arange(x0, x1)[None, :], np.arange(y0, y1)[:, None]
+            )
+        return out
+
+    @staticmethod
+    def _clip(start: int, size: int, limit: int) -> Tuple[int, int]:
+        """Intersect [start, start + size) with [0, limit)."""
+        return max(start, 0), min(start + size, limit)
+
+    def to_array(self) -> np.ndarray:
+        """Reassemble the dense (height, width[, depth]) array."""
+        h = self.halo
+        inner = self.tiles[:, :, h:h + CHUNK_SIZE, h:h + CHUNK_SIZE].swapaxes(1, 2)
+        dense = inner.reshape(
+            (self.chunks_y * CHUNK_SIZE, self.chunks_x * CHUNK_SIZE) + self.tiles.shape[4:]
+        )
+        return dense[:self.height, :self.width].copy()
@@ -0,0 +1,200 @@
+"""
+Compiled map representation.
+Chunked cell and ray tables built once per map and shared read-only by games.
+"""
+from typing import Iterable, List, Tuple, Optional, Sequence
+import numpy as np
+
+from backend.maps.chunks import ChunkedGrid
+from backend.maps.rays import compute_ray_distances, move_mask_from_rays
+from backend.maps.sampling import sample_excluding
+
+WALL = '#'
+START = 'S'
+EXIT = 'E'
+_WALL_BYTE = ord(WALL)
+
+
+class CompiledMap:
+    """
+    Immutable map shared by every game played on it.
+    Cells and rays are stored in fixed-size chunks (maps.chunks), so
+    lookups and vision windows touch only the chunk around a cell whatever
+    the map size.
+
+    Attributes:
+        name: Map name used to reload it (None for ad-hoc grids)
+        width, height: Map size in cells
+        cell_chunks: ChunkedGrid of cell characters (outside reads as wall)
+        ray_chunks: ChunkedGrid of (4,) uint16 open-cell counts (see maps.rays)
+        move_chunks: ChunkedGrid of 4-bit move masks, derived from the rays at
+            load (bit d: the neighbour in maps.rays.DIRECTIONS[d] is walkable)
+        start, exit: (x, y) positions of 'S' and 'E'
+        walkable: sorted int32 flat indices (y * width + x) of walkable cells
+    """
+
+    def __init__(self, cells: np.ndarray, name: Optional[str] = None):
+        """
+        Args:
+            cells: (height, width) uint8 array of ASCII cell characters
+            name: Optional map name
+
+        Raises:
+            ValueError: If start or exit is missing
+        """
+        cells = np.asarray(cells, dtype=np.uint8)
+        walls = cells == ord(WALL)
+        walkable = np.flatnonzero(~walls).astype(np.int32)
+        walkable.setflags(write=False)  # shared maps must not be mutated
+        self._bind(
+            name, ChunkedGrid(cells, ord(WALL)), ChunkedGrid(compute_ray_distances(walls), 0),
+            walkable, self._find(cells, START), self._find(cells, EXIT)
+        )
+
+    def _bind(self, name, cell_chunks, ray_chunks, walkable, start, exit_pos):
+        """Set the tables and the flat views used by scalar lookups."""
+        self.name = name
+        self.height, self.width = cell_chunks.height, cell_chunks.width
+        self.cell_chunks, self.ray_chunks = cell_chunks, ray_chunks
+        self.walkable = walkable
+        self.start, self.exit = start, exit_pos
+
+        # Cell offset = row part + column part; flat views over the tiles
+        # give fast scalar lookups on hot paths
+        self._rows = cell_chunks.row_offsets
+        self._cols = cell_chunks.col_offsets
+        self._cell_flat = memoryview(cell_chunks.tiles.reshape(-1))
+        self._ray_flat = memoryview(ray_chunks.tiles.reshape(-1))
+        moves = move_mask_from_rays(ray_chunks.tiles)
+        self.move_chunks = ChunkedGrid.from_tiles(moves, self.width, self.height, 0, ray_chunks.halo)
+        self._move_flat = memoryview(self.move_chunks.tiles.reshape(-1))
+
+    @staticmethod
+    def from_chunks(cell_chunks: ChunkedGrid, ray_chunks: ChunkedGrid, walkable: np.ndarray,
+                    start: Tuple[int, int], exit_pos: Tuple[int, int], name: Optional[str] = None) -> 'CompiledMap':
+        """
+        Wrap precomputed tables (e.g. memory-mapped from a binary map file)
+        without recompiling. ray_chunks must share cell_chunks' layout.
+        """
+        game_map = CompiledMap.__new__(CompiledMap)
+        game_map._bind(name, cell_chunks, ray_chunks, walkable, start, exit_pos)
+        return game_map
+
+    @staticmethod
+    def from_grid(grid: Sequence[Sequence[str]], name: Optional[str] = None) -> 'CompiledMap':
+        """
+        Compile a 2D grid of characters (list of lists or list of strings).
+
+        Raises:
+            ValueError: If rows have different lengths
+        """
+        rows = [''.join(row) for row in grid]
+        if not rows or any(len(row) != len(rows[0]) for row in rows):
+            raise ValueError("Map rows must be non-empty and equally long")
+        data = np.frombuffer(''.join(rows).encode('ascii'), dtype=np.uint8)
+        return CompiledMap(data.reshape(len(rows), len(rows[0])), name)
+
+    @property
+    def cells(self) -> np.ndarray:
+        """Dense (height, width) uint8 array of cell characters (a copy)."""
+        return self.cell_chunks.to_array()
+
+    @property
+    def walls(self) -> np.ndarray:
+        """Dense (height, width) uint8 array, 1 for walls (a copy)."""
+        return (self.cells == ord(WALL)).astype(np.uint8)
+
+    @property
+    def rays(self) -> np.ndarray:
+        """Dense (height, width, 4) uint16 ray table (a copy)."""
+        return self.ray_chunks.to_array()
+
+    @staticmethod
+    def _find(cells: np.ndarray, target: str) -> Tuple[int, int]:
+        """Find the first (x, y) of a cell character in row-major order."""
+        found = np.argwhere(cells == ord(target))
+        if len(found) == 0:
+            label = "Start" if target == START else "Exit"
+            raise ValueError(f"{label} position '{target}' not found in map")
+        y, x = found[0]
+        return (int(x), int(y))
+
+    def in_bounds(self, x: int, y: int) -> bool:
+        """Check if (x, y) is inside the map."""
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def is_walkable(self, x: int, y: int) -> bool:
+        """Check if (x, y) is inside the map and not a wall."""
+        return (
+            0 <= x < self.width and 0 <= y < self.height
+            and self._cell_flat[self._rows[y] + self._cols[x]] != _WALL_BYTE
+        )
+
+    def ray_length(self, x: int, y: int, direction: int) -> int:
+        """
+        Count open cells beyond (x, y) in a direction before a wall or edge.
+
+        Args:
+            x, y: Origin cell (may be a wall)
+            direction: Index into maps.rays.DIRECTIONS
+
+        Returns:
+            Number of walkable cells; 0 if (x, y) is out of bounds
+        """
+        if not self.in_bounds(x, y):
+            return 0
+        return self._ray_flat[(self._rows[y] + self._cols[x]) * 4 + direction]
+
+    def move_mask(self, x: int, y: int) -> int:
+        """4-bit mask of the directions a move from (x, y) can go; 0 if out of bounds."""
+        return self._move_flat[self._rows[y] + self._cols[x]] if self.in_bounds(x, y) else 0
+
+    def can_move(self, x: int, y: int, direction: int) -> bool:
+        """Whether a move from (x, y) in a direction (maps.rays.DIRECTIONS index) succeeds."""
+        return bool(self.move_mask(x, y) >> direction & 1)
+
+    def sample_walkable(
+        self,
+        rng: np.random.Generator,
+        exclude: Iterable[Tuple[int, int]] = ()
+    ) -> Tuple[int, int]:
+        """
+        Uniformly pick a walkable cell not in `exclude`, without rejection.
+        One draw over the remaining cells, shifted past excluded ranks:
+        O(len(exclude) * log(walkable)) regardless of map size.
+
+        Args:
+            rng: Random stream
+            exclude: Positions to avoid (non-walkable ones are ignored)
+
+        Returns:
+            (x, y) walkable position
+
+        Raises:
+            RuntimeError: If every walkable cell is excluded
+        """
+        return sample_excluding(self.walkable, self.width, rng, exclude)
+
+    def cell(self, x: int, y: int) -> str:
+        """Get the cell character at (x, y); out of bounds reads as wall."""
+        if not self.in_bounds(x, y):
+            return WALL
+        return chr(self._cell_flat[self._rows[y] + self._cols[x]])
+
+    def window(self, cx: int, cy: int, radius: int) -> List[List[str]]:
+        """
+        Slice a (2*radius+1) square centered on (cx, cy).
+        Out-of-bounds cells are filled with walls.
+        """
+        return cells_to_rows(self.cell_chunks.window(cx, cy, radius))
+
+    def to_grid(self) -> List[List[str]]:
+        """Expand back to a list-of-lists grid (for API responses)."""
+        return cells_to_rows(self.cells)
+
+
+def cells_to_rows(cells: np.ndarray) -> List[List[str]]:
+    """Rows of a uint8 character array as lists of one-character strings."""
+    width = cells.shape[1]
+    data = cells.tobytes().decode('ascii')
+    return [list(data[i:i + width]) for i in range(0, len(data), width)]
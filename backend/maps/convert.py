@@ -0,0 +1,69 @@
+"""
+Convert maps to the binary .cmz format.
+
+Usage:
+    python -m backend.maps.convert map1.txt
+    python -m backend.maps.convert path/to/big.txt -o big.cmz
+    python -m backend.maps.convert gen:7:1000x1000 -o backend/maps/maze7.cmz
+"""
+import argparse
+import os
+import sys
+
+from backend.maps.binary import MAPS_DIR, binary_path_for, file_crc32, save_binary_map
+from backend.maps.compiled import CompiledMap
+from backend.maps.generator import generate_maze, parse_generated_name
+from backend.maps.loader import load_map
+
+
+def convert(source: str, output: str = None) -> str:
+    """
+    Write one map as .cmz.
+
+    Args:
+        source: Text map path, map name in the maps directory, or a
+            generated-map name ("gen:<seed>[:<w>x<h>]")
+        output: Destination (default: next to the text map)
+
+    Returns:
+        Path written
+
+    Raises:
+        ValueError: If a generated map has no output path
+    """
+    generated = parse_generated_name(source)
+    if generated is not None:
+        if output is None:
+            raise ValueError("generated maps need an output path")
+        save_binary_map(generate_maze(*generated), output)
+        return output
+
+    path = os.path.abspath(source) if os.path.isfile(source) else os.path.join(MAPS_DIR, source)
+    game_map = CompiledMap.from_grid(load_map(path), name=os.path.basename(path))
+    output = output or binary_path_for(path)
+    save_binary_map(game_map, output, file_crc32(path))
+    return output
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m backend.maps.convert", description=__doc__.splitlines()[1])
+    parser.add_argument("sources", nargs="+", help="text map files/names or gen:<seed>[:<w>x<h>] names")
+    parser.add_argument("-o", "--output", default=None, help="output path (single source only)")
+    args = parser.parse_args(argv)
+    if args.output and len(args.sources) > 1:
+        parser.error("--output needs exactly one source")
+
+    failed = False
+    for source in args.sources:
+        try:
+            output = convert(source, args.output)
+        except (OSError, ValueError) as e:
+            print(f"{source}: {e}", file=sys.stderr)
+            failed = True
+            continue
+        print(f"{source} -> {output} ({os.path.getsize(output)} bytes)")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,185 @@
+"""
+Per-map BFS distance fields.
+Shortest walking distances to the exit and between every pair of walkable
+cells, computed once per map and cached on disk next to the map file (maps/distance_cache.py).
+"""
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+import numpy as np
+
+from backend.maps.bfs import UNREACHABLE, bfs_distances
+from backend.maps.compiled import WALL, CompiledMap
+from backend.maps.distance_cache import cache_path, load_tables, save_tables
+from backend.maps.rays import DIRECTIONS
+
+PAIRS_MAX_CELLS = 4096  # Larger maps use per-target fields instead of a pair table
+_PAIR_UNREACHABLE = np.iinfo(np.uint16).max
+_SOURCE_CHUNK = 256  # BFS sources expanded together (bounds memory)
+_TARGET_FIELDS = 16  # Per-target fields kept for maps without a pair table
+_WALL_BYTE = ord(WALL)
+
+
+class DistanceFields:
+    """
+    Shortest-path lookups for one map.
+
+    Attributes:
+        to_exit: (H, W) uint32 steps to the exit (exit BFS run if not given)
+        pairs: (N, N) uint16 steps between walkable cells (N = walkable count),
+            computed on first use if not given; only for maps with at most
+            PAIRS_MAX_CELLS walkable cells
+        rank: (H * W) int32 index into pairs for each cell, -1 for walls
+        walls: (H, W) uint8 wall mask the BFS runs use (assembled once)
+        cache_path: Disk cache the pair table is added to once built (or None)
+    """
+
+    def __init__(self, game_map: CompiledMap, to_exit: Optional[np.ndarray] = None, pairs: Optional[np.ndarray] = None):
+        self.game_map = game_map
+        self.walls = game_map.walls
+        self.width = game_map.width
+        self.to_exit = _field_from(self.walls, game_map.exit) if to_exit is None else to_exit
+        self._pairs = pairs
+        self.rank = np.full(game_map.width * game_map.height, -1, dtype=np.int32)
+        self.rank[game_map.walkable] = np.arange(len(game_map.walkable), dtype=np.int32)
+        self._is_walkable = game_map.is_walkable
+        self.has_pair_table = len(game_map.walkable) <= PAIRS_MAX_CELLS
+        self._targets: 'OrderedDict[tuple, Tuple[np.ndarray, int, int]]' = OrderedDict()
+        self.cache_path: Optional[str] = None
+
+    @staticmethod
+    def compute(game_map: CompiledMap) -> 'DistanceFields':
+        """Run the exit BFS for a map (the pair table is built on first use)."""
+        return DistanceFields(game_map)
+
+    @property
+    def pairs(self) -> np.ndarray:
+        """All-pairs table, computed on first access (ValueError on large maps)."""
+        if self._pairs is None:
+            if not self.has_pair_table:
+                raise ValueError(f"No pair table for maps over {PAIRS_MAX_CELLS} walkable cells")
+            self._pairs = self._compute_pairs()
+            if self.cache_path:
+                save_tables(self.game_map, self.cache_path, self.to_exit, self._pairs)
+        return self._pairs
+
+    def _compute_pairs(self) -> np.ndarray:
+        """BFS from every walkable cell, _SOURCE_CHUNK sources per pass."""
+        height, width = self.walls.shape
+        walkable = self.game_map.walkable
+        pairs = np.empty((len(walkable), len(walkable)), dtype=np.uint16)
+        for lo in range(0, len(walkable), _SOURCE_CHUNK):
+            sources = walkable[lo:lo + _SOURCE_CHUNK]
+            seeds = np.zeros((len(sources), height * width), dtype=bool)
+            seeds[np.arange(len(sources)), sources] = True
+            dist = bfs_distances(self.walls, seeds.reshape(-1, height, width))
+            dist = dist.reshape(len(sources), -1)[:, walkable]
+            pairs[lo:lo + len(sources)] = np.minimum(dist, _PAIR_UNREACHABLE)
+        return pairs
+
+    def _target_field(self, target: Tuple[int, int], radius: Optional[int] = None) -> Tuple[np.ndarray, int, int]:
+        """
+        Steps to target from every cell, or only within the square of the
+        given radius around it, with the field's (left, top) map offset.
+        Recently used fields are kept.
+        """
+        key = (target, radius)
+        entry = self._targets.pop(key, None)
+        if entry is None:
+            if radius is None:
+                entry = (_field_from(self.walls, target), 0, 0)
+            else:
+                # Paths of at most radius steps never leave the square
+                window = self.game_map.cell_chunks.window(target[0], target[1], radius) == _WALL_BYTE
+                entry = (_field_from(window, (radius, radius)), target[0] - radius, target[1] - radius)
+            if len(self._targets) >= _TARGET_FIELDS:
+                self._targets.popitem(last=False)
+        self._targets[key] = entry
+        return entry
+
+    def exit_distance(self, x: int, y: int) -> int:
+        """Steps from (x, y) to the exit (UNREACHABLE if none)."""
+        return int(self.to_exit[y, x])
+
+    def distance(self, a: Tuple[int, int], b: Tuple[int, int], limit: Optional[int] = None) -> int:
+        """
+        Steps between two cells (UNREACHABLE if either is a wall or no path).
+        With a limit, longer paths count as UNREACHABLE too, and unless the
+        pair table is already built only the cells within limit of b are
+        searched (so large maps never run a whole-map BFS).
+        """
+        ra, rb = self.rank[a[1] * self.width + a[0]], self.rank[b[1] * self.width + b[0]]
+        if ra < 0 or rb < 0:
+            return int(UNREACHABLE)
+        if self._pairs is not None or (limit is None and self.has_pair_table):
+            steps = self.pairs[ra, rb]
+            steps = int(UNREACHABLE) if steps == _PAIR_UNREACHABLE else int(steps)
+        else:
+            field, left, top = self._target_field(b, limit)
+            x, y = a[0] - left, a[1] - top
+            inside = 0 <= y < field.shape[0] and 0 <= x < field.shape[1]
+            steps = int(field[y, x]) if inside else int(UNREACHABLE)
+        return steps if limit is None or steps <= limit else int(UNREACHABLE)
+
+    def _best_neighbour(self, pos: Tuple[int, int], score, sign: int) -> Optional[int]:
+        """Direction index of the walkable neighbour minimising sign * score."""
+        best, best_value = None, None
+        for direction, (dx, dy) in enumerate(DIRECTIONS):
+            nx, ny = pos[0] + dx, pos[1] + dy
+            if self._is_walkable(nx, ny):
+                value = score((nx, ny))
+                if value != UNREACHABLE and (best_value is None or sign * value < sign * best_value):
+                    best, best_value = direction, value
+        return best
+
+    def step_toward_exit(self, pos: Tuple[int, int]) -> Optional[int]:
+        """Direction index (maps.rays.DIRECTIONS) of a shortest step to the exit."""
+        return self._best_neighbour(pos, lambda p: self.to_exit[p[1], p[0]], 1)
+
+    def step_toward(self, pos: Tuple[int, int], target: Tuple[int, int], limit: Optional[int] = None) -> Optional[int]:
+        """Direction index of a shortest step toward target (chasing), limit as in distance()."""
+        return self._best_neighbour(pos, lambda p: self.distance(p, target, limit), 1)
+
+    def step_away(self, pos: Tuple[int, int], threat: Tuple[int, int]) -> Optional[int]:
+        """Direction index of the step that gets furthest from threat (fleeing)."""
+        return self._best_neighbour(pos, lambda p: self.distance(p, threat), -1)
+
+
+def _field_from(walls: np.ndarray, source: Tuple[int, int]) -> np.ndarray:
+    """(H, W) steps from every cell to one source cell."""
+    seed = np.zeros((1,) + walls.shape, dtype=bool)
+    seed[0, source[1], source[0]] = True
+    return bfs_distances(walls, seed)[0]
+
+
+_FIELDS: 'weakref.WeakKeyDictionary[CompiledMap, DistanceFields]' = weakref.WeakKeyDictionary()
+_LOCK = threading.Lock()
+
+
+def get_distance_fields(game_map: CompiledMap) -> DistanceFields:
+    """
+    Distance fields for a map: from memory, then disk, else computed
+    (and written to disk when the map has a file; write errors are ignored).
+    Pair tables are built lazily and added to the disk cache once built;
+    large maps never get one (per-target BFS fields).
+    """
+    fields = _FIELDS.get(game_map)
+    if fields is not None:
+        return fields
+
+    with _LOCK:
+        fields = _FIELDS.get(game_map)
+        if fields is None:
+            path = cache_path(game_map)
+            tables = load_tables(game_map, path) if path else None
+            if tables is not None:
+                fields = DistanceFields(game_map, *tables)
+            else:
+                fields = DistanceFields.compute(game_map)
+                if path:
+                    save_tables(game_map, path, fields.to_exit)
+            fields.cache_path = path
+            _FIELDS[game_map] = fields
+    return fields
@@ -0,0 +1,59 @@
+"""
+On-disk cache of per-map distance tables, next to the map file.
+Entries are keyed by a digest of the walls and exit and written atomically.
+"""
+import hashlib
+import os
+from typing import Optional, Tuple
+
+import numpy as np
+
+from backend.maps.compiled import CompiledMap
+
+CACHE_SUFFIX = ".dist.npz"
+MAPS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+_FORMAT = 2  # Bumped when the cached arrays change (2: uint32 exit field)
+
+
+def map_digest(game_map: CompiledMap) -> str:
+    """Digest of the wall layout and exit the tables were computed for."""
+    walls = game_map.walls
+    header = np.array(walls.shape + game_map.exit + (_FORMAT,), dtype=np.int64).tobytes()
+    return hashlib.sha1(header + walls.tobytes()).hexdigest()
+
+
+def cache_path(game_map: CompiledMap) -> Optional[str]:
+    """Disk cache path next to the map file, or None for maps without a file."""
+    if game_map.name is None or not os.path.exists(os.path.join(MAPS_DIR, game_map.name)):
+        return None
+    return os.path.join(MAPS_DIR, game_map.name + CACHE_SUFFIX)
+
+
+def load_tables(game_map: CompiledMap, path: str) -> Optional[Tuple[np.ndarray, Optional[np.ndarray]]]:
+    """
+    Tables cached for this exact map.
+
+    Returns:
+        (to_exit, pairs) with pairs None if it was not cached yet, or None
+        when there is no valid cache entry
+    """
+    try:
+        with np.load(path) as data:
+            if str(data["digest"]) != map_digest(game_map):
+                return None
+            return data["to_exit"], data["pairs"] if "pairs" in data.files else None
+    except (OSError, KeyError, ValueError):
+        return None
+
+
+def save_tables(game_map: CompiledMap, path: str, to_exit: np.ndarray, pairs: Optional[np.ndarray] = None):
+    """Write the tables built so far atomically (workers may race); errors are ignored."""
+    tmp = f"{path}.{os.getpid()}.tmp.npz"
+    try:
+        tables = {} if pairs is None else {"pairs": pairs}
+        np.savez(tmp, digest=map_digest(game_map), to_exit=to_exit, **tables)
+        os.replace(tmp, path)
+    except OSError:
+        if os.path.exists(tmp):
+            os.remove(tmp)
@@ -0,0 +1,147 @@
+"""
+Procedural maze generator.
+Builds many seeded mazes at once with NumPy, validates them with a batched
+flood fill and returns CompiledMaps directly (no text round trip).
+"""
+import re
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from backend.maps.compiled import CompiledMap, WALL, START, EXIT
+from backend.maps.bfs import bfs_distances, UNREACHABLE
+
+GENERATED_PREFIX = "gen:"
+_NAME_RE = re.compile(r"^gen:(\d+)(?::(\d+)x(\d+))?$")
+
+OPEN = '.'
+
+
+def generated_map_name(seed: int, width: int = 50, height: int = 50) -> str:
+    """Registry name of a generated map ("gen:<seed>" or "gen:<seed>:<w>x<h>")."""
+    if (width, height) == (50, 50):
+        return f"{GENERATED_PREFIX}{seed}"
+    return f"{GENERATED_PREFIX}{seed}:{width}x{height}"
+
+
+def parse_generated_name(name: str) -> Optional[Tuple[int, int, int]]:
+    """(seed, width, height) for a generated map name, or None."""
+    match = _NAME_RE.match(name)
+    if match is None:
+        return None
+    seed, width, height = match.groups()
+    return int(seed), int(width or 50), int(height or 50)
+
+
+def _carve(rngs: List[np.random.Generator], width: int, height: int, loop_fraction: float) -> np.ndarray:
+    """
+    Binary-tree mazes for all seeds at once: every odd cell opens a passage
+    north or east, which connects all cells; then random extra walls are
+    knocked out to add loops.
+
+    Returns:
+        (N, H, W) bool open-cell masks
+    """
+    n = len(rngs)
+    xs, ys = np.arange(1, width - 1, 2), np.arange(1, height - 1, 2)
+    open_cells = np.zeros((n, height, width), dtype=bool)
+    open_cells[:, ys[:, None], xs[None, :]] = True
+
+    north = np.stack([rng.random((len(ys), len(xs))) < 0.5 for rng in rngs])
+    north[:, 0, :] = False   # Top row can only go east
+    north[:, :, -1] = True   # Last column can only go north
+    north[:, 0, -1] = False  # Top-right cell is the root
+    east = ~north
+    east[:, 0, -1] = False
+
+    maze, row, col = np.nonzero(north)
+    open_cells[maze, ys[row] - 1, xs[col]] = True
+    maze, row, col = np.nonzero(east)
+    open_cells[maze, ys[row], xs[col] + 1] = True
+
+    # Loops: open walls that sit between two cells
+    between = np.zeros((height, width), dtype=bool)
+    between[ys[:, None], xs[None, :-1] + 1] = True
+    between[ys[:-1, None] + 1, xs[None, :]] = True
+    knock = np.stack([rng.random((height, width)) < loop_fraction for rng in rngs])
+    open_cells |= knock & between
+    return open_cells
+
+
+def _place_endpoints(
+    rngs: List[np.random.Generator],
+    open_cells: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Random start per maze; exit at the reachable cell farthest from it.
+    Uses one batched flood fill for all mazes.
+
+    Returns:
+        (starts, exits, valid) with flat cell indices and a bool per maze
+    """
+    n, height, width = open_cells.shape
+    flat_open = open_cells.reshape(n, -1)
+    starts = np.array([rng.choice(np.flatnonzero(cells)) for rng, cells in zip(rngs, flat_open)])
+
+    seeds = np.zeros((n, height * width), dtype=bool)
+    seeds[np.arange(n), starts] = True
+    dist = bfs_distances(~open_cells, seeds.reshape(n, height, width)).reshape(n, -1)
+    reach = np.where(dist == UNREACHABLE, -1, dist.astype(np.int32))
+    exits = reach.argmax(axis=1)
+    valid = reach[np.arange(n), exits] > 0
+    return starts, exits, valid
+
+
+def generate_cells(
+    seeds: Sequence[int],
+    width: int = 50,
+    height: int = 50,
+    loop_fraction: float = 0.1
+) -> np.ndarray:
+    """
+    Generate validated maze cell arrays for many seeds.
+
+    Args:
+        seeds: One seed per maze; same seed and size give the same maze
+        width, height: Maze size (at least 5x5)
+        loop_fraction: Share of inner walls knocked out to create loops
+
+    Returns:
+        (N, H, W) uint8 array of '#', '.', 'S', 'E' characters
+
+    Raises:
+        ValueError: If the size is too small
+    """
+    if width < 5 or height < 5:
+        raise ValueError(f"Maze must be at least 5x5, got {width}x{height}")
+
+    rngs = [np.random.default_rng(np.random.SeedSequence([int(seed), width, height])) for seed in seeds]
+    open_cells = _carve(rngs, width, height, loop_fraction)
+    starts, exits, valid = _place_endpoints(rngs, open_cells)
+    if not valid.all():
+        raise RuntimeError(f"Generated maze without an S->E path for seeds {np.asarray(seeds)[~valid]}")
+
+    n = len(rngs)
+    cells = np.where(open_cells, ord(OPEN), ord(WALL)).astype(np.uint8).reshape(n, -1)
+    cells[np.arange(n), starts] = ord(START)
+    cells[np.arange(n), exits] = ord(EXIT)
+    return cells.reshape(n, height, width)
+
+
+def generate_mazes(
+    seeds: Sequence[int],
+    width: int = 50,
+    height: int = 50,
+    loop_fraction: float = 0.1
+) -> List[CompiledMap]:
+    """Generate compiled mazes for many seeds (see generate_cells)."""
+    cells = generate_cells(seeds, width, height, loop_fraction)
+    return [
+        CompiledMap(maze, name=generated_map_name(int(seed), width, height))
+        for seed, maze in zip(seeds, cells)
+    ]
+
+
+def generate_maze(seed: int, width: int = 50, height: int = 50) -> CompiledMap:
+    """Generate a single compiled maze."""
+    return generate_mazes([seed], width, height)[0]
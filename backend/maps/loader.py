@@ -1,6 +1,6 @@
 """
 Map loader module.
-Reads 50x50 maze from text file.
+Reads a rectangular maze (any size) from a text file.
 """
 import os
 from typing import List, Tuple, Optional
@@ -14,11 +14,11 @@ def load_map(map_name: str = "map1.txt") -> List[List[str]]:
         map_name: Name of map file (default: map1.txt)
 
     Returns:
-        50x50 2D list of characters
+        height x width 2D list of characters
 
     Raises:
         FileNotFoundError: If map file doesn't exist
-        ValueError: If map is not 50x50
+        ValueError: If map is empty or its rows differ in length
     """
     current_dir = os.path.dirname(os.path.abspath(__file__))
     map_path = os.path.join(current_dir, map_name)
@@ -36,13 +36,13 @@ def load_map(map_name: str = "map1.txt") -> List[List[str]]:
         if line:  # Skip empty lines
             grid.append(list(line))
 
-    # Validate map size
-    if len(grid) != 50:
-        raise ValueError(f"Map must have 50 rows, got {len(grid)}")
+    # Validate map shape
+    if not grid:
+        raise ValueError("Map has no rows")
 
     for i, row in enumerate(grid):
-        if len(row) != 50:
-            raise ValueError(f"Row {i} must have 50 columns, got {len(row)}")
+        if len(row) != len(grid[0]):
+            raise ValueError(f"Row {i} must have {len(grid[0])} columns, got {len(row)}")
 
     return grid
 
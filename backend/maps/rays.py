@@ -0,0 +1,57 @@
+"""
+Per-cell ray-distance table.
+For every cell, counts the open cells before the next wall in each direction.
+"""
+from typing import Dict, Tuple
+import numpy as np
+
+# Direction order used by the table: UP, DOWN, LEFT, RIGHT
+DIRECTIONS: Tuple[Tuple[int, int], ...] = ((0, -1), (0, 1), (-1, 0), (1, 0))
+DIRECTION_INDEX: Dict[Tuple[int, int], int] = {vec: i for i, vec in enumerate(DIRECTIONS)}
+
+
+def compute_ray_distances(walls: np.ndarray) -> np.ndarray:
+    """
+    Build the ray-distance table for a wall mask.
+
+    table[y, x, d] is the number of consecutive walkable cells strictly
+    beyond (x, y) in direction d before a wall or the map edge. It is
+    defined for wall cells too, since bullets start one cell away from
+    the shooter.
+
+    Args:
+        walls: (height, width) array, nonzero for walls
+
+    Returns:
+        (height, width, 4) uint16 array
+    """
+    height, width = walls.shape
+    open_cells = (walls == 0).astype(np.int32)
+    table = np.zeros((height, width, 4), dtype=np.int32)
+
+    # Each step looks one cell further: dist = open(next) * (1 + dist(next))
+    for y in range(1, height):
+        table[y, :, 0] = open_cells[y - 1] * (1 + table[y - 1, :, 0])
+    for y in range(height - 2, -1, -1):
+        table[y, :, 1] = open_cells[y + 1] * (1 + table[y + 1, :, 1])
+    for x in range(1, width):
+        table[:, x, 2] = open_cells[:, x - 1] * (1 + table[:, x - 1, 2])
+    for x in range(width - 2, -1, -1):
+        table[:, x, 3] = open_cells[:, x + 1] * (1 + table[:, x + 1, 3])
+
+    return table.astype(np.uint16)
+
+
+def move_mask_from_rays(rays: np.ndarray) -> np.ndarray:
+    """
+    4-bit move mask from a ray table (any leading shape, last axis the 4
+    directions): bit d is set when the neighbour in direction d is an
+    in-bounds walkable cell, i.e. the ray in that direction is non-empty.
+
+    Returns:
+        uint8 array of the ray table's shape without the last axis
+    """
+    # A cell's 4 direction flags are 4 consecutive bytes: read them as one
+    # little-endian uint32 and fold bytes 1-3 down to bits 1-3
+    flags = np.ascontiguousarray(rays > 0).view('<u4')[..., 0]
+    return ((flags | flags >> 7 | flags >> 14 | flags >> 21) & 0xF).astype(np.uint8)
@@ -0,0 +1,72 @@
+"""
+Process-wide map registry.
+Each map is loaded and compiled once, then shared read-only by every game.
+"""
+import threading
+from typing import Dict, List
+
+from backend.maps.binary import load_map_cached
+from backend.maps.compiled import CompiledMap
+from backend.maps.generator import generate_maze, parse_generated_name
+
+# Compiled maps shared by all games in this process
+_MAP_REGISTRY: Dict[str, CompiledMap] = {}
+_LOCK = threading.Lock()
+
+
+def get_map(map_name: str = "map1.txt") -> CompiledMap:
+    """
+    Get a compiled map, loading it from disk on first use only.
+    Names like "gen:<seed>" or "gen:<seed>:<w>x<h>" are generated mazes,
+    rebuilt from their seed (so saved games on them reload too). Map files
+    are memory-mapped from their binary .cmz form (see maps.binary).
+
+    Args:
+        map_name: Registered name, generated-map name or map file name
+            (.txt or .cmz)
+
+    Returns:
+        Shared CompiledMap
+
+    Raises:
+        FileNotFoundError: If map file doesn't exist
+        ValueError: If map is not rectangular or lacks start/exit
+    """
+    compiled = _MAP_REGISTRY.get(map_name)
+    if compiled is not None:
+        return compiled
+
+    with _LOCK:
+        compiled = _MAP_REGISTRY.get(map_name)
+        if compiled is None:
+            generated = parse_generated_name(map_name)
+            if generated is not None:
+                compiled = generate_maze(*generated)
+            else:
+                compiled = load_map_cached(map_name)
+            _MAP_REGISTRY[map_name] = compiled
+    return compiled
+
+
+def register_map(game_map: CompiledMap):
+    """
+    Register an already-compiled map under its name.
+
+    Raises:
+        ValueError: If the map has no name
+    """
+    if game_map.name is None:
+        raise ValueError("Only named maps can be registered")
+    with _LOCK:
+        _MAP_REGISTRY[game_map.name] = game_map
+
+
+def list_maps() -> List[str]:
+    """Names of maps loaded or registered in this process."""
+    return list(_MAP_REGISTRY.keys())
+
+
+def clear_maps():
+    """Forget all maps (they are reloaded on next use)."""
+    with _LOCK:
+        _MAP_REGISTRY.clear()
@@ -0,0 +1,54 @@
+"""
+Walkable-cell sampling.
+Uniform picks from a map's sorted walkable-cell index, skipping excluded
+cells without a rejection loop.
+"""
+from typing import Iterable, Tuple
+
+import numpy as np
+
+
+def sample_excluding(
+    walkable: np.ndarray,
+    width: int,
+    rng: np.random.Generator,
+    exclude: Iterable[Tuple[int, int]] = ()
+) -> Tuple[int, int]:
+    """
+    Uniformly pick a walkable cell not in `exclude`.
+    One draw over the remaining cells, shifted past excluded ranks:
+    O(len(exclude) * log(walkable)) regardless of map size.
+
+    Args:
+        walkable: Sorted int32 flat indices (y * width + x) of walkable cells
+        width: Map width
+        rng: Random stream
+        exclude: Positions to avoid (non-walkable ones are ignored)
+
+    Returns:
+        (x, y) walkable position
+
+    Raises:
+        RuntimeError: If every walkable cell is excluded
+    """
+    last = int(walkable[-1]) if len(walkable) else -1
+    ranks = set()
+    for x, y in exclude:
+        key = y * width + x
+        if 0 <= x < width and 0 <= key <= last:
+            # int32 keys keep searchsorted from upcasting (copying) the index
+            rank = int(np.searchsorted(walkable, np.int32(key)))
+            if walkable[rank] == key:
+                ranks.add(rank)
+
+    available = len(walkable) - len(ranks)
+    if available <= 0:
+        raise RuntimeError("No walkable position left to sample")
+
+    rank = int(rng.integers(available))
+    for excluded in sorted(ranks):
+        if excluded > rank:
+            break
+        rank += 1
+    y, x = divmod(int(walkable[rank]), width)
+    return (x, y)
@@ -0,0 +1,4 @@
+"""
+Sim Module
+Headless game runner for throughput benchmarking (no database).
+"""
@@ -0,0 +1,28 @@
+"""
+Headless simulation CLI.
+
+Usage:
+    python -m backend.sim --games 100 --workers 4 --max-ticks 500
+"""
+import argparse
+import json
+
+from backend.sim.runner import run_games, format_report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m backend.sim", description=__doc__.splitlines()[1])
+    parser.add_argument("--games", type=int, default=20, help="number of games to play")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--max-ticks", type=int, default=500, help="tick limit per game")
+    parser.add_argument("--seed", type=int, default=0, help="base seed (game i uses seed + i)")
+    parser.add_argument("--generated-maps", action="store_true", help="play each game on its own generated maze")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+
+    report = run_games(args.games, args.workers, args.max_ticks, args.seed, args.generated_maps)
+    print(json.dumps(report, indent=2) if args.json else format_report(report))
+
+
+if __name__ == "__main__":
+    main()
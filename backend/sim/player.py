@@ -0,0 +1,68 @@
+"""
+Scripted player for headless games.
+"""
+from typing import Optional
+
+import numpy as np
+
+from backend.agents.base import Agent
+from backend.engine.actions import (
+    Action, MOVE_ACTIONS, SHOOT_ACTIONS, DIRECTION_VECTORS, WAIT
+)
+from backend.maps.compiled import CompiledMap
+from backend.maps.distance import get_distance_fields
+
+
+class ScriptedPlayer(Agent):
+    """
+    Heads for the exit: shoots entities in line of sight, otherwise takes
+    a shortest-path step to the exit (from the map's BFS distance field),
+    with occasional random moves.
+    """
+
+    def __init__(
+        self,
+        entity_id: str,
+        game_map: CompiledMap,
+        rng: Optional[np.random.Generator] = None,
+        wander: float = 0.1
+    ):
+        """
+        Args:
+            entity_id: Entity this agent controls (usually "player")
+            game_map: Map being played (its exit is the target)
+            rng: Random source (a fresh one if omitted)
+            wander: Probability of a random move instead of a greedy one
+        """
+        super().__init__(entity_id, persona="scripted", rng=rng)
+        self.game_map = game_map
+        self.wander = wander
+        self.distances = get_distance_fields(game_map)
+
+    def decide_action(self, observation: dict) -> Action:
+        """Pick an action from the observation (see class docstring)."""
+        vision = observation["vision"]
+        center = len(vision) // 2
+
+        if observation["ammo"] > 0:
+            for shoot in SHOOT_ACTIONS:
+                dx, dy = DIRECTION_VECTORS[shoot]
+                # The adjacent cell is skipped by bullets, so look two cells out
+                cell = vision[center + 2 * dy][center + 2 * dx]
+                if cell == 'P':
+                    return shoot
+
+        x, y = observation["position"]["x"], observation["position"]["y"]
+        moves = [
+            move for move in MOVE_ACTIONS
+            if self.game_map.is_walkable(x + DIRECTION_VECTORS[move][0], y + DIRECTION_VECTORS[move][1])
+        ]
+        if not moves:
+            return WAIT
+        if self.rng.random() < self.wander:
+            return moves[self.rng.integers(len(moves))]
+        direction = self.distances.step_toward_exit((x, y))
+        if direction is None:
+            # No path to the exit from this region of the map
+            return moves[self.rng.integers(len(moves))]
+        return MOVE_ACTIONS[direction]
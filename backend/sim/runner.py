@@ -0,0 +1,130 @@
+"""
+Headless game runner.
+Plays full games with RL agents and a scripted player on a process pool.
+"""
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, List, Optional
+
+from backend.agents.registry import create_agent
+from backend.engine.engine import GameEngine
+from backend.engine.profiler import TickProfiler, PHASES
+from backend.engine.rng import derive_rng
+from backend.engine.state_factory import create_new_state
+from backend.maps.generator import generated_map_name
+from backend.sim.player import ScriptedPlayer
+
+
+def play_game(game_index: int, seed: int, max_ticks: int, generated_map: bool = False) -> Dict[str, Any]:
+    """
+    Play one game to completion (or max_ticks) without a database.
+
+    Args:
+        game_index: Index of the game in the run (used for the game id)
+        seed: Game seed (placement and every agent's random stream)
+        max_ticks: Tick limit
+        generated_map: Play on the maze generated from `seed` instead of map1
+
+    Returns:
+        Dict with ticks, winner, player_alive, setup seconds and the
+        engine's per-phase profile summary
+    """
+    start = time.perf_counter()
+    map_name = generated_map_name(seed) if generated_map else "map1.txt"
+    world = create_new_state(map_name, game_id=f"sim-{game_index}", seed=seed)
+    agents = {
+        eid: create_agent("rl", eid, entity.persona, derive_rng(seed, "agent", eid))
+        for eid, entity in world.entities.items()
+        if entity.entity_type == "agent"
+    }
+    agents["player"] = ScriptedPlayer("player", world.game_map, derive_rng(seed, "agent", "player"))
+    engine = GameEngine(world, agents, log_events=False, profile=True)
+    setup = time.perf_counter() - start
+
+    engine.run(max_ticks - world.tick, observe="none")
+
+    return {
+        "ticks": world.tick,
+        "winner": world.winner_id,
+        "player_alive": world.entities["player"].alive,
+        "setup_seconds": setup,
+        "profile": engine.profiler.summary()
+    }
+
+
+def _play_game_args(args) -> Dict[str, Any]:
+    """Process-pool entry point."""
+    return play_game(*args)
+
+
+def run_games(
+    games: int,
+    workers: Optional[int] = None,
+    max_ticks: int = 500,
+    seed: int = 0,
+    generated_maps: bool = False
+) -> Dict[str, Any]:
+    """
+    Play `games` games and report throughput.
+
+    Args:
+        games: Number of games
+        workers: Worker processes (default: CPU count; 1 runs in-process)
+        max_ticks: Tick limit per game
+        seed: Base seed; game i uses seed + i
+        generated_maps: Give every game its own generated maze
+
+    Returns:
+        Report dict with totals, rates, setup seconds and the merged
+        per-phase tick profile (summed over games)
+    """
+    workers = workers or os.cpu_count() or 1
+    jobs = [(i, seed + i, max_ticks, generated_maps) for i in range(games)]
+
+    start = time.perf_counter()
+    if workers <= 1:
+        results: List[Dict[str, Any]] = [_play_game_args(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            chunksize = max(1, games // (workers * 4))
+            results = list(pool.map(_play_game_args, jobs, chunksize=chunksize))
+    wall = time.perf_counter() - start
+
+    ticks = sum(r["ticks"] for r in results)
+    profile = TickProfiler()
+    for r in results:
+        profile.merge(r["profile"])
+    return {
+        "games": games,
+        "workers": workers,
+        "ticks": ticks,
+        "wall_seconds": wall,
+        "ticks_per_sec": ticks / wall if wall else 0.0,
+        "games_per_sec": games / wall if wall else 0.0,
+        "player_wins": sum(r["winner"] == "player" for r in results),
+        "player_deaths": sum(not r["player_alive"] for r in results),
+        "setup_seconds": sum(r["setup_seconds"] for r in results),
+        "profile": profile.summary()
+    }
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    """Human-readable summary of a run_games() report."""
+    lines = [
+        f"Games: {report['games']} on {report['workers']} worker(s), {report['ticks']} ticks",
+        f"Wall time: {report['wall_seconds']:.2f}s",
+        f"Throughput: {report['ticks_per_sec']:.0f} ticks/s, {report['games_per_sec']:.2f} games/s",
+        f"Outcomes: {report['player_wins']} player wins, {report['player_deaths']} player deaths",
+        f"Setup: {report['setup_seconds']:.3f}s",
+        "Tick phases (summed over games):",
+    ]
+    phases = report["profile"]["phases"]
+    total = sum(stats["seconds"] for stats in phases.values()) or 1.0
+    for phase in PHASES:
+        stats = phases[phase]
+        lines.append(
+            f"  {phase:<10} {stats['seconds']:8.3f}s  {100 * stats['seconds'] / total:5.1f}%"
+            f"  {stats['mean_us']:8.1f}us/tick"
+        )
+    return "\n".join(lines)
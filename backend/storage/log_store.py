@@ -4,8 +4,9 @@ Event log storage operations.
 import json
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Union
 from backend.storage.models import Log
+from backend.engine.events import TickEvent
 
 
 class LogStoreError(Exception):
@@ -42,26 +43,49 @@ def append_log(
         raise LogStoreError(f"Failed to append log: {str(e)}")
 
 
+def _event_to_log(game_id: str, tick: int, event: Union[str, TickEvent], event_type: str) -> Log:
+    """Build a Log row from a text message or a structured tick event."""
+    if isinstance(event, TickEvent):
+        fields = event.to_log_fields()
+        return Log(
+            game_id=game_id,
+            tick=tick,
+            event_type=event_type,
+            message="",  # Rendered from extra_data["code"] when read
+            entity_id=fields["entity_id"],
+            extra_data=json.dumps(fields["extra_data"])
+        )
+    return Log(
+        game_id=game_id,
+        tick=tick,
+        event_type=event_type,
+        message=event,
+        entity_id=None,
+        extra_data=None
+    )
+
+
+def _log_message(log: Log, extra_data: Optional[Dict[str, Any]]) -> str:
+    """Stored message, or the rendered text of a structured tick event."""
+    if log.message:
+        return log.message
+    event = TickEvent.from_log_fields(log.entity_id, extra_data)
+    return event.render() if event else log.message
+
+
 def append_logs_batch(
     db: Session,
     game_id: str,
     tick: int,
-    events: List[str],
+    events: List[Union[str, TickEvent]],
     event_type: str = "game_event"
 ) -> int:
-    """Append multiple log entries in batch."""
+    """
+    Append multiple log entries in batch (text or structured tick events).
+    Every entry gets event_type; tick events keep their code in extra_data.
+    """
     try:
-        logs = [
-            Log(
-                game_id=game_id,
-                tick=tick,
-                event_type=event_type,
-                message=message,
-                entity_id=None,
-                extra_data=None
-            )
-            for message in events
-        ]
+        logs = [_event_to_log(game_id, tick, event, event_type) for event in events]
         db.add_all(logs)
         db.commit()
         return len(logs)
@@ -87,19 +111,20 @@ def read_logs(
             query = query.filter(Log.event_type == event_type)
         logs = query.order_by(Log.tick, Log.id).offset(offset).limit(limit).all()
 
-        return [
-            {
+        results = []
+        for log in logs:
+            extra_data = json.loads(log.extra_data) if log.extra_data else None
+            results.append({
                 "id": log.id,
                 "game_id": log.game_id,
                 "tick": log.tick,
                 "entity_id": log.entity_id,
                 "event_type": log.event_type,
-                "message": log.message,
-                "extra_data": json.loads(log.extra_data) if log.extra_data else None,
+                "message": _log_message(log, extra_data),
+                "extra_data": extra_data,
                 "created_at": log.created_at.isoformat() if log.created_at else None
-            }
-            for log in logs
-        ]
+            })
+        return results
     except (SQLAlchemyError, json.JSONDecodeError) as e:
         raise LogStoreError(f"Failed to read logs: {str(e)}")
 
@@ -0,0 +1,90 @@
+"""
+Test per-game agent pools and the persona config cache.
+"""
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from backend.agents import pool as agent_pool
+from backend.agents.personas import DEFAULT_PERSONA_CONFIG, load_persona_config
+from backend.agents.pool import AgentPool, get_agent_pool, drop_agent_pool, clear_agent_pools
+from backend.engine.engine import GameEngine
+from backend.engine.state_factory import create_new_state
+
+
+def test_persona_configs_are_cached():
+    """Configs are read once, from the package directory whatever the cwd."""
+    print("=== Agent Pool Test ===\n")
+    cwd = os.getcwd()
+    try:
+        os.chdir("/")
+        config = load_persona_config("cautious")
+    finally:
+        os.chdir(cwd)
+    assert config["name"] == "cautious" and "decision_weights" in config
+    assert load_persona_config("cautious") is config
+    assert load_persona_config("no-such-persona") is DEFAULT_PERSONA_CONFIG
+    print("  ✓ Persona configs load once, independent of the working directory")
+
+
+def _play(ticks, pooled):
+    """Entity trace of a game ticked like the API does (fresh engine each tick)."""
+    world = create_new_state(seed=12)
+    pool = AgentPool()
+    trace, seen = [], {}
+    for _ in range(ticks):
+        if world.game_over:
+            break
+        agents = (pool if pooled else AgentPool()).agents_for(world)
+        for eid, agent in agents.items():
+            seen.setdefault(eid, set()).add(id(agent))
+        GameEngine(world, agents, log_events=False).tick(observe=())
+        trace.extend((e.x, e.y, e.hp, e.alive) for e in world.entities.values())
+    return trace, seen
+
+
+def test_pooled_agents_replay_fresh_ones():
+    """Pooled agents are reused across ticks and play exactly like new ones."""
+    pooled, seen = _play(120, True)
+    fresh, _ = _play(120, False)
+    assert pooled == fresh
+    assert seen and all(len(ids) == 1 for ids in seen.values())
+    print("  ✓ Agents are reused across ticks and replay per-tick agents")
+
+    world = create_new_state(seed=3)
+    pool = AgentPool()
+    first = pool.agents_for(world)
+    victim = next(iter(first))
+    world.entities[victim].alive = False
+    assert victim not in pool.agents_for(world) and victim not in pool.agents
+    print("  ✓ Agents of dead entities are dropped")
+
+
+def test_pool_registry():
+    """Pools are per game, dropped on request and evicted oldest first."""
+    clear_agent_pools()
+    assert get_agent_pool("g1") is get_agent_pool("g1")
+    assert get_agent_pool("g1") is not get_agent_pool("g2")
+    drop_agent_pool("g1")
+    assert "g1" not in agent_pool._POOLS
+
+    saved = agent_pool.MAX_POOLS
+    agent_pool.MAX_POOLS = 3
+    try:
+        for game_id in ("a", "b", "c"):
+            get_agent_pool(game_id)
+        get_agent_pool("a")
+        get_agent_pool("d")
+        assert list(agent_pool._POOLS) == ["c", "a", "d"]
+    finally:
+        agent_pool.MAX_POOLS = saved
+        clear_agent_pools()
+    print("  ✓ Pools are per game with least-recently-used eviction")
+
+
+if __name__ == "__main__":
+    test_persona_configs_are_cached()
+    test_pooled_agents_replay_fresh_ones()
+    test_pool_registry()
+    print("\n=== All tests passed! ===")
@@ -0,0 +1,111 @@
+"""
+Test BatchGameEngine against GameEngine.
+Runs the same random action streams through both and compares state.
+"""
+import sys
+import os
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+
+from backend.engine.engine import GameEngine
+from backend.engine.batch import BatchGameEngine
+from backend.engine.state import WorldState
+from backend.engine.state_factory import create_new_state
+from backend.engine.actions import ALL_ACTIONS, MOVE_RIGHT, SHOOT_LEFT, MOVE_DOWN
+
+
+def snapshot(world):
+    """Comparable view of a world's mutable state."""
+    return (
+        world.tick, world.game_over, world.winner_id,
+        [
+            (e.x, e.y, e.hp, e.ammo, e.last_bullet_tick, e.alive, e.won, sorted(e.visited_positions))
+            for e in world.entities.values()
+        ]
+    )
+
+
+def make_crowded_world(rng, map_name="map1.txt"):
+    """New world with most agents stacked on the player's cell."""
+    world = create_new_state(map_name, seed=rng.randrange(2**32))
+    player = world.entities["player"]
+    for entity in world.entities.values():
+        if entity is not player and rng.random() < 0.7:
+            entity.x, entity.y = player.x, player.y
+    return world
+
+
+def run_against_engine(worlds, rng):
+    """Step worlds in a batch and one GameEngine each; returns the hit count."""
+    reference = [WorldState.from_dict(w.to_dict()) for w in worlds]
+    engines = [GameEngine(w) for w in reference]
+    batch = BatchGameEngine(worlds)
+
+    hits = 0
+    for tick in range(150):
+        actions = np.array([
+            [rng.randrange(len(ALL_ACTIONS)) for _ in w.entities] for w in worlds
+        ])
+        for w, engine, row in zip(reference, engines, actions):
+            for entity, code in zip(w.entities.values(), row):
+                entity.action_queue.append(ALL_ACTIONS[code])
+            engine.tick()
+        result = batch.step(actions)
+        hits += int((result["hit_target"] >= 0).sum())
+
+    batch.write_back()
+    for w, ref in zip(worlds, reference):
+        assert snapshot(w) == snapshot(ref), f"Mismatch in {w.game_id}"
+    return hits
+
+
+def test_batch_matches_engine():
+    """Batch stepping must reproduce GameEngine.tick exactly."""
+    print("=== Batch Engine Test ===\n")
+    rng = random.Random(1234)
+    worlds = [make_crowded_world(rng) for _ in range(24)]
+    assert BatchGameEngine(worlds).walls.ndim == 2  # One shared map table
+    hits = run_against_engine(worlds, rng)
+
+    print(f"   Worlds: {len(worlds)}, ticks: 150, hits: {hits}")
+    print(f"   Dead entities: {sum(not e.alive for w in worlds for e in w.entities.values())}")
+    assert hits > 0
+    print("   ✓ Batch state matches GameEngine\n")
+
+
+def test_batch_on_different_maps():
+    """Worlds on different maps of one size get per-world tables."""
+    rng = random.Random(77)
+    worlds = [make_crowded_world(rng, f"gen:{i % 3}:31x23") for i in range(9)]
+    assert BatchGameEngine(worlds).walls.shape == (9, 23, 31)
+    run_against_engine(worlds, rng)
+    print("   ✓ Per-world map tables match GameEngine\n")
+
+
+def test_batch_pops_queues():
+    """Queued actions are popped like GameEngine phase 1."""
+    world = create_new_state(seed=11)
+    reference = WorldState.from_dict(world.to_dict())
+    for w in (world, reference):
+        w.entities["player"].action_queue.extend([MOVE_RIGHT, SHOOT_LEFT, MOVE_DOWN])
+
+    batch = BatchGameEngine([world])
+    engine = GameEngine(reference)
+    for _ in range(4):
+        batch.step()
+        engine.tick()
+    batch.write_back()
+
+    assert snapshot(world) == snapshot(reference)
+    assert not world.entities["player"].action_queue
+    print("   ✓ Queue popping matches GameEngine\n")
+
+
+if __name__ == "__main__":
+    test_batch_matches_engine()
+    test_batch_on_different_maps()
+    test_batch_pops_queues()
+    print("=== All tests passed! ===")
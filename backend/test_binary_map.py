@@ -0,0 +1,94 @@
+"""
+Test the binary .cmz map format and its converter.
+"""
+import sys
+import os
+import random
+import tempfile
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import backend.maps.binary as binary
+from backend.maps.binary import load_binary_map, save_binary_map, read_header, load_map_cached
+from backend.maps.convert import main as convert_main
+from backend.maps.registry import get_map
+
+
+def test_round_trip_matches_compiled():
+    """A memory-mapped map answers every lookup like the compiled one."""
+    print("=== Binary Map Test ===\n")
+    game_map = get_map("gen:11:77x41")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "maze.cmz")
+        save_binary_map(game_map, path)
+        loaded = load_binary_map(path)
+        assert isinstance(loaded.cell_chunks.tiles.base, np.memmap)
+        assert loaded.name == "maze.cmz" and (loaded.start, loaded.exit) == (game_map.start, game_map.exit)
+        assert np.array_equal(loaded.cells, game_map.cells) and np.array_equal(loaded.rays, game_map.rays)
+        assert np.array_equal(loaded.walkable, game_map.walkable)
+
+        rng = random.Random(1)
+        for _ in range(1000):
+            x, y = rng.randrange(-2, 80), rng.randrange(-2, 44)
+            assert loaded.is_walkable(x, y) == game_map.is_walkable(x, y)
+            assert [loaded.ray_length(x, y, d) for d in range(4)] == [game_map.ray_length(x, y, d) for d in range(4)]
+            assert loaded.window(x, y, 2) == game_map.window(x, y, 2)
+        print("  ✓ Memory-mapped tables match the compiled map")
+
+        with open(path, "r+b") as f:
+            f.write(b"XXXX")
+        try:
+            read_header(path)
+            raise AssertionError("bad magic accepted")
+        except ValueError:
+            pass
+        save_binary_map(game_map, path)
+        with open(path, "r+b") as f:
+            f.truncate(os.path.getsize(path) // 2)
+        try:
+            load_binary_map(path)
+            raise AssertionError("truncated file accepted")
+        except ValueError:
+            pass
+    print("  ✓ Corrupt and truncated files are rejected")
+
+
+def test_text_maps_use_binary_cache():
+    """Text maps are cached as .cmz and recompiled when the text changes."""
+    grid = ["#######", "#S...E#", "#.###.#", "#.....#", "#######"]
+    saved_dir = binary.MAPS_DIR
+    with tempfile.TemporaryDirectory() as tmp:
+        binary.MAPS_DIR = tmp
+        try:
+            text = os.path.join(tmp, "small.txt")
+            with open(text, "w") as f:
+                f.write("\n".join(grid))
+            first = load_map_cached("small.txt")
+            cached = os.path.join(tmp, "small.cmz")
+            assert read_header(cached)["source_crc"] == binary.file_crc32(text)
+            second = load_map_cached("small.txt")
+            assert isinstance(second.cell_chunks.tiles.base, np.memmap)
+            assert second.to_grid() == first.to_grid() and second.name == "small.txt"
+
+            with open(text, "w") as f:
+                f.write("\n".join(row.replace("#.###", "#..##") for row in grid))
+            assert load_map_cached("small.txt").cell(2, 2) == "."
+            assert load_binary_map(cached).cell(2, 2) == "."
+        finally:
+            binary.MAPS_DIR = saved_dir
+    print("  ✓ .cmz cache is reused, and rebuilt when the text changes")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        output = os.path.join(tmp, "gen.cmz")
+        assert convert_main(["gen:3:31x21", "-o", output]) == 0
+        assert load_binary_map(output).to_grid() == get_map("gen:3:31x21").to_grid()
+        assert convert_main(["gen:3"]) == 1
+    print("  ✓ Converter CLI writes loadable files")
+
+
+if __name__ == "__main__":
+    test_round_trip_matches_compiled()
+    test_text_maps_use_binary_cache()
+    print("\n=== All tests passed! ===")
@@ -0,0 +1,146 @@
+"""
+Test BFS distance fields against a plain queue-based BFS.
+"""
+import sys
+import os
+import random
+import tempfile
+from collections import deque
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import backend.maps.distance_cache as distance_cache
+from backend.agents.rl.agent import RLAgent, chase_direction
+from backend.engine.actions import MOVE_DOWN, MOVE_RIGHT
+from backend.engine.observation import generate_observation
+from backend.engine.state import WorldState, create_entity
+from backend.maps.compiled import CompiledMap
+from backend.maps.distance import DistanceFields, UNREACHABLE, get_distance_fields
+from backend.maps.rays import DIRECTIONS
+from backend.maps.registry import get_map
+
+
+def reference_bfs(game_map, source):
+    """Dict of position -> steps from source."""
+    dist, queue = {source: 0}, deque([source])
+    while queue:
+        x, y = queue.popleft()
+        for dx, dy in DIRECTIONS:
+            nxt = (x + dx, y + dy)
+            if nxt not in dist and game_map.is_walkable(*nxt):
+                dist[nxt] = dist[(x, y)] + 1
+                queue.append(nxt)
+    return dist
+
+
+def test_fields_match_reference_bfs():
+    """Exit field, pair table and steps agree with a simple BFS."""
+    print("=== Distance Field Test ===\n")
+    game_map = get_map("map1.txt")
+    fields = get_distance_fields(game_map)
+
+    to_exit = reference_bfs(game_map, game_map.exit)
+    cells = [(int(i) % game_map.width, int(i) // game_map.width) for i in game_map.walkable]
+    for x, y in cells:
+        assert fields.exit_distance(x, y) == to_exit.get((x, y), UNREACHABLE)
+    print(f"  ✓ Exit field matches ({len(to_exit)} of {len(cells)} cells reach the exit)")
+
+    rng = random.Random(2)
+    for source in rng.sample(cells, 12):
+        expected = reference_bfs(game_map, source)
+        for target in rng.sample(cells, 200):
+            assert fields.distance(source, target) == expected.get(target, UNREACHABLE)
+        target = rng.choice(list(expected))
+        if target != source:
+            dx, dy = DIRECTIONS[fields.step_toward(source, target)]
+            assert expected[target] - 1 == fields.distance((source[0] + dx, source[1] + dy), target)
+    assert fields.distance((0, 0), game_map.exit) == UNREACHABLE
+    print("  ✓ Pair table and chase steps match")
+
+
+def test_disk_cache_round_trip():
+    """Fields are written next to the map file and reloaded from it."""
+    grid = ["#######", "#S...E#", "#.###.#", "#.....#", "#######"]
+    saved_dir = distance_cache.MAPS_DIR
+    with tempfile.TemporaryDirectory() as tmp:
+        distance_cache.MAPS_DIR = tmp
+        try:
+            with open(os.path.join(tmp, "small.txt"), "w") as f:
+                f.write("\n".join(grid))
+            game_map = CompiledMap.from_grid(grid, name="small.txt")
+            computed = get_distance_fields(game_map)
+            path = os.path.join(tmp, "small.txt" + distance_cache.CACHE_SUFFIX)
+            same_map = CompiledMap.from_grid(grid, name="small.txt")
+            # The pair table is only written once something builds it
+            to_exit, pairs = distance_cache.load_tables(same_map, path)
+            assert (to_exit == computed.to_exit).all() and pairs is None
+            pairs = computed.pairs  # Built now, and added to the cache
+            assert (distance_cache.load_tables(same_map, path)[1] == pairs).all()
+            other = CompiledMap.from_grid([row.replace("#.###", "#..##") for row in grid], name="small.txt")
+            assert distance_cache.load_tables(other, path) is None
+        finally:
+            distance_cache.MAPS_DIR = saved_dir
+    assert DistanceFields.compute(game_map).exit_distance(1, 1) == 4
+    print("  ✓ Disk cache round trip and stale-cache detection")
+
+
+def test_limited_distances_search_a_window():
+    """Distances up to a limit match the pair table without building it."""
+    game_map = get_map("map1.txt")
+    fields, full = DistanceFields.compute(game_map), get_distance_fields(game_map)
+    rng = random.Random(4)
+    cells = [(int(i) % game_map.width, int(i) // game_map.width) for i in game_map.walkable]
+    for source in rng.sample(cells, 300):
+        target = (source[0] + rng.randint(-2, 2), source[1] + rng.randint(-2, 2))
+        if game_map.is_walkable(*target):
+            steps = full.distance(source, target)
+            assert fields.distance(source, target, 6) == (steps if steps <= 6 else UNREACHABLE)
+            if 0 < steps <= 6:
+                assert fields.step_toward(source, target, 6) == full.step_toward(source, target)
+    assert fields._pairs is None
+    print("  ✓ Limited distances and chase steps match without a pair table")
+
+
+def _chase_observation(rows):
+    """Observation of an agent two cells left of the player on a small map."""
+    game_map = CompiledMap.from_grid(rows)
+    world = WorldState(
+        game_id="chase", tick=0, game_map=game_map,
+        start_x=1, start_y=1, exit_x=5, exit_y=1,
+        entities={
+            "player": create_entity("player", "player", 4, 1, map_width=7, map_height=4),
+            "agent": create_entity("agent", "agent", 2, 1, "aggressive", 7, 4)
+        },
+        bullets=[], game_over=False, winner_id=None
+    )
+    world.entities["agent"].ammo = 0
+    return generate_observation(world, "agent")
+
+
+def test_chase_follows_walking_distance():
+    """Across a wall the agent chases around it, or not at all if too far."""
+    opened = _chase_observation(["#######", "#S...E#", "#.....#", "#######"])
+    walled = _chase_observation(["#######", "#S.#.E#", "#.....#", "#######"])
+    assert opened["entities"] == [{"relative_x": 2, "relative_y": 0, "distance": 2, "direction": 3}]
+    assert walled["entities"] == [{"relative_x": 2, "relative_y": 0, "distance": 4, "direction": 1}]
+
+    # Explorers chase up to 3 steps: the player is 2 cells away either way,
+    # but 4 walking steps behind the wall
+    explorer = RLAgent("agent", "explorer").persona_config
+    assert chase_direction(opened, explorer) == 3 and chase_direction(walled, explorer) is None
+
+    agent = RLAgent("agent", "aggressive", np.random.default_rng(16))
+    agent.policy.update_epsilon(0.0)
+    agent.policy.update_temperature(0.1)
+    assert agent.decide_action(opened) == MOVE_RIGHT and agent.decide_action(walled) == MOVE_DOWN
+    print("  ✓ Chasing follows walking distance around walls")
+
+
+if __name__ == "__main__":
+    test_fields_match_reference_bfs()
+    test_disk_cache_round_trip()
+    test_limited_distances_search_a_window()
+    test_chase_follows_walking_distance()
+    print("\n=== All tests passed! ===")
@@ -0,0 +1,94 @@
+"""
+Test the table-driven observation encoder.
+"""
+import sys
+import os
+import random
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from backend.agents.rl.encoder import ObservationEncoder
+
+CELLS = ".#@PEHA*S?"
+
+
+def _reference(observation):
+    """Per-cell encoding the lookup table replaces."""
+    vision = observation.get("vision", [])
+    features = []
+    if len(vision) != 5:
+        features = [0.0] * 100
+    else:
+        for row in vision:
+            for cell in row:
+                features += [float(cell == '#'), float(cell in ('@', 'E')),
+                             float(cell in ('H', 'A')), float(cell == '*')]
+    pos = observation["position"]
+    features += [observation["hp"] / 5.0, observation["ammo"] / 3.0, pos["x"] / 50, pos["y"] / 50]
+    entities = observation.get("entities", [])
+    for i in range(10):
+        e = entities[i] if i < len(entities) else {}
+        features += [e.get("relative_x", 0) / 10.0, e.get("relative_y", 0) / 10.0, e.get("distance", 0) / 10.0]
+    sounds = [s["direction"] for s in observation.get("sounds", [])]
+    features += [float(d in sounds) for d in ("north", "northeast", "east", "southeast",
+                                               "south", "southwest", "west", "northwest")]
+    return np.array(features, dtype=np.float32)
+
+
+def _random_observation(rng):
+    """Observation with random cells, sometimes no vision, entities or sounds."""
+    obs = {
+        "hp": rng.randint(0, 5), "ammo": rng.randint(0, 3),
+        "position": {"x": rng.randrange(50), "y": rng.randrange(50)},
+        "vision": [[rng.choice(CELLS) for _ in range(5)] for _ in range(5)],
+        "map_size": {"width": 50, "height": 50}
+    }
+    if rng.random() < 0.2:
+        obs["vision"] = []
+    if rng.random() < 0.3:
+        obs["entities"] = [{"relative_x": rng.randint(-2, 2), "relative_y": rng.randint(-2, 2),
+                            "distance": rng.randint(0, 4)} for _ in range(rng.randint(1, 12))]
+    if rng.random() < 0.3:
+        obs["sounds"] = [{"direction": rng.choice(["north", "west", "southeast"])}]
+    return obs
+
+
+def test_encode_matches_reference():
+    """encode() and encode_batch() match the per-cell encoding."""
+    print("=== Encoder Test ===\n")
+    encoder = ObservationEncoder()
+    assert encoder.get_feature_dim() == 142
+    rng = random.Random(23)
+    observations = [_random_observation(rng) for _ in range(300)]
+    expected = np.stack([_reference(obs) for obs in observations])
+
+    for obs, want in zip(observations, expected):
+        assert np.array_equal(encoder.encode(obs), want)
+    print("  ✓ encode() matches per-cell encoding")
+
+    buffer = np.full((300, 142), np.nan, dtype=np.float32)
+    assert encoder.encode_batch(observations, buffer) is buffer
+    assert np.array_equal(buffer, expected)
+    first = encoder.encode_batch(observations[:10])
+    assert np.array_equal(first, expected[:10])
+    assert np.shares_memory(first, encoder.encode_batch(observations[10:15]))
+    assert encoder.encode_batch([]).shape == (0, 142)
+    print("  ✓ encode_batch() fills caller and reused buffers")
+
+
+def test_encode_writes_into_buffer():
+    """encode(out=...) overwrites every feature of the given buffer."""
+    encoder = ObservationEncoder()
+    rng = random.Random(7)
+    out = np.full(142, 9.0, dtype=np.float32)
+    obs = _random_observation(rng)
+    assert encoder.encode(obs, out) is out and np.array_equal(out, _reference(obs))
+    print("  ✓ encode() writes into a preallocated buffer")
+
+
+if __name__ == "__main__":
+    test_encode_matches_reference()
+    test_encode_writes_into_buffer()
+    print("\n=== All tests passed! ===")
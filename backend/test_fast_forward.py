@@ -0,0 +1,67 @@
+"""
+Test GameEngine.run() against a plain tick() loop.
+"""
+import sys
+import os
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from backend.agents.registry import create_agent
+from backend.engine.engine import GameEngine
+from backend.engine.rng import derive_rng
+from backend.engine.state_factory import create_new_state
+
+
+def make_engine(seed):
+    """Seeded game with RL agents on every entity (player included)."""
+    world = create_new_state(game_id="ff", seed=seed)
+    agents = {
+        eid: create_agent("rl", eid, entity.persona or "aggressive", derive_rng(seed, "agent", eid))
+        for eid, entity in world.entities.items()
+    }
+    return world, GameEngine(world, agents)
+
+
+def test_run_matches_tick_loop():
+    """run() ends in the same state with the same event counts."""
+    print("=== Fast-Forward Test ===\n")
+    for seed in range(4):
+        world, engine = make_engine(seed)
+        counts, last = Counter(), None
+        for _ in range(150):
+            if world.game_over:
+                break
+            last = engine.tick()
+            counts.update(e.code.name.lower() for e in last["events"])
+
+        fast_world, fast_engine = make_engine(seed)
+        summary = fast_engine.run(150)
+
+        assert fast_world.to_dict() == world.to_dict()
+        assert summary["events"] == dict(counts)
+        assert summary["tick"] == world.tick and summary["game_over"] == world.game_over
+        assert summary["observations"] == last["observations"]
+        assert fast_engine.events == [] and fast_engine.log_events
+    print("  ✓ Same final state, counters and observations as tick()")
+
+
+def test_run_until_and_observe_none():
+    """until() stops early; observe='none' builds nothing."""
+    world, engine = make_engine(9)
+    summary = engine.run(1000, until=lambda w: w.tick >= 7, observe="none")
+    assert summary["ticks_run"] == 7 and world.tick == 7
+    assert summary["observations"] == {}
+
+    try:
+        engine.run(5, observe="every")
+        assert False, "expected ValueError"
+    except ValueError:
+        pass
+    print("  ✓ until predicate and observe modes")
+
+
+if __name__ == "__main__":
+    test_run_matches_tick_loop()
+    test_run_until_and_observe_none()
+    print("\n=== All tests passed! ===")
@@ -0,0 +1,97 @@
+"""
+Test chunked map storage and games on large maps.
+"""
+import sys
+import os
+import time
+import random
+import tracemalloc
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from backend.agents.registry import create_agent
+from backend.agents.rl.action_mask import ActionMask
+from backend.engine.actions import MOVE_DOWN, MOVE_RIGHT
+from backend.engine.engine import GameEngine
+from backend.engine.state_factory import create_new_state
+from backend.maps.chunks import ChunkedGrid
+from backend.maps.compiled import CompiledMap
+from backend.maps.rays import compute_ray_distances
+from backend.sim.player import ScriptedPlayer
+
+
+def test_chunked_grid_matches_dense():
+    """Windows, lookups and reassembly agree with the dense array."""
+    print("=== Chunked Map Test ===\n")
+    rng = np.random.default_rng(4)
+    dense = rng.integers(0, 250, size=(70, 45, 3), dtype=np.uint16)
+    grid = ChunkedGrid(dense, 7)
+    assert np.array_equal(grid.to_array(), dense)
+
+    pad = 8
+    padded = np.full((70 + 2 * pad, 45 + 2 * pad, 3), 7, dtype=np.uint16)
+    padded[pad:-pad, pad:-pad] = dense
+    for _ in range(300):
+        cx, cy, radius = int(rng.integers(-3, 48)), int(rng.integers(-3, 73)), int(rng.integers(0, 5))
+        top, left = cy + pad - radius, cx + pad - radius
+        expected = padded[top:top + 2 * radius + 1, left:left + 2 * radius + 1]
+        assert np.array_equal(grid.window(cx, cy, radius), expected)
+    print("  ✓ Windows match dense slices (inside, at edges, wider than the halo)")
+
+
+def test_map_lookups_on_odd_size():
+    """A non-50x50 map compiles and its lookups match the dense tables."""
+    rng = random.Random(5)
+    rows = ["".join(rng.choice("#...") for _ in range(77)) for _ in range(41)]
+    rows[3] = "S" + rows[3][1:]
+    rows[40] = rows[40][:-1] + "E"
+    game_map = CompiledMap.from_grid(rows)
+    walls = game_map.walls
+    rays = compute_ray_distances(walls)
+    assert (game_map.width, game_map.height) == (77, 41) and game_map.to_grid() == [list(r) for r in rows]
+    for _ in range(2000):
+        x, y = rng.randrange(77), rng.randrange(41)
+        assert game_map.is_walkable(x, y) == (not walls[y, x]) and game_map.cell(x, y) == rows[y][x]
+        assert [game_map.ray_length(x, y, d) for d in range(4)] == list(rays[y, x])
+    print("  ✓ 77x41 map lookups match dense tables")
+
+    mask = ActionMask()
+    vision = [["."] * 5 for _ in range(5)]
+    edge = {"hp": 5, "ammo": 0, "position": {"x": 76, "y": 40}, "vision": vision,
+            "map_size": {"width": 77, "height": 41}}
+    assert MOVE_RIGHT not in mask.get_valid_actions(edge) and MOVE_DOWN not in mask.get_valid_actions(edge)
+    edge["position"] = {"x": 60, "y": 30}
+    assert MOVE_RIGHT in mask.get_valid_actions(edge) and MOVE_DOWN in mask.get_valid_actions(edge)
+    print("  ✓ ActionMask uses the observed map size")
+
+
+def test_large_map_game_is_bounded():
+    """A 1000x1000 game keeps per-game memory and tick cost small."""
+    world = create_new_state("gen:1:1000x1000", game_id="big", seed=1)
+    agents = {
+        eid: create_agent("rl", eid, entity.persona)
+        for eid, entity in world.entities.items()
+        if entity.entity_type == "agent"
+    }
+    agents["player"] = ScriptedPlayer("player", world.game_map)
+
+    tracemalloc.start()
+    engine = GameEngine(world, agents, log_events=False)
+    start = time.perf_counter()
+    result = engine.run(300, observe="final")
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert result["observations"]["player"]["map_size"] == {"width": 1000, "height": 1000}
+    assert peak < 2_000_000, peak
+    print(f"  ✓ {result['ticks_run']} ticks on 1000x1000 in {elapsed:.2f}s, peak {peak / 1e3:.0f} KB")
+
+
+if __name__ == "__main__":
+    test_chunked_grid_matches_dense()
+    test_map_lookups_on_odd_size()
+    test_large_map_game_is_bounded()
+    print("\n=== All tests passed! ===")
@@ -0,0 +1,52 @@
+"""
+Test the map registry and walkable-cell spawn sampling.
+"""
+import sys
+import os
+from collections import Counter
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from backend.maps.compiled import CompiledMap
+from backend.maps.registry import get_map, register_map, list_maps
+
+
+def test_registry_shares_maps():
+    """Maps load once and are shared; named ad-hoc maps can be registered."""
+    print("=== Map Registry Test ===\n")
+    assert get_map("map1.txt") is get_map("map1.txt")
+    assert "map1.txt" in list_maps()
+
+    custom = CompiledMap.from_grid(["#####", "#S.E#", "#####"], name="tiny")
+    register_map(custom)
+    assert get_map("tiny") is custom
+    print("  ✓ Shared compiled maps")
+
+
+def test_sample_walkable():
+    """Samples are walkable, avoid exclusions and cover cells uniformly."""
+    game_map = CompiledMap.from_grid(["#####", "#S..#", "#.#.#", "#..E#", "#####"])
+    assert len(game_map.walkable) == 8
+    rng = np.random.default_rng(0)
+
+    exclude = [(1, 1), (3, 3), (0, 0)]
+    counts = Counter(game_map.sample_walkable(rng, exclude) for _ in range(6000))
+    assert set(counts) == {(2, 1), (3, 1), (1, 2), (3, 2), (1, 3), (2, 3)}
+    assert min(counts.values()) > 850 and max(counts.values()) < 1150
+    print("  ✓ Uniform over non-excluded walkable cells")
+
+    everything = [(i % 5, i // 5) for i in range(25)]
+    try:
+        game_map.sample_walkable(rng, everything)
+        assert False, "expected RuntimeError"
+    except RuntimeError:
+        pass
+    print("  ✓ Error when nothing is left")
+
+
+if __name__ == "__main__":
+    test_registry_shares_maps()
+    test_sample_walkable()
+    print("\n=== All tests passed! ===")
@@ -0,0 +1,65 @@
+"""
+Test the per-map move mask and the action masks built from it.
+"""
+import sys
+import os
+import random
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from backend.agents.rl.action_mask import ActionMask
+from backend.engine.actions import ALL_ACTIONS, DIRECTION_VECTORS, MOVE_ACTIONS, WAIT
+from backend.engine.engine import GameEngine
+from backend.engine.position import get_next_position
+from backend.engine.state_factory import create_new_state
+from backend.maps.generator import generate_maze
+
+
+def test_move_mask_matches_walkability():
+    """Bit d is set exactly when the neighbour in direction d is walkable."""
+    print("=== Move Mask Test ===\n")
+    for game_map in (create_new_state(seed=2).game_map, generate_maze(5, 71, 38)):
+        for y in range(-1, game_map.height + 1):
+            for x in range(-1, game_map.width + 1):
+                expected = 0
+                if game_map.in_bounds(x, y):
+                    for d, move in enumerate(MOVE_ACTIONS):
+                        dx, dy = DIRECTION_VECTORS[move]
+                        expected |= game_map.is_walkable(x + dx, y + dy) << d
+                assert game_map.move_mask(x, y) == expected, (x, y)
+                for d, move in enumerate(MOVE_ACTIONS):
+                    moved = get_next_position(game_map, (x, y), DIRECTION_VECTORS[move]) != (x, y)
+                    assert game_map.can_move(x, y, d) == (moved and game_map.in_bounds(x, y))
+    print("  ✓ Move masks match neighbour walkability (including map edges)")
+
+
+def test_action_masks_from_move_mask():
+    """Masks from the observation's move mask equal masks parsed from vision."""
+    mask = ActionMask()
+    world = create_new_state("gen:9:45x33", seed=4)
+    engine = GameEngine(world, log_events=False)
+    rng = random.Random(4)
+    observations = []
+    for _ in range(150):
+        for entity in world.entities.values():
+            entity.action_queue.append(rng.choice(ALL_ACTIONS))
+        observations.extend(engine.tick()["observations"].values())
+    observations.append(dict(observations[0], hp=0))
+
+    for obs in observations:
+        legacy = {k: v for k, v in obs.items() if k != "move_mask"}
+        assert mask.move_bits(obs) == mask.move_bits(legacy)
+        assert sorted(mask.get_valid_actions(obs)) == sorted(mask.get_valid_actions(legacy))
+    batch = mask.get_action_masks_batch(observations)
+    assert batch.shape == (len(observations), 9)
+    assert np.array_equal(batch, [mask.get_action_mask_binary(obs) for obs in observations])
+    assert batch[-1].tolist() == [action == WAIT for action in ALL_ACTIONS]
+    print(f"  ✓ {len(observations)} observations: move-mask and vision-based masks agree")
+
+
+if __name__ == "__main__":
+    test_move_mask_matches_walkability()
+    test_action_masks_from_move_mask()
+    print("\n=== All tests passed! ===")
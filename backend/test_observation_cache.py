@@ -0,0 +1,69 @@
+"""
+Test the engine's per-tick observation cache and selected observations.
+"""
+import sys
+import os
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from backend.agents.base import Agent
+from backend.engine.actions import ALL_ACTIONS
+from backend.engine.engine import GameEngine
+from backend.engine.observation import generate_observation
+from backend.engine.state_factory import create_new_state
+
+
+class CheckingAgent(Agent):
+    """Random agent that checks each observation against a fresh one."""
+
+    def __init__(self, entity_id, world, rng):
+        super().__init__(entity_id)
+        self.world, self.rng = world, rng
+        self.seen = []
+
+    def decide_action(self, observation):
+        assert observation == generate_observation(self.world, self.entity_id)
+        self.seen.append(observation)
+        return self.rng.choice(ALL_ACTIONS)
+
+
+def test_cached_observations_are_fresh():
+    """Phase 0 observations reuse Phase 6 ones but always match the world."""
+    print("=== Observation Cache Test ===\n")
+    world = create_new_state(seed=5)
+    rng = random.Random(5)
+    agents = {eid: CheckingAgent(eid, world, rng) for eid in world.entities if eid != "player"}
+    engine = GameEngine(world, agents)
+
+    reused, previous = 0, {}
+    for t in range(200):
+        result = engine.tick()
+        # Phase 0 of this tick may hand agents last tick's Phase 6 object
+        reused += sum(agent.seen[-1] is previous.get(eid) for eid, agent in agents.items() if agent.seen)
+        previous = result["observations"]
+        if t == 100:
+            # External edit between ticks must not serve stale observations
+            world.entities["player"].x, world.entities["player"].y = world.exit_x, world.exit_y - 1
+    assert reused > 0
+    print(f"  ✓ {sum(len(a.seen) for a in agents.values())} agent observations matched")
+
+
+def test_selected_observations():
+    """Only requested entities get observations."""
+    world = create_new_state(seed=6)
+    engine = GameEngine(world)
+
+    result = engine.tick(observe=("player", "missing"))
+    assert list(result["observations"]) == ["player"]
+    assert engine.observe("player") is result["observations"]["player"]
+
+    result = engine.tick()
+    assert set(result["observations"]) == set(world.entities)
+    print("  ✓ Selected observations only")
+
+
+if __name__ == "__main__":
+    test_cached_observations_are_fresh()
+    test_selected_observations()
+    print("\n=== All tests passed! ===")
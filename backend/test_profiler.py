@@ -0,0 +1,55 @@
+"""
+Test the per-phase tick profiler.
+"""
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from backend.engine.engine import GameEngine
+from backend.engine.profiler import (
+    PHASES, TickProfiler, get_aggregate_profile, reset_aggregate_profile
+)
+from backend.engine.state_factory import create_new_state
+
+
+def test_engine_profile():
+    """Profiled ticks report every phase and feed the aggregate."""
+    print("=== Tick Profiler Test ===\n")
+    reset_aggregate_profile()
+    engine = GameEngine(create_new_state(seed=31), profile=True)
+    for _ in range(25):
+        result = engine.tick()
+    assert tuple(result["profile"]) == PHASES
+    assert all(seconds >= 0 for seconds in result["profile"].values())
+
+    summary = engine.profiler.summary()
+    assert summary["ticks"] == 25
+    for stats in summary["phases"].values():
+        assert stats["calls"] == 25 and sum(stats["histogram"]) == 25
+    assert get_aggregate_profile()["ticks"] == 25
+    print("  ✓ Per-phase timings and histogram recorded")
+
+    assert "profile" not in GameEngine(create_new_state(seed=32), profile=False).tick()
+    print("  ✓ No profile when disabled")
+
+
+def test_merge_profiles():
+    """Summaries from several profilers add up."""
+    total = TickProfiler()
+    one = TickProfiler()
+    one.record_tick({"decide": 0.002, "observe": 0.00001})
+    total.merge(one.summary())
+    total.merge(one.summary())
+    summary = total.summary()
+    assert summary["ticks"] == 2
+    assert summary["phases"]["decide"]["calls"] == 2
+    assert abs(summary["phases"]["decide"]["seconds"] - 0.004) < 1e-12
+    assert summary["phases"]["pop"]["calls"] == 0
+    print("  ✓ Merged summaries")
+
+
+if __name__ == "__main__":
+    test_engine_profile()
+    test_merge_profiles()
+    print("\n=== All tests passed! ===")
@@ -0,0 +1,95 @@
+"""
+Test compiled persona score tables against the per-action heuristics.
+"""
+import sys
+import os
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from backend.agents.personas import load_persona_config
+from backend.agents.rl.policy import Policy
+from backend.agents.rl.score_table import (
+    AMMO_LEVELS, HP_LEVELS, MASK_COUNT, NO_CHASE, VALID_INDICES, ScoreTable, get_score_table
+)
+from backend.engine.actions import ALL_ACTIONS, WAIT
+
+PERSONAS = ("aggressive", "cautious", "explorer", "unknown")
+
+
+def _features(hp_level, ammo_level):
+    """Encoded features for an hp / ammo level (the encoder's normalization)."""
+    features = np.zeros(142, dtype=np.float32)
+    features[100], features[101] = hp_level / 5.0, ammo_level / 3.0
+    return features
+
+
+def test_tables_match_heuristics():
+    """Every table CDF equals the softmax CDF Generator.choice would build."""
+    print("=== Score Table Test ===\n")
+    policy = Policy()
+    for persona in PERSONAS:
+        config = load_persona_config(persona)
+        for temperature in (0.1, 1.0):
+            table = ScoreTable(config, temperature)
+            for hp in range(HP_LEVELS):
+                for ammo in range(AMMO_LEVELS):
+                    features = _features(hp, ammo)
+                    assert table.levels(features) == (hp, ammo)
+                    for mask in range(1, MASK_COUNT):
+                        valid = list(VALID_INDICES[mask])
+                        scores = policy._compute_action_scores(features, valid, config)
+                        cdf = policy._softmax(scores, temperature).cumsum()
+                        assert table.cdf(hp, ammo, mask) == (cdf / cdf[-1]).tolist()
+                    # Chasing: one direction per mask is enough to cover every state
+                    for mask in range(1, MASK_COUNT, 7):
+                        chase = mask % NO_CHASE
+                        valid = list(VALID_INDICES[mask])
+                        scores = policy._compute_action_scores(features, valid, config, chase)
+                        cdf = policy._softmax(scores, temperature).cumsum()
+                        assert table.cdf(hp, ammo, mask, chase) == (cdf / cdf[-1]).tolist()
+    print("  ✓ Table CDFs equal the heuristic softmax for every persona, level, mask and chase")
+
+
+def _reference_select(policy, features, valid_actions, config):
+    """The heuristic select_action: score, softmax, Generator.choice."""
+    valid = [i for i, action in enumerate(ALL_ACTIONS) if action in valid_actions]
+    if not valid:
+        return WAIT
+    if policy.rng.random() < policy.epsilon:
+        return ALL_ACTIONS[valid[policy.rng.integers(len(valid))]]
+    probs = policy._softmax(policy._compute_action_scores(features, valid, config), policy.temperature)
+    return ALL_ACTIONS[policy.rng.choice(valid, p=probs)]
+
+
+def test_selection_matches_heuristic_sampling():
+    """Table lookups pick what sampling the heuristic softmax picks, draw for draw."""
+    rng = np.random.default_rng(25)
+    table_policy, reference = Policy(rng=np.random.default_rng(7)), Policy(rng=np.random.default_rng(7))
+    for policy in (table_policy, reference):
+        policy.update_epsilon(0.1)
+        policy.update_temperature(0.7)
+    for _ in range(3000):
+        config = load_persona_config(PERSONAS[rng.integers(len(PERSONAS))])
+        # Mostly table levels, sometimes features off the levels (direct scoring)
+        features = _features(rng.integers(HP_LEVELS), rng.integers(AMMO_LEVELS))
+        if rng.random() < 0.1:
+            features[100:102] = rng.random(2)
+        valid = [action for action in ALL_ACTIONS if rng.random() < 0.6]
+        assert table_policy.select_action(features, valid, config) == \
+            _reference_select(reference, features, valid, config)
+    assert table_policy.rng.random() == reference.rng.random()
+    print("  ✓ 3000 decisions: table sampling matches heuristic sampling")
+
+    config = load_persona_config("cautious")
+    assert get_score_table(config, 0.7) is get_score_table(config, 0.7)
+    assert get_score_table(config, 0.7) is not get_score_table(config, 1.0)
+    assert ScoreTable(config, 1.0).levels(_features(2, 1)[:50]) is None
+    print("  ✓ Tables are shared per config and temperature")
+
+
+if __name__ == "__main__":
+    test_tables_match_heuristics()
+    test_selection_matches_heuristic_sampling()
+    print("\n=== All tests passed! ===")
@@ -0,0 +1,43 @@
+"""
+Test grid-stamped sound against the per-shot range check.
+"""
+import sys
+import os
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from backend.engine.observation import generate_sound_for_entity
+from backend.engine.sound import HearingGrid
+
+
+def test_hearing_grid_matches_range_check():
+    """Every listener hears exactly what generate_sound_for_entity reports."""
+    print("=== Hearing Grid Test ===\n")
+    rng = random.Random(9)
+    grid = HearingGrid(50, 50)
+    for _ in range(200):
+        shots = [(rng.randrange(50), rng.randrange(50)) for _ in range(rng.randrange(6))]
+        grid.clear()
+        for shot in shots:
+            grid.stamp(shot)
+        for _ in range(50):
+            listener = (rng.randrange(50), rng.randrange(50))
+            assert grid.sound_at(listener) == generate_sound_for_entity(listener, shots)
+    print("  ✓ Grid lookups match range checks")
+
+    grid.clear()
+    assert not grid._chunks
+    assert grid.sound_at((-1, 0)) is None
+    print("  ✓ clear() resets stamped cells")
+
+    big = HearingGrid(1000, 1000)
+    big.stamp((31, 500))
+    assert big.heard((28, 497)) and big.heard((34, 503)) and not big.heard((35, 500))
+    assert len(big._chunks) == 2
+    print("  ✓ Shots on a 1000x1000 map allocate only nearby chunks")
+
+
+if __name__ == "__main__":
+    test_hearing_grid_matches_range_check()
+    print("\n=== All tests passed! ===")
@@ -9,6 +9,7 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from backend.maps.loader import load_map, get_start_and_exit
+from backend.maps.registry import get_map
 from backend.engine.actions import (
     MOVE_UP, MOVE_DOWN, MOVE_LEFT, MOVE_RIGHT,
     SHOOT_UP, SHOOT_LEFT, get_direction_vector, is_valid_action
@@ -38,6 +39,10 @@ def main():
     start_pos, exit_pos = get_start_and_exit(grid)
     print(f"   Start position: {start_pos}")
     print(f"   Exit position: {exit_pos}")
+
+    game_map = get_map("map1.txt")
+    print(f"   Compiled map: {game_map.width}x{game_map.height}, shared: {game_map is get_map('map1.txt')}")
+    print(f"   Compiled start/exit match: {(game_map.start, game_map.exit) == (start_pos, exit_pos)}")
     print()
 
     # Test 2: Actions
@@ -52,16 +57,16 @@ def main():
     test_pos = (5, 5)
     print(f"   Test position: {test_pos}")
     print(f"   Is in bounds: {is_in_bounds(test_pos)}")
-    print(f"   Is walkable: {is_walkable(grid, test_pos)}")
+    print(f"   Is walkable: {is_walkable(game_map, test_pos)}")
 
     # Try moving up from (5, 5)
     move_vector = get_direction_vector(MOVE_UP)
-    next_pos = get_next_position(grid, test_pos, move_vector)
+    next_pos = get_next_position(game_map, test_pos, move_vector)
     print(f"   After MOVE_UP: {next_pos}")
 
     # Test wall collision
     wall_test = (0, 0)  # This is '#'
-    print(f"   Position {wall_test} is walkable: {is_walkable(grid, wall_test)}")
+    print(f"   Position {wall_test} is walkable: {is_walkable(game_map, wall_test)}")
     print()
 
     # Test 4: Distance calculations
@@ -75,7 +80,7 @@ def main():
     # Test 5: Local vision
     print("5. Testing local vision extraction...")
     center = (10, 10)
-    vision = extract_local_vision(grid, center, 5)
+    vision = extract_local_vision(game_map, center, 5)
     print(f"   5x5 vision centered at {center}:")
     print_vision(vision)
 
@@ -86,7 +91,7 @@ def main():
         "agent1": (12, 10),
         "agent2": (10, 8)
     }
-    rendered_vision = get_vision_for_entity(grid, (10, 10), entities, "player", 5)
+    rendered_vision = get_vision_for_entity(game_map, (10, 10), entities, "player", 5)
     print("   Vision for player (@ = self, P = others):")
     print_vision(rendered_vision)
 
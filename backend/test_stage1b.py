@@ -18,7 +18,7 @@ from backend.engine.bullet import (
 )
 from backend.engine.constants import INITIAL_HP, INITIAL_AMMO, MAX_AMMO
 from backend.engine.actions import get_direction_vector, SHOOT_RIGHT, SHOOT_DOWN
-from backend.maps.loader import load_map
+from backend.maps.registry import get_map
 
 
 def main():
@@ -62,13 +62,13 @@ def main():
 
     # Test 3: Bullet trajectory
     print("3. Testing bullet trajectory...")
-    grid = load_map("map1.txt")
+    game_map = get_map("map1.txt")
 
     # Shoot from a clear position
     shooter_pos = (10, 10)
     direction = get_direction_vector(SHOOT_RIGHT)
 
-    path = trace_bullet_path(shooter_pos, direction, grid)
+    path = trace_bullet_path(shooter_pos, direction, game_map)
     print(f"   Bullet path from {shooter_pos} going RIGHT:")
     print(f"   Path length: {len(path)}")
     if len(path) > 0:
@@ -81,7 +81,7 @@ def main():
     target_pos = (13, 10)  # 3 cells to the right
     direction = get_direction_vector(SHOOT_RIGHT)
 
-    hit_pos = simulate_shot(shooter_pos, direction, grid, [target_pos])
+    hit_pos = simulate_shot(shooter_pos, direction, game_map, [target_pos])
     if hit_pos:
         print(f"   Shot from {shooter_pos} hit target at {hit_pos}")
     else:
@@ -89,7 +89,7 @@ def main():
 
     # Test miss
     target_pos_2 = (10, 5)  # Different location
-    hit_pos_2 = simulate_shot(shooter_pos, direction, grid, [target_pos_2])
+    hit_pos_2 = simulate_shot(shooter_pos, direction, game_map, [target_pos_2])
     print(f"   Shot at {target_pos_2}: {'HIT' if hit_pos_2 else 'MISS'}")
     print()
 
@@ -10,7 +10,7 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from backend.engine.state import EntityState, BulletState, WorldState, create_entity
 from backend.engine.state_factory import create_new_state, find_random_walkable_position
-from backend.maps.loader import load_map
+from backend.maps.registry import get_map
 
 
 def main():
@@ -50,9 +50,9 @@ def main():
 
     # Test 4: Random position finding
     print("4. Testing random walkable position...")
-    grid = load_map("map1.txt")
+    game_map = get_map("map1.txt")
     exclude = [(0, 0), (1, 1)]
-    pos = find_random_walkable_position(grid, exclude)
+    pos = find_random_walkable_position(game_map, exclude)
     print(f"   Found position: {pos}")
     print(f"   Not in exclude list: {pos not in exclude}")
     print()
@@ -62,7 +62,7 @@ def main():
     world = create_new_state()
     print(f"   Game ID: {world.game_id}")
     print(f"   Tick: {world.tick}")
-    print(f"   Map size: {len(world.map_grid)}x{len(world.map_grid[0])}")
+    print(f"   Map size: {world.game_map.height}x{world.game_map.width}")
     print(f"   Start: ({world.start_x}, {world.start_y})")
     print(f"   Exit: ({world.exit_x}, {world.exit_y})")
     print(f"   Entities: {list(world.entities.keys())}")
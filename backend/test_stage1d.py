@@ -43,7 +43,7 @@ def main():
     # Test 3: Queue actions and execute
     print("3. Queueing actions for player...")
     player = world.entities["player"]
-    player.action_queue = [MOVE_RIGHT, MOVE_DOWN, MOVE_RIGHT]
+    player.action_queue.extend([MOVE_RIGHT, MOVE_DOWN, MOVE_RIGHT])
     print(f"   Player queue: {player.action_queue}")
 
     result = engine.tick()
@@ -68,13 +68,13 @@ def main():
     print("5. Testing shooting mechanics...")
     player = world.entities["player"]
     initial_ammo = player.ammo
-    player.action_queue = [SHOOT_RIGHT]
+    player.action_queue.extend([SHOOT_RIGHT])
 
     result = engine.tick()
     print(f"   Ammo before: {initial_ammo}, after: {player.ammo}")
     print(f"   Shoot events:")
     for event in result['events']:
-        if "shot" in event.lower():
+        if "shot" in str(event).lower():
             print(f"     - {event}")
     print()
 
@@ -90,7 +90,7 @@ def main():
     result = engine.tick()
 
     print(f"   After 2 ticks: Ammo={player.ammo}, Tick={world.tick}")
-    recovery_events = [e for e in result['events'] if 'recovered' in e.lower()]
+    recovery_events = [e for e in result['events'] if 'recovered' in str(e).lower()]
     if recovery_events:
         print(f"   Recovery event: {recovery_events[0]}")
     print()
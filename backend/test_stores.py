@@ -18,6 +18,7 @@ from backend.storage.log_store import (
     append_log, append_logs_batch, read_logs, count_logs, delete_logs, LogStoreError
 )
 from backend.engine.state_factory import create_new_state
+from backend.engine.events import TickEvent, EventCode
 
 
 def test_stores():
@@ -80,7 +81,18 @@ def test_stores():
     print("7. Testing append_logs_batch...")
     events = ["Event 1", "Event 2", "Event 3"]
     count = append_logs_batch(db, game_id, 6, events)
-    print(f"   ✓ Created {count} logs\n")
+    print(f"   ✓ Created {count} logs")
+
+    tick_events = [
+        TickEvent(EventCode.MOVED, "player", (10, 11)),
+        TickEvent(EventCode.SHOT_HIT, "player", (12, 11, 4), "agent_cautious_2"),
+    ]
+    count = append_logs_batch(db, game_id, 7, tick_events)
+    rendered = [log["message"] for log in read_logs(db, game_id) if log["tick"] == 7]
+    assert rendered == [event.render() for event in tick_events]
+    stored = [log for log in read_logs(db, game_id, event_type="game_event") if log["tick"] == 7]
+    assert [log["extra_data"]["code"] for log in stored] == ["moved", "shot_hit"]
+    print(f"   ✓ Created {count} structured logs, rendered on read: {rendered[1]}\n")
 
     # Test 8: Read logs
     print("8. Testing read_logs...")
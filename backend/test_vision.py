@@ -0,0 +1,82 @@
+"""
+Test slice-based and batched vision rendering.
+"""
+import sys
+import os
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from backend.engine.entity import EntityState
+from backend.engine.local_map import get_vision_for_entity, render_visions
+from backend.engine.observation import generate_observation, generate_observations
+from backend.engine.occupancy import OccupancyIndex
+from backend.engine.sound import SHOT_SOUND
+from backend.engine.state_factory import create_new_state
+from backend.maps.compiled import cells_to_rows
+from backend.maps.generator import generate_maze
+
+
+def _random_world(rng, game_map, count):
+    """Entities on random cells, some stacked, a few dead."""
+    world = create_new_state(seed=rng.randrange(1000))
+    world.game_map = game_map
+    world.entities = {}
+    for i in range(count):
+        x, y = rng.randrange(game_map.width), rng.randrange(game_map.height)
+        if i and rng.random() < 0.2:
+            # Stand on another entity's cell
+            other = world.entities[f"e{rng.randrange(i)}"]
+            x, y = other.x, other.y
+        world.entities[f"e{i}"] = EntityState(
+            f"e{i}", "agent", "explorer", x, y, 3, 3, -1, rng.random() > 0.1, False
+        )
+    return world
+
+
+def test_batched_visions_match_single():
+    """Each batched view equals get_vision_for_entity, at edges and on shared cells."""
+    print("=== Vision Test ===\n")
+    rng = random.Random(20)
+    for game_map in (create_new_state(seed=1).game_map, generate_maze(3, 37, 23)):
+        for _ in range(30):
+            world = _random_world(rng, game_map, rng.randint(1, 12))
+            occupancy = OccupancyIndex(world.entities)
+            alive = {eid: (e.x, e.y) for eid, e in world.entities.items() if e.alive}
+            ids = list(world.entities)
+            positions = [(world.entities[eid].x, world.entities[eid].y) for eid in ids]
+
+            visions = render_visions(game_map, ids, positions, occupancy)
+            assert visions.shape == (len(ids), 5, 5)
+            for eid, pos, vision in zip(ids, positions, visions):
+                assert cells_to_rows(vision) == get_vision_for_entity(game_map, pos, alive, eid)
+    print("  ✓ Batched visions match per-entity rendering")
+
+    # Corners: the padding reads as walls
+    game_map = generate_maze(3, 37, 23)
+    world = _random_world(rng, game_map, 1)
+    corners = [(0, 0), (36, 0), (0, 22), (36, 22)]
+    visions = render_visions(game_map, ["x"] * 4, corners, OccupancyIndex(world.entities))
+    for (x, y), vision in zip(corners, visions):
+        rows = cells_to_rows(vision)
+        assert rows[2][2] == "@"
+        assert all(rows[2 + dy][2 + dx] == "#" for dy in (-2, -1, 0, 1, 2) for dx in (-2, -1, 0, 1, 2)
+                   if not (0 <= x + dx < 37 and 0 <= y + dy < 23))
+    print("  ✓ Out-of-map cells read as walls")
+
+
+def test_batched_observations_match_single():
+    """generate_observations agrees with one generate_observation per entity."""
+    rng = random.Random(21)
+    world = _random_world(rng, generate_maze(8, 60, 45), 10)
+    sounds = {eid: rng.choice([None, SHOT_SOUND]) for eid in world.entities}
+    batch = generate_observations(world, list(world.entities), sounds)
+    for eid in world.entities:
+        assert batch[eid] == generate_observation(world, eid, sounds[eid])
+    print("  ✓ Batched observations match single observations")
+
+
+if __name__ == "__main__":
+    test_batched_visions_match_single()
+    test_batched_observations_match_single()
+    print("\n=== All tests passed! ===")
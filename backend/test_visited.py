@@ -0,0 +1,95 @@
+"""
+Test the visited-cell bitset and slotted EntityState serialization.
+"""
+import sys
+import os
+import random
+import base64
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from backend.engine.visited import VisitedCells
+from backend.engine.state import EntityState, create_entity
+
+
+def test_visited_cells_match_set():
+    """Bitset behaves like the old set of (x, y) tuples."""
+    print("=== Visited Bitset Test ===\n")
+    rng = random.Random(3)
+    visited, reference = VisitedCells(), set()
+    for _ in range(500):
+        pos = (rng.randrange(50), rng.randrange(50))
+        visited.add(pos)
+        reference.add(pos)
+    visited.add((-1, 7))
+    visited.add((50, 0))
+
+    assert len(visited) == len(reference)
+    assert set(visited) == reference
+    assert (-1, 7) not in visited
+    assert all(pos in visited for pos in reference)
+    print(f"  ✓ {len(visited)} cells tracked in {len(visited.chunks)} chunks")
+
+    copy = visited.copy()
+    for bits in copy.chunks.values():
+        bits[:] = bytes(len(bits))
+    assert len(visited) == len(reference) and set(visited) == reference
+    print("  ✓ copy() is independent")
+
+    bulk = VisitedCells(70, 40)
+    one_by_one = VisitedCells(70, 40)
+    for _ in range(20):
+        xs = np.array([rng.randrange(-2, 72) for _ in range(40)])
+        ys = np.array([rng.randrange(-2, 42) for _ in range(40)])
+        bulk.update(xs, ys)
+        for pos in zip(xs.tolist(), ys.tolist()):
+            one_by_one.add(pos)
+        assert len(bulk) == len(one_by_one) and bulk.chunks == one_by_one.chunks
+    print("  ✓ update() marks cells like add() (duplicates and outside cells included)")
+
+
+def test_large_map_stays_sparse():
+    """Only touched chunks are allocated, and both dict formats load."""
+    visited = VisitedCells(1000, 1000)
+    path = [(500 + i, 700) for i in range(40)] + [(999, 999), (0, 0)]
+    for pos in path:
+        visited.add(pos)
+    assert len(visited.chunks) == 4 and set(visited) == set(path)
+    restored = VisitedCells.from_data(visited.to_dict())
+    assert set(restored) == set(path) and len(restored) == len(path)
+
+    bits = bytearray(50 * 50 // 8 + 1)
+    for x, y in [(3, 4), (49, 49)]:
+        i = y * 50 + x
+        bits[i >> 3] |= 1 << (i & 7)
+    legacy = {"width": 50, "height": 50, "bits": base64.b64encode(bytes(bits)).decode("ascii")}
+    assert set(VisitedCells.from_data(legacy)) == {(3, 4), (49, 49)}
+    print("  ✓ Sparse chunks on a 1000x1000 map; whole-map bitsets still load")
+
+
+def test_entity_round_trip():
+    """EntityState round-trips, and legacy visited lists still load."""
+    entity = create_entity("agent_explorer_3", "agent", 4, 5, "explorer")
+    entity.visited_positions.add((4, 5))
+    entity.visited_positions.add((4, 6))
+    assert not hasattr(entity, "__dict__")
+
+    restored = EntityState.from_dict(entity.to_dict())
+    assert set(restored.visited_positions) == {(4, 5), (4, 6)}
+    assert (restored.x, restored.y, restored.persona) == (4, 5, "explorer")
+    print("  ✓ EntityState round-trip")
+
+    legacy = entity.to_dict()
+    legacy["visited_positions"] = [[1, 2], [3, 4]]
+    restored = EntityState.from_dict(legacy)
+    assert set(restored.visited_positions) == {(1, 2), (3, 4)}
+    print("  ✓ Legacy visited list loads")
+
+
+if __name__ == "__main__":
+    test_visited_cells_match_set()
+    test_large_map_stays_sparse()
+    test_entity_round_trip()
+    print("\n=== All tests passed! ===")